@@ -0,0 +1,58 @@
+"""Benchmark for finding the feature files in a large tree.
+
+Creates a tree with 1M entries (or the number given as argument) in a temporary directory:
+a tenth are feature files in nested directories, the rest are files in ``node_modules``,
+a virtualenv and a directory ignored by ``.gitignore``. Compares ``Path.rglob``, which was used
+up to gherlint 0.5.0, with ``gherlint.discovery.iter_feature_files``.
+
+Run with ``python benchmarks/bench_discovery.py [number of entries]``.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+
+from gherlint.discovery import iter_feature_files
+
+FILES_PER_DIRECTORY = 100
+
+
+def make_tree(root: Path, number_of_entries: int) -> None:
+    number_of_directories = number_of_entries // (FILES_PER_DIRECTORY + 1)
+    features = number_of_directories // 10
+    skipped = ["node_modules", ".venv", "generated"]
+    for index in range(number_of_directories):
+        if index < features:
+            directory = root / "features" / f"area_{index % 10}" / f"dir_{index}"
+            name, suffix = "test_{}", ".feature"
+        else:
+            directory = root / skipped[index % 3] / f"pkg_{index}"
+            # some of the skipped files are feature files as well
+            name, suffix = "file_{}", ".feature" if index % 2 else ".js"
+        directory.mkdir(parents=True)
+        for number in range(FILES_PER_DIRECTORY):
+            (directory / (name.format(number) + suffix)).touch()
+    (root / ".gitignore").write_text("/generated/\n", encoding="utf8")
+
+
+def measure(name: str, find: Callable[[], Iterable[Path]]) -> None:
+    start = time.perf_counter()
+    number_of_files = sum(1 for _ in find())
+    seconds = time.perf_counter() - start
+    print(f"{name:<20} {seconds:6.2f} s for {number_of_files} feature files")
+
+
+def main() -> None:
+    number_of_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        print(f"Creating {number_of_entries} entries...")
+        make_tree(root, number_of_entries)
+        measure("Path.rglob", lambda: root.rglob("*.feature"))
+        measure("iter_feature_files", lambda: iter_feature_files(root))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Microbenchmark for detecting the language of feature files.
+
+Compares ``gherlint.utils.detect_language`` with the previous approach, which searched the whole
+file for the feature keywords of every dialect one after another.
+
+Run with ``python benchmarks/bench_language_detection.py``.
+"""
+
+import timeit
+from functools import partial
+from typing import Callable, List
+
+from gherkin.dialect import DIALECTS
+
+from gherlint.utils import detect_language
+
+NUMBER_OF_FILES = 2000
+SCENARIOS_PER_FILE = 20
+
+
+def detect_language_by_substring_search(content: str) -> str:
+    """The approach used up to gherlint 0.5.0"""
+    for language, keywords in DIALECTS.items():
+        if any(keyword in content for keyword in keywords["feature"]):
+            return language
+    return "unknown"
+
+
+def make_corpus():
+    scenario = (
+        "    Scenario: Scenario {index}\n"
+        "        Given some precondition\n"
+        "        When I do something\n"
+        "        Then I expect something\n\n"
+    )
+    body = "".join(scenario.format(index=index) for index in range(SCENARIOS_PER_FILE))
+    english = "@tag\nFeature: English feature\n\n" + body
+    german = "# language: de\nFunktionalität: German feature\n\n" + body
+    return [english if index % 2 else german for index in range(NUMBER_OF_FILES)]
+
+
+def detect_all(function: Callable[[str], str], corpus: List[str]) -> List[str]:
+    return [function(content) for content in corpus]
+
+
+def main() -> None:
+    corpus = make_corpus()
+    size_mb = sum(len(content) for content in corpus) / 1e6
+    print(f"Corpus: {len(corpus)} files, {size_mb:.1f} MB")
+    for function in (detect_language_by_substring_search, detect_language):
+        seconds = min(
+            timeit.repeat(partial(detect_all, function, corpus), number=1, repeat=5)
+        )
+        print(f"{function.__name__:<40} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Memory benchmark for the object model.
+
+Builds the nodes for a feature with 10k steps (2k scenarios with 5 steps and 2 tags each)
+and reports the peak memory allocated while doing so, as measured by ``tracemalloc``.
+The dictionary returned by the gherkin parser is created beforehand and not included.
+
+Run with ``python benchmarks/bench_node_memory.py``.
+"""
+
+import tracemalloc
+
+from gherkin.parser import Parser
+
+from gherlint.objectmodel.nodes import Document
+
+NUMBER_OF_SCENARIOS = 2000
+
+
+def make_feature() -> str:
+    scenario = (
+        "    @tag1 @tag2\n"
+        "    Scenario: Scenario {index}\n"
+        "        Given some precondition\n"
+        "        And another precondition\n"
+        "        When I do something\n"
+        "        Then I expect something\n"
+        "        But nothing else\n\n"
+    )
+    return "Feature: Memory benchmark\n\n" + "".join(
+        scenario.format(index=index) for index in range(NUMBER_OF_SCENARIOS)
+    )
+
+
+def main() -> None:
+    data = dict(Parser().parse(make_feature()))
+    data["filename"] = "benchmark.feature"
+    tracemalloc.start()
+    document = Document.from_dict(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert document.feature is not None
+    number_of_steps = sum(
+        1 for scenario in document.feature.scenarios for _ in scenario.steps
+    )
+    print(f"Peak memory for {number_of_steps} steps: {peak / 1e6:.2f} MB")
+    print(f"Peak bytes per 10k steps: {peak * 10_000 // number_of_steps}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark for building the object model while parsing.
+
+Compares building the nodes from the dictionaries of the gherkin ``AstBuilder`` with
+building them directly through ``NodeBuilder``, for a feature with 10k steps
+(2k scenarios with 5 steps and 2 tags each). Reports the time and the peak memory
+allocated, as measured by ``tracemalloc``, for each.
+
+Run with ``python benchmarks/bench_parser.py``.
+"""
+
+import timeit
+import tracemalloc
+from typing import Callable
+
+from gherkin.parser import Parser
+
+from bench_node_memory import make_feature  # isort: skip
+
+from gherlint.objectmodel.nodes import Document
+from gherlint.parser import NodeBuilder
+
+REPEAT = 5
+
+
+def parse_to_dict(content: str) -> Document:
+    data = dict(Parser().parse(content))
+    data["filename"] = "benchmark.feature"
+    return Document.from_dict(data)
+
+
+def parse_to_nodes(content: str) -> Document:
+    builder = NodeBuilder()
+    builder.filename = "benchmark.feature"
+    return Parser(ast_builder=builder).parse(content)  # type: ignore
+
+
+def measure(name: str, parse: Callable[[str], Document], content: str) -> None:
+    seconds = min(timeit.repeat(lambda: parse(content), number=1, repeat=REPEAT))
+    tracemalloc.start()
+    parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<16} {seconds * 1000:8.1f} ms {peak / 1e6:8.2f} MB peak")
+
+
+def main() -> None:
+    content = make_feature()
+    measure("dict + from_dict", parse_to_dict, content)
+    measure("NodeBuilder", parse_to_nodes, content)
+
+
+if __name__ == "__main__":
+    main()
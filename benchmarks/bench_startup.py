@@ -0,0 +1,89 @@
+"""Benchmark for the time it takes until gherlint does something useful.
+
+Runs the commands below in a new interpreter several times and reports the fastest run,
+along with the top level imports which take the most time, as reported by
+``python -X importtime``.
+
+Run with ``python benchmarks/bench_startup.py [number of runs]``.
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+COMMANDS = [
+    ["--help"],
+    ["client", "--socket", "daemon.sock", "test.feature"],
+    ["client", "--socket", "no-daemon.sock", "test.feature"],
+    ["lint", "--no-cache", "test.feature"],
+]
+
+
+def run(args: List[str], directory: Path, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "gherlint", *args],
+            cwd=directory,
+            check=True,
+            capture_output=True,
+        )
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def import_times(args: List[str], directory: Path) -> List[Tuple[int, str]]:
+    """Get the cumulative import time in microseconds of each top level import."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "gherlint", *args],
+        cwd=directory,
+        check=True,
+        capture_output=True,
+        encoding="utf8",
+    )
+    times = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("   "):  # nested imports are indented further
+            times.append((int(cumulative), name.strip()))
+    return sorted(times, reverse=True)
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        directory = Path(tmp_dir)
+        (directory / "test.feature").write_text(
+            "Feature: Test\n  Scenario: Test\n    Given a step\n", encoding="utf8"
+        )
+        with subprocess.Popen(
+            [sys.executable, "-m", "gherlint", "daemon", "--socket", "daemon.sock"],
+            cwd=directory,
+            stderr=subprocess.DEVNULL,
+        ) as daemon:
+            while not (directory / "daemon.sock").exists():
+                time.sleep(0.01)
+            try:
+                measure_commands(directory, runs)
+            finally:
+                daemon.terminate()
+
+
+def measure_commands(directory: Path, runs: int) -> None:
+    for args in COMMANDS:
+        seconds = run(args, directory, runs)
+        top = ", ".join(
+            f"{name} {micros / 1000:.0f} ms"
+            for micros, name in import_times(args, directory)[:3]
+        )
+        print(f"gherlint {' '.join(args):<50} {seconds * 1000:6.0f} ms  ({top})")
+
+
+if __name__ == "__main__":
+    main()
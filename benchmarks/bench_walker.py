@@ -0,0 +1,60 @@
+"""Benchmark for walking the AST of a large feature file.
+
+The feature has 50k steps (5k scenarios with 10 steps and one tag each). It is walked with a
+checker that only counts the steps, so the result reflects the cost of the traversal itself.
+Reports the time for walking it and the peak memory allocated during the walk, as measured by
+``tracemalloc``.
+
+Run with ``python benchmarks/bench_walker.py``.
+"""
+
+import timeit
+import tracemalloc
+
+from gherkin.parser import Parser
+
+from gherlint.checkers.base_checker import BaseChecker
+from gherlint.objectmodel.nodes import Document, Step
+from gherlint.reporting import CollectingReporter
+from gherlint.walker import ASTWalker
+
+NUMBER_OF_SCENARIOS = 5000
+STEPS_PER_SCENARIO = 10
+
+
+class StepCounter(BaseChecker):
+    steps = 0
+
+    def visit_step(self, _: Step) -> None:
+        self.steps += 1
+
+
+def make_feature() -> str:
+    steps = "".join(
+        f"        {'Given' if index == 0 else 'And'} step {index}\n"
+        for index in range(STEPS_PER_SCENARIO)
+    )
+    scenario = "    @tag\n    Scenario: Scenario {index}\n" + steps + "\n"
+    return "Feature: Walker benchmark\n\n" + "".join(
+        scenario.format(index=index) for index in range(NUMBER_OF_SCENARIOS)
+    )
+
+
+def main() -> None:
+    data = dict(Parser().parse(make_feature()))
+    data["filename"] = "benchmark.feature"
+    document = Document.from_dict(data)
+    walker = ASTWalker([StepCounter(reporter=CollectingReporter())])
+    walker.walk(document)  # warm up caches
+    seconds = min(timeit.repeat(lambda: walker.walk(document), number=1, repeat=20))
+    tracemalloc.start()
+    walker.walk(document)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    number_of_steps = NUMBER_OF_SCENARIOS * STEPS_PER_SCENARIO
+    print(f"Walking {number_of_steps} steps: {seconds * 1000:.1f} ms")
+    print(f"Peak memory allocated during the walk: {peak / 1e3:.1f} kB")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,7 @@ def main(app: Sphinx) -> None:
     table.add_directive()
     table.add_header("ID", "Name", "Description")
     registry = CheckerRegistry()
-    registry.discover()
+    registry.discover(plugins=False)
     for message in GherkinLinter.MESSAGES:
         table.add_row(message.id, message.name, message.text)
     for checker in sorted(registry, key=_get_msg_prefix):
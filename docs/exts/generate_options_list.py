@@ -7,7 +7,7 @@ from sphinx.application import Sphinx
 from sphinx.util import logging
 from utils import TableWriter
 
-from gherlint import reporting
+from gherlint import cache, discovery, reporting
 from gherlint.options import Options
 from gherlint.registry import CheckerRegistry
 
@@ -31,11 +31,25 @@ def main(app: Sphinx) -> None:
             options_table = _render_options(options_class)
             file.write(str(options_table))
 
+        logger.info("Processing Cache Options...")
+        file.write("Cache Options\n")
+        file.write("=============\n\n")
+        file.write(f"Config section: **[{cache.CacheOptions.config_section}]**\n\n")
+        file.write(str(_render_options(cache.CacheOptions)))
+
+        logger.info("Processing Discovery Options...")
+        file.write("Discovery Options\n")
+        file.write("=================\n\n")
+        file.write(
+            f"Config section: **[{discovery.DiscoveryOptions.config_section}]**\n\n"
+        )
+        file.write(str(_render_options(discovery.DiscoveryOptions)))
+
         logger.info("Processing Checker Options...")
         file.write("Checker Options\n")
         file.write("===============\n\n")
         registry = CheckerRegistry()
-        registry.discover()
+        registry.discover(plugins=False)
         for checker in registry:
             logger.info("Processing checker %s", checker.__name__)
             options_class = checker.get_options_class()
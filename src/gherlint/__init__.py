@@ -0,0 +1,8 @@
+def get_version() -> str:
+    # importlib.metadata takes long to import compared to how rarely the version is needed
+    from importlib import metadata  # pylint: disable=import-outside-toplevel
+
+    try:
+        return metadata.version("gherlint")
+    except metadata.PackageNotFoundError:
+        return "unknown"
@@ -1,14 +1,27 @@
 """
 ``gherlint`` is a linter for Cucumber Gherkin feature files.
+
+Each command imports what it needs when it is run, so that e.g. ``gherlint --help`` or
+``gherlint client`` don't pay for setting up the linter.
 """
 
+# pylint: disable=import-outside-toplevel
+
+from __future__ import annotations
+
+import os
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, TextIO, Tuple
 
 import click
 
-from gherlint.fixer import LanguageFixer
-from gherlint.linter import GherkinLinter
-from gherlint.statistics import compute_metrics
+if TYPE_CHECKING:
+    from gherlint.linter import GherkinLinter
+    from gherlint.vcs import LineRanges
+
+# the keys of ``gherlint.reporting.REPORTERS``
+OUTPUT_FORMATS = ["text", "json", "ndjson", "sarif"]
 
 
 @click.group(
@@ -23,16 +36,140 @@ def cli(ctx: click.Context) -> None:
 
 
 @cli.command()
+@click.option(
+    "-j",
+    "--jobs",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Number of processes to use for linting, 0 means one per CPU",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    show_default=True,
+    help="Reuse the results for files which did not change since the last run",
+)
+@click.option(
+    "-o",
+    "--output",
+    default="-",
+    type=click.File("w", encoding="utf8"),
+    help="File to write the report to instead of stdout",
+)
+@click.option(
+    "-f",
+    "--format",
+    "output_format",
+    default="text",
+    show_default=True,
+    type=click.Choice(OUTPUT_FORMATS),
+    help="Format of the report",
+)
+@click.option(
+    "--changed-since",
+    metavar="REV",
+    help="Only report the files changed since the git revision, including uncommitted and untracked files",
+)
+@click.option(
+    "--diff",
+    metavar="git|-|FILE",
+    help=(
+        "Only report the files in a unified diff and only check the scenarios touched by it. "
+        "The diff is read from a file, from stdin with '-', or taken from 'git diff HEAD' with 'git'"
+    ),
+)
+@click.option(
+    "--watch",
+    default=False,
+    is_flag=True,
+    help="Keep running and lint the files again whenever they change",
+)
 @click.argument("path")
-def lint(path: str) -> None:
+def lint(
+    path: str,
+    jobs: int,
+    cache: bool,
+    output: TextIO,
+    output_format: str,
+    changed_since: Optional[str],
+    diff: Optional[str],
+    watch: bool,
+) -> None:
     """Perform linting of feature files"""
-    GherkinLinter(Path(path)).run()
+    from gherlint.exceptions import PluginError
+    from gherlint.linter import GherkinLinter
+    from gherlint.reporting import REPORTERS
+    from gherlint.vcs import VCSError
+
+    if changed_since and diff:
+        raise click.UsageError("--changed-since and --diff can not be combined")
+    if watch and (changed_since or diff):
+        raise click.UsageError(
+            "--watch can not be combined with --changed-since or --diff"
+        )
+    try:
+        linter = GherkinLinter(Path(path), reporter=REPORTERS[output_format](output))
+    except PluginError as exc:
+        raise click.ClickException(str(exc)) from exc
+    if watch:
+        _watch(linter, path, jobs)
+        return
+    try:
+        changed_lines = _read_diff(diff, Path(path)) if diff else None
+        linter.run(
+            jobs=jobs,
+            use_cache=cache,
+            changed_since=changed_since,
+            changed_lines=changed_lines,
+        )
+    except VCSError as exc:
+        raise click.ClickException(str(exc)) from exc
+
+
+def _watch(linter: GherkinLinter, path: str, jobs: int) -> None:
+    from gherlint.watcher import create_watcher
+
+    # the watcher is created before linting, so that no change is missed meanwhile
+    with create_watcher(Path(path)) as watcher:
+        click.echo(f"Watching {path} for changes, press Ctrl+C to stop", err=True)
+        try:
+            linter.watch(watcher, jobs=jobs)
+        except KeyboardInterrupt:
+            pass
+
+
+def _read_diff(source: str, path: Path) -> Dict[str, Optional[LineRanges]]:
+    from gherlint.vcs import get_changed_lines, get_toplevel, parse_diff
+
+    if source == "git":
+        return get_changed_lines(path)
+    if source == "-":
+        content = sys.stdin.read()
+    else:
+        try:
+            content = Path(source).read_text("utf8")
+        except OSError as exc:
+            raise click.BadParameter(str(exc), param_hint="--diff") from exc
+    # paths in diffs are relative to the root of the repository, like those of git diff,
+    # or else to the working directory
+    changed_lines = parse_diff(content, get_toplevel(Path.cwd()) or Path.cwd())
+    root = os.path.join(os.path.realpath(path), "")
+    if not any(
+        os.path.join(filepath, "").startswith(root) for filepath in changed_lines
+    ):
+        click.echo(
+            f"Warning: none of the feature files in the diff is in {path}", err=True
+        )
+    return dict(changed_lines)
 
 
 @cli.command()
 @click.argument("path")
 def stats(path: str) -> None:
     """Compute metrics over your feature files"""
+    from gherlint.statistics import compute_metrics
+
     compute_metrics(Path(path))
 
 
@@ -43,8 +180,16 @@ def stats(path: str) -> None:
     is_flag=True,
     help="Don't write to disk, only output which files would be modified",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    default=0,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Number of files to process at the same time, 0 means one per CPU",
+)
 @click.argument("path")
-def fix_language_tags(path: str, dry_run: bool) -> None:
+def fix_language_tags(path: str, dry_run: bool, jobs: int) -> None:
     """Add or fix language tags in feature files
 
     If gherlint detects that a language other than English is used, it will
@@ -52,7 +197,111 @@ def fix_language_tags(path: str, dry_run: bool) -> None:
     If a language tag is present but does not fit to the file contents, the existing
     tag will be replaced.
     """
-    LanguageFixer(Path(path)).run(modify=not dry_run)
+    from gherlint.fixer import LanguageFixer
+
+    LanguageFixer(Path(path)).run(modify=not dry_run, jobs=jobs)
+
+
+@cli.command(name="daemon")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix domain socket to listen on  [default: daemon.sock in the cache directory]",
+)
+def daemon_command(socket_path: Optional[Path]) -> None:
+    """Keep a linter running to answer gherlint client
+
+    The linter is set up once, and the cache is used for all requests.
+    Restart the daemon after changing the configuration.
+    """
+    from gherlint import cache, client
+    from gherlint.daemon import LintServer
+    from gherlint.exceptions import LintRequestError, PluginError
+
+    if socket_path is None:
+        socket_path = client.get_socket_path()
+        cache.create_directory(socket_path.parent)
+    else:
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        server = LintServer(socket_path)
+    except (LintRequestError, PluginError) as exc:
+        raise click.ClickException(str(exc)) from exc
+    with server:
+        click.echo(f"Listening on {socket_path}, press Ctrl+C to stop", err=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+@cli.command(name="client")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix domain socket the daemon listens on  [default: daemon.sock in the cache directory]",
+)
+@click.option(
+    "--stdin-filename",
+    metavar="PATH",
+    help="Lint the content of stdin as if it was the file PATH, e.g. an unsaved editor buffer",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    show_default=True,
+    help="Reuse the results for files which did not change since the last run",
+)
+@click.option(
+    "-o",
+    "--output",
+    default="-",
+    type=click.File("w", encoding="utf8"),
+    help="File to write the report to instead of stdout",
+)
+@click.option(
+    "-f",
+    "--format",
+    "output_format",
+    default="text",
+    show_default=True,
+    type=click.Choice(OUTPUT_FORMATS),
+    help="Format of the report",
+)
+@click.argument("paths", nargs=-1)
+def client_command(
+    paths: Tuple[str, ...],
+    socket_path: Optional[Path],
+    stdin_filename: Optional[str],
+    cache: bool,
+    output: TextIO,
+    output_format: str,
+) -> None:
+    """Lint feature files with the running daemon
+
+    Without a daemon, the files are linted in this process instead.
+    """
+    from gherlint import client
+    from gherlint.exceptions import LintRequestError
+    from gherlint.reporting import REPORTERS
+
+    content = None
+    if stdin_filename:
+        if paths:
+            raise click.UsageError("PATHS can not be given along with --stdin-filename")
+        paths = (stdin_filename,)
+        content = sys.stdin.read()
+    elif not paths:
+        raise click.UsageError("Either PATHS or --stdin-filename must be given")
+    try:
+        messages = client.lint(
+            paths, content=content, use_cache=cache, socket_path=socket_path
+        )
+    except LintRequestError as exc:
+        raise click.ClickException(str(exc)) from exc
+    client.report(messages, REPORTERS[output_format](output))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,198 @@
+"""On-disk cache for the results of linting individual files."""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from gherlint import get_version
+from gherlint.config import Config
+from gherlint.options import Field, Options
+
+if TYPE_CHECKING:
+    from gherlint.checkers.base_checker import BaseChecker
+
+PACKAGE_PATH = Path(__file__).parent
+
+
+class CacheOptions(Options):
+    config_section = "cache"
+    directory: Path = Field(
+        Path(".gherlint_cache"), description="Directory to store cached results in."
+    )
+    max_entries: int = Field(
+        100_000,
+        description="Maximum number of cached files. The least recently used entries are evicted first.",
+    )
+
+
+def create_directory(directory: Path) -> None:
+    """Create the cache directory, with a .gitignore file so that git ignores its content."""
+    directory.mkdir(parents=True, exist_ok=True)
+    gitignore = directory / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("*\n", encoding="utf8")
+
+
+def get_context(checkers: Sequence["BaseChecker"]) -> str:
+    """Describe everything besides the file itself that influences the linting result."""
+    # the version alone is not enough when working on gherlint itself
+    sources = sorted(
+        f"{path.relative_to(PACKAGE_PATH)}:{path.stat().st_mtime_ns}"
+        for path in PACKAGE_PATH.rglob("*.py")
+    )
+    # checkers of plugins change independently of gherlint
+    sources += sorted(
+        f"{path}:{os.stat(path).st_mtime_ns}"
+        for path in {inspect.getfile(type(checker)) for checker in checkers}
+        if not Path(path).is_relative_to(PACKAGE_PATH)
+    )
+    return json.dumps(
+        {
+            "version": get_version(),
+            "sources": sources,
+            "config": dict(Config.get_config()),
+            "checkers": [
+                f"{type(checker).__module__}.{type(checker).__qualname__}"
+                for checker in checkers
+            ],
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+
+class LintCache:
+    """Maps the contents of a file to the result of linting it.
+
+    Besides the file contents, the key of an entry covers the file path and the ``context``
+    returned by ``get_context``. Each entry is stored in its own file, and its modification
+    time records when it was used last.
+    """
+
+    def __init__(self, context: str) -> None:
+        self.options = CacheOptions.from_config()
+        self.directory: Path = self.options.directory  # type: ignore
+        create_directory(self.directory)
+        self._context = hashlib.sha256(context.encode("utf8")).digest()
+
+    def key(self, filepath: Path) -> str:
+        digest = hashlib.sha256(self._context)
+        digest.update(str(filepath).encode("utf8") + b"\0")
+        digest.update(filepath.read_bytes())
+        return digest.hexdigest()
+
+    def __contains__(self, key: str) -> bool:
+        return (self.directory / key).is_file()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached result, or None if there is none (or it can not be read)."""
+        entry = self.directory / key
+        try:
+            with entry.open("rb") as file:
+                result = pickle.load(file)
+            os.utime(entry)  # mark as recently used
+        except (
+            OSError,
+            EOFError,
+            pickle.UnpicklingError,
+            # raised by entries written by other versions, e.g. for classes which changed
+            AttributeError,
+            ImportError,
+            ValueError,
+            TypeError,
+        ):
+            return None
+        return result
+
+    def put(self, key: str, result: Any) -> None:
+        entry = self.directory / key
+        tmp_file = entry.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_file.open("wb") as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+        # an entry is either complete or not there at all, even if gherlint is interrupted
+        os.replace(tmp_file, entry)
+
+    def prune(self) -> None:
+        """Evict the least recently used entries until at most ``max_entries`` are left."""
+        with os.scandir(self.directory) as entries:
+            files = [
+                entry
+                for entry in entries
+                if entry.is_file() and not entry.name.startswith(".")
+            ]
+        excess = len(files) - self.options.max_entries  # type: ignore
+        if excess <= 0:
+            return
+        files.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in files[:excess]:
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass  # removed by a concurrent run
+
+
+class ProjectIndex:
+    """Maps each file of the project to the data it contributes to cross-file checks.
+
+    In contrast to the ``LintCache``, an entry is looked up by the real path of the file and
+    it is valid as long as the size and modification time of the file did not change, so the
+    file does not have to be read. The index is stored in a single file, and only for the same
+    ``context`` as the cache. Each run only updates the entries of the files it linted, so
+    runs on parts of the project keep the entries of the other files.
+    """
+
+    def __init__(self, context: str) -> None:
+        options = CacheOptions.from_config()
+        create_directory(options.directory)  # type: ignore
+        directory: Path = options.directory / "index"  # type: ignore
+        directory.mkdir(exist_ok=True)
+        self.path = directory / hashlib.sha256(context.encode("utf8")).hexdigest()
+        self._entries: Dict[str, Tuple[Tuple[int, int], List[Any]]] = {}
+        try:
+            with self.path.open("rb") as file:
+                self._entries = pickle.load(file)
+        except (
+            OSError,
+            EOFError,
+            pickle.UnpicklingError,
+            # written by another version, see ``LintCache.get``
+            AttributeError,
+            ImportError,
+            ValueError,
+            TypeError,
+        ):
+            pass
+
+    @staticmethod
+    def _signature(filepath: Path) -> Tuple[int, int]:
+        stat = filepath.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, filepath: Path) -> Optional[List[Any]]:
+        """Get the map data of the file, or None if the file is not indexed or changed."""
+        entry = self._entries.get(os.path.realpath(filepath))
+        if entry is None or entry[0] != self._signature(filepath):
+            return None
+        return entry[1]
+
+    def put(self, filepath: Path, map_data: List[Any]) -> None:
+        self._entries[os.path.realpath(filepath)] = (
+            self._signature(filepath),
+            map_data,
+        )
+
+    def save(self) -> None:
+        """Save the entries, dropping those of files which no longer exist."""
+        entries = {
+            filepath: entry
+            for filepath, entry in self._entries.items()
+            if os.path.isfile(filepath)
+        }
+        tmp_file = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_file.open("wb") as file:
+            pickle.dump(entries, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, self.path)
@@ -1,8 +1,8 @@
 import inspect
-from typing import List, Optional, Type
+from typing import Any, List, Optional, Set, Type
 
 from gherlint.options import Options
-from gherlint.reporting import Message, MessageStore, Reporter
+from gherlint.reporting import Message, MessageStore, ReportedMessage, Reporter
 
 
 class BaseChecker:
@@ -13,15 +13,54 @@ class BaseChecker:
 
     def __init__(self, reporter: Reporter) -> None:
         self.reporter = reporter
+        self._enabled_messages: Set[str] = set()
         for message in self.MESSAGES:
             MessageStore().register_message(message)
+            if reporter.resolve(message).enabled:
+                self._enabled_messages.update((message.id, message.name))
         self._init_options()
 
+    def is_message_enabled(self, id_or_name: str) -> bool:
+        """Check if one of the checker's messages is enabled.
+
+        Useful to skip expensive checks whose result would be discarded anyway."""
+        return id_or_name in self._enabled_messages
+
+    @classmethod
+    def has_enabled_messages(cls, reporter: Reporter) -> bool:
+        """Check if the checker could emit anything at all with the given reporter."""
+        return not cls.MESSAGES or any(
+            reporter.is_enabled(message) for message in cls.MESSAGES
+        )
+
     def _init_options(self) -> None:
         options_class = self.get_options_class()
         if options_class is not None:
             self.options = options_class.from_config()
 
+    def get_map_data(self) -> Any:
+        """Hand over the data of the file linted last that checks across several files need.
+
+        Called after each file, and the result is passed to ``reduce_map_data`` in the main
+        process. When linting in parallel, the worker processes send it to the main process;
+        it is also stored in the cache and the project index, to complete the checks across
+        files without linting unchanged files again. Checkers which keep state across files
+        should reset it here."""
+        return None
+
+    def reduce_map_data(self, data: Any, messages: List[ReportedMessage]) -> None:
+        """Complete checks across several files in the main process.
+
+        Called in the same order as the files would be linted in a serial run, with the
+        output of ``get_map_data`` and the messages the worker emitted for that file.
+        Messages may be inserted into ``messages`` in place."""
+
+    def reset_map_data(self) -> None:
+        """Forget the data passed to ``reduce_map_data`` so far.
+
+        Used when watching for changes, where the data of all files is reduced again after
+        some of them changed."""
+
     @classmethod
     def get_options_class(cls) -> Optional[Type[Options]]:
         annotations = getattr(cls, "__annotations__", {})
@@ -3,7 +3,7 @@ Checker focussing on complexity issues.
 These may be constructs that may be simplified, or are too long or complex which makes it harder to understand.
 """
 
-from typing import Optional, Set, Union
+from typing import Set, Union
 
 from gherlint.checkers.base_checker import BaseChecker
 from gherlint.objectmodel import nodes
@@ -27,24 +27,18 @@ class ComplexityChecker(BaseChecker):
 
     def __init__(self, reporter: Reporter) -> None:
         super().__init__(reporter)
-        self.common_given_steps: Optional[Set[str]] = None
+        # IDs of the scenarios of the current feature which were walked, as the linter may
+        # skip some of them; nodes are compared by identity, like in the walker
+        self.walked_scenarios: Set[int] = set()
 
     def visit_feature(self, _: nodes.Feature) -> None:
-        self.common_given_steps = None
+        self.walked_scenarios.clear()
 
-    def visit_scenario(
-        self, node: Union[nodes.Scenario, nodes.ScenarioOutline]
-    ) -> None:
-        given_steps = set(
-            step.text for step in node.steps if step.inferred_type == "given"
-        )
-        if self.common_given_steps is None:
-            self.common_given_steps = given_steps
-        else:
-            self.common_given_steps &= given_steps
+    def visit_scenario(self, node: nodes.Scenario) -> None:
+        self.walked_scenarios.add(id(node))
 
     def visit_scenariooutline(self, node: nodes.ScenarioOutline) -> None:
-        self.visit_scenario(node)
+        self.walked_scenarios.add(id(node))
         total_example_values = sum(
             example_set.number_of_entries for example_set in node.examples
         )
@@ -52,14 +46,27 @@ class ComplexityChecker(BaseChecker):
             self.reporter.add_message("outline-could-be-a-scenario", node)
 
     def leave_feature(self, node: nodes.Feature) -> None:
-        if len(node.scenarios) > 1 and self.common_given_steps:
-            for scenario in (child_node for child_node in node.scenarios):
-                for step in scenario.steps:
-                    if (
-                        step.inferred_type == "given"
-                        and step.text in self.common_given_steps
-                    ):
-                        self.reporter.add_message("consider-using-background", step)
+        # The common steps are found in all scenarios of the feature, but only reported in
+        # the walked ones, which are not all scenarios if the linter only checks some of them.
+        if len(node.scenarios) < 2 or not self.is_message_enabled(
+            "consider-using-background"
+        ):
+            return
+        common_given_steps = set.intersection(
+            *(_get_given_steps(scenario) for scenario in node.scenarios)
+        )
+        if not common_given_steps:
+            return
+        for scenario in node.scenarios:
+            if id(scenario) not in self.walked_scenarios:
+                continue
+            for step in scenario.steps:
+                if step.inferred_type == "given" and step.text in common_given_steps:
+                    self.reporter.add_message("consider-using-background", step)
+
+
+def _get_given_steps(node: Union[nodes.Scenario, nodes.ScenarioOutline]) -> Set[str]:
+    return set(step.text for step in node.steps if step.inferred_type == "given")
 
 
 def register_checker(registry: CheckerRegistry) -> None:
@@ -1,11 +1,19 @@
 """Checker focussing on consistency issues."""
 
-from typing import List, Sequence, Set, Union
+from typing import List, NamedTuple, Sequence, Set, Union
 
 from gherlint.checkers.base_checker import BaseChecker
 from gherlint.objectmodel import nodes
 from gherlint.registry import CheckerRegistry
-from gherlint.reporting import Message, Reporter
+from gherlint.reporting import Message, MessageStore, ReportedMessage, Reporter
+
+
+class VisitedFeature(NamedTuple):
+    name: str
+    file: str
+    line: int
+    column: int
+    position: int  # messages emitted for the file before the feature was visited
 
 
 class ConsistencyChecker(BaseChecker):
@@ -35,20 +43,34 @@ class ConsistencyChecker(BaseChecker):
             "tag-could-be-on-parent",
             "Common tags can be moved to the parent element",
         ),
+        Message(
+            "W302",
+            "duplicated-feature-name",
+            "Feature name is already used in another file",
+        ),
     ]
 
     def __init__(self, reporter: Reporter) -> None:
         super().__init__(reporter)
-        self.feature_names: Set[str] = set()
         self.scenario_names: Set[str] = set()
+        self.visited_features: List[VisitedFeature] = []
+        # feature names of all files merged so far by ``reduce_map_data``
+        self.reduced_feature_names: Set[str] = set()
 
     def visit_feature(self, node: nodes.Feature) -> None:
         self.scenario_names.clear()
-        if node.name in self.feature_names:
-            self.reporter.add_message("duplicated-feature-name", node)
-        if node.name:
-            self.feature_names.add(node.name)
-        if len(node.scenarios) > 1:
+        self.visited_features.append(
+            VisitedFeature(
+                node.name,
+                getattr(node.get_root(), "filename", ""),
+                node.line,
+                node.column,
+                self.reporter.message_count,
+            )
+        )
+        if len(node.scenarios) > 1 and self.is_message_enabled(
+            "tag-could-be-on-parent"
+        ):
             self._check_tag_could_be_on_parent(node, node.scenarios)
 
     def visit_scenario(self, node: nodes.Scenario) -> None:
@@ -60,7 +82,7 @@ class ConsistencyChecker(BaseChecker):
     def visit_scenariooutline(self, node: nodes.ScenarioOutline) -> None:
         self._check_duplicated_scenario_name(node)
         self._check_duplicated_tag(node)
-        if len(node.examples) > 1:
+        if len(node.examples) > 1 and self.is_message_enabled("tag-could-be-on-parent"):
             self._check_tag_could_be_on_parent(node, node.examples)
 
     def visit_examples(self, node: nodes.Examples) -> None:
@@ -69,6 +91,33 @@ class ConsistencyChecker(BaseChecker):
     def visit_step(self, node: nodes.Step) -> None:
         self._check_wrong_step_type_in_background(node)
 
+    def get_map_data(self) -> List[VisitedFeature]:
+        # The main process checks the feature names against those of all other files
+        visited_features = self.visited_features
+        self.visited_features = []
+        return visited_features
+
+    def reduce_map_data(
+        self, data: List[VisitedFeature], messages: List[ReportedMessage]
+    ) -> None:
+        message = MessageStore.get_by_name("duplicated-feature-name")
+        enabled = self.reporter.is_enabled(message)
+        inserted = 0
+        for feature in data:
+            if enabled and feature.name in self.reduced_feature_names:
+                messages.insert(
+                    feature.position + inserted,
+                    ReportedMessage.from_location(
+                        message, feature.file, feature.line, feature.column
+                    ),
+                )
+                inserted += 1
+            if feature.name:
+                self.reduced_feature_names.add(feature.name)
+
+    def reset_map_data(self) -> None:
+        self.reduced_feature_names.clear()
+
     def _check_duplicated_scenario_name(
         self, node: Union[nodes.Scenario, nodes.ScenarioOutline]
     ):
@@ -83,9 +132,7 @@ class ConsistencyChecker(BaseChecker):
         self, node: Union[nodes.Scenario, nodes.ScenarioOutline, nodes.Examples]
     ) -> None:
         for tag in node.tags:
-            if any(
-                tag in parent.tags for parent in node.parents if hasattr(parent, "tags")  # type: ignore
-            ):
+            if tag.name in node.inherited_tags:
                 self.reporter.add_message("duplicated-tag", node, tag=tag.name)
 
     def _check_wrong_step_type_in_background(self, node: nodes.Step) -> None:
@@ -0,0 +1,54 @@
+"""The checkers of gherlint along with the IDs and names of their messages.
+
+The registry uses this to find the checkers without searching for and importing all modules.
+Generated by ``python -m gherlint.registry``, which has to be run after adding a checker or
+message. A unit test makes sure that it is up to date.
+"""
+
+CHECKERS = [
+    (
+        "gherlint.checkers.completeness",
+        "CompletenessChecker",
+        [
+            ("W101", "missing-feature-name"),
+            ("W102", "missing-scenario-name"),
+            ("E101", "missing-parameter"),
+            ("W103", "file-has-no-feature"),
+            ("W104", "empty-feature"),
+            ("W105", "empty-scenario"),
+            ("W106", "empty-background"),
+            ("C101", "missing-given-step"),
+            ("C102", "missing-when-step"),
+            ("C103", "missing-then-step"),
+            ("R101", "unused-parameter"),
+        ],
+    ),
+    (
+        "gherlint.checkers.complexity",
+        "ComplexityChecker",
+        [
+            ("R201", "outline-could-be-a-scenario"),
+            ("R202", "consider-using-background"),
+        ],
+    ),
+    (
+        "gherlint.checkers.consistency",
+        "ConsistencyChecker",
+        [
+            ("E301", "examples-outside-scenario-outline"),
+            ("W301", "duplicated-tag"),
+            ("C301", "duplicated-scenario-name"),
+            ("C302", "only-given-allowed-in-background"),
+            ("R301", "tag-could-be-on-parent"),
+            ("W302", "duplicated-feature-name"),
+        ],
+    ),
+    (
+        "gherlint.checkers.convention",
+        "ConventionsChecker",
+        [
+            ("C401", "feature-tags-pattern-mismatch"),
+            ("C402", "scenario-tags-pattern-mismatch"),
+        ],
+    ),
+]
@@ -0,0 +1,77 @@
+"""Client for the daemon, see ``gherlint.daemon``.
+
+If no daemon is running, the client lints in its own process instead, with the same result.
+"""
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from gherlint.cache import CacheOptions
+from gherlint.exceptions import LintRequestError
+from gherlint.reporting import ReportedMessage, Reporter
+
+
+def get_socket_path() -> Path:
+    """Get the default path of the socket the daemon listens on."""
+    options = CacheOptions.from_config()
+    return options.directory / "daemon.sock"  # type: ignore
+
+
+def lint(
+    paths: Sequence[str],
+    content: Optional[str] = None,
+    use_cache: bool = True,
+    socket_path: Optional[Path] = None,
+) -> List[ReportedMessage]:
+    """Lint the ``paths``, or the ``content`` given for the single path, with the daemon."""
+    request: Dict[str, Any] = {"cwd": os.getcwd(), "cache": use_cache}
+    if content is None:
+        request["paths"] = list(paths)
+    else:
+        (request["path"],) = paths
+        request["content"] = content
+    response = send_request(request, socket_path or get_socket_path())
+    if response is None:
+        # imported here, as the point of the daemon is to not pay for setting up the linter
+        from gherlint.daemon import (  # pylint: disable=import-outside-toplevel
+            lint_in_process,
+        )
+
+        response = lint_in_process(request)
+    if "error" in response:
+        raise LintRequestError(response["error"])
+    return [ReportedMessage(**message) for message in response["messages"]]
+
+
+def send_request(
+    request: Dict[str, Any], socket_path: Path
+) -> Optional[Dict[str, Any]]:
+    """Send a request to the daemon and return its response, None if no daemon is running."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(str(socket_path))
+            connection.sendall(json.dumps(request).encode("utf8") + b"\n")
+            with connection.makefile("rb") as file:
+                line = file.readline()
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+    if not line:
+        raise LintRequestError("The daemon closed the connection without answering")
+    return json.loads(line)
+
+
+def report(messages: List[ReportedMessage], reporter: Reporter) -> None:
+    """Output the messages with the reporter, in the same way as the linter does."""
+    current_file = None
+    for message in messages:
+        if current_file is not None and message.file != current_file:
+            reporter.end_file()
+        current_file = message.file
+        reporter.handle_message(message)
+    reporter.end_file()
+    reporter.finish()
@@ -0,0 +1,97 @@
+"""Daemon which keeps a linter set up and lints on request, see ``gherlint.client``.
+
+Client and daemon talk over a Unix domain socket, with one JSON object per line: the client
+sends a request and the daemon answers with a response, then the connection is closed.
+A request contains the working directory of the client (``cwd``), whether to use the cache
+(``cache``) and either the ``paths`` to lint, or the ``content`` of a buffer along with the
+``path`` of the file it belongs to. The response contains the reported ``messages``, with
+the paths relative to ``cwd``, or an ``error``.
+The configuration is read once when the daemon starts.
+"""
+
+import json
+import os
+import socket
+import socketserver
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict
+
+from gherlint.exceptions import GherlintException, LintRequestError
+from gherlint.linter import GherkinLinter
+from gherlint.reporting import CollectingReporter
+
+
+class LintRequestHandler(socketserver.StreamRequestHandler):
+    server: "LintServer"
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError as exc:
+            response: Dict[str, Any] = {"error": f"Invalid request: {exc}"}
+        else:
+            response = handle_request(self.server.linter, request)
+        self.wfile.write(json.dumps(response).encode("utf8") + b"\n")
+
+
+class LintServer(socketserver.UnixStreamServer):
+    """Answers the requests one after another with the same linter."""
+
+    def __init__(self, socket_path: Path) -> None:
+        self.socket_path = socket_path
+        _remove_stale_socket(socket_path)
+        self.linter = GherkinLinter(Path(), reporter=CollectingReporter())
+        super().__init__(str(socket_path), LintRequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def handle_request(linter: GherkinLinter, request: Dict[str, Any]) -> Dict[str, Any]:
+    reporter = CollectingReporter()
+    linter.output_reporter = reporter
+    try:
+        cwd = request["cwd"]
+        if "content" in request:
+            linter.lint_content(Path(cwd, request["path"]), request["content"])
+        else:
+            linter.run(
+                use_cache=request.get("cache", False),
+                paths=[Path(cwd, path) for path in request["paths"]],
+            )
+    except Exception as exc:  # pylint: disable=broad-except
+        # the client gets an answer in any case, and the daemon keeps serving
+        return {"error": str(exc) or type(exc).__name__}
+    prefix = os.path.join(cwd, "")
+    messages = [asdict(message) for message in reporter.take_messages()]
+    for message in messages:
+        if message["file"].startswith(prefix):
+            message["file"] = message["file"][len(prefix) :]
+    return {"messages": messages}
+
+
+def lint_in_process(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Process a request without a daemon."""
+    try:
+        linter = GherkinLinter(Path(), reporter=CollectingReporter())
+    except GherlintException as exc:
+        return {"error": str(exc)}
+    return handle_request(linter, request)
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    """Remove the socket left behind by a daemon which is no longer running."""
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(str(socket_path))
+        except ConnectionRefusedError:
+            socket_path.unlink()
+            return
+    raise LintRequestError(f"A daemon is already listening on {socket_path}")
@@ -0,0 +1,249 @@
+"""Discovery of the feature files to process."""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+from gherlint.exceptions import UnsupportedFiletype
+from gherlint.options import Field, Options
+
+DEFAULT_EXCLUDE = [
+    ".git/",
+    ".hg/",
+    ".svn/",
+    ".tox/",
+    ".nox/",
+    ".venv/",
+    "venv/",
+    "node_modules/",
+    "__pycache__/",
+    ".gherlint_cache/",
+]
+
+
+class DiscoveryOptions(Options):
+    config_section = "discovery"
+    exclude: List[str] = Field(
+        default_factory=lambda: list(DEFAULT_EXCLUDE),
+        description=(
+            "Files and directories to skip, in the syntax of .gitignore files. Patterns are matched "
+            "against the paths relative to the path to process."
+        ),
+    )
+    extend_exclude: List[str] = Field(
+        default_factory=list,
+        description="Additional patterns to skip, on top of the ones in exclude.",
+    )
+    use_gitignore: bool = Field(
+        True, description="Skip files and directories ignored by .gitignore files."
+    )
+
+
+class IgnorePattern(NamedTuple):
+    regex: Pattern[str]
+    negated: bool
+    directory_only: bool
+
+
+class IgnoreRules(NamedTuple):
+    """Patterns which apply to the paths below the directory ``base``."""
+
+    base: str  # absolute path, with a trailing separator
+    patterns: List[IgnorePattern]
+
+    @classmethod
+    def create(cls, base: str, patterns: Iterable[str]) -> IgnoreRules:
+        compiled = [compile_pattern(pattern) for pattern in patterns]
+        return cls(
+            os.path.join(os.path.abspath(base), ""),
+            [pattern for pattern in compiled if pattern is not None],
+        )
+
+    @classmethod
+    def from_file(cls, path: Path) -> IgnoreRules:
+        try:
+            lines = path.read_text("utf8").splitlines()
+        except (OSError, UnicodeDecodeError):
+            lines = []
+        return cls.create(str(path.parent), lines)
+
+
+def compile_pattern(pattern: str) -> Optional[IgnorePattern]:
+    """Compile a pattern in the syntax of .gitignore files, None for comments and blank lines."""
+    pattern = pattern.rstrip("\r\n")
+    if not pattern.endswith("\\ "):
+        pattern = pattern.rstrip(" ")
+    if not pattern or pattern.startswith("#"):
+        return None
+    negated = pattern.startswith("!")
+    if negated:
+        pattern = pattern[1:]
+    elif pattern.startswith("\\"):
+        pattern = pattern[1:]
+    directory_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    if not pattern:
+        return None
+    # a pattern with a slash at the beginning or in the middle is relative to the base,
+    # otherwise it matches at any level
+    anchored = "/" in pattern
+    regex = _translate(pattern.lstrip("/"))
+    if not anchored:
+        regex = f"(?:.*/)?{regex}"
+    return IgnorePattern(re.compile(f"{regex}\\Z"), negated, directory_only)
+
+
+def _translate(pattern: str) -> str:
+    parts = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+            continue
+        if pattern.startswith("/**", index) and index + 3 == len(pattern):
+            parts.append("/.*")
+            index += 3
+            continue
+        if pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[" and "]" in pattern[index + 2 :]:
+            end = pattern.index("]", index + 2)
+            content = pattern[index + 1 : end]
+            if content.startswith("!"):
+                content = "^" + content[1:]
+            parts.append("[" + content.replace("\\", "\\\\") + "]")
+            index = end
+        elif char == "\\" and index + 1 < len(pattern):
+            index += 1
+            parts.append(re.escape(pattern[index]))
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return "".join(parts)
+
+
+def is_ignored(path: str, is_dir: bool, rules: List[IgnoreRules]) -> bool:
+    """Check if the absolute ``path`` is ignored.
+
+    Later rules take precedence over earlier ones, and within the rules the last matching
+    pattern decides."""
+    for base, patterns in reversed(rules):
+        if not path.startswith(base):
+            continue
+        relative = path[len(base) :]
+        if os.sep != "/":
+            relative = relative.replace(os.sep, "/")
+        for pattern in reversed(patterns):
+            if pattern.directory_only and not is_dir:
+                continue
+            if pattern.regex.match(relative):
+                return not pattern.negated
+    return False
+
+
+def iter_feature_files(path: Union[str, Path]) -> Iterator[Path]:
+    """Find all feature files in ``path``.
+
+    Directories are pruned as soon as they are excluded by the configuration or ignored by
+    a .gitignore file, so nothing below them is visited. The files of a directory come
+    before the files in its subdirectories, both ordered by name.
+    A file given explicitly is never excluded."""
+    if isinstance(path, str):
+        path = Path(path)
+    if path.is_file():
+        if path.suffix != ".feature":
+            raise UnsupportedFiletype(f"{path} is not a .feature file.")
+        yield path
+        return
+    root = str(path)
+    absolute_root = os.path.abspath(root)
+    for _, _, filepaths in walk(path):
+        for filepath in filepaths:
+            yield Path(root + filepath[len(absolute_root) :])
+
+
+def walk(
+    path: Path, rules: Optional[List[IgnoreRules]] = None
+) -> Iterator[Tuple[str, List[IgnoreRules], List[str]]]:
+    """Walk the directories searched for feature files, starting with the directory ``path``.
+
+    Yields the absolute path of each directory, the rules which apply to its entries and
+    the absolute paths of the feature files in it, in the order of ``iter_feature_files``.
+    Unless ``rules`` are given, they are taken from the configuration and .gitignore files.
+    """
+    options: DiscoveryOptions = DiscoveryOptions.from_config()  # type: ignore
+    if rules is None:
+        rules = [
+            IgnoreRules.create(str(path), options.exclude + options.extend_exclude)
+        ]
+        if options.use_gitignore:
+            rules.extend(_find_parent_ignore_files(path))
+    return _walk(os.path.abspath(path), rules, options.use_gitignore)
+
+
+def _walk(
+    root: str, rules: List[IgnoreRules], use_gitignore: bool
+) -> Iterator[Tuple[str, List[IgnoreRules], List[str]]]:
+    # each entry on the stack is a directory along with the rules which apply to it
+    stack: List[Tuple[str, List[IgnoreRules]]] = [(root, rules)]
+    while stack:
+        directory, directory_rules = stack.pop()
+        try:
+            with os.scandir(directory) as scanner:
+                entries = sorted(scanner, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        if use_gitignore and any(entry.name == ".gitignore" for entry in entries):
+            directory_rules = directory_rules + [
+                IgnoreRules.from_file(Path(directory, ".gitignore"))
+            ]
+        filepaths = []
+        subdirectories = []
+        for entry in entries:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if not is_dir and not entry.name.endswith(".feature"):
+                continue
+            if is_ignored(entry.path, is_dir, directory_rules):
+                continue
+            if is_dir:
+                subdirectories.append(entry.path)
+            elif entry.is_file():
+                filepaths.append(entry.path)
+        yield directory, directory_rules, filepaths
+        # reversed, so that the first subdirectory is the next one to be processed
+        stack.extend(
+            (subdirectory, directory_rules) for subdirectory in reversed(subdirectories)
+        )
+
+
+def _find_parent_ignore_files(path: Path) -> List[IgnoreRules]:
+    """Get the rules of the .gitignore files above ``path`` within the same git repository."""
+    ignore_files = []
+    for directory in path.absolute().parents:
+        ignore_file = directory / ".gitignore"
+        if ignore_file.is_file():
+            ignore_files.append(ignore_file)
+        if (directory / ".git").exists():
+            return [IgnoreRules.from_file(file) for file in reversed(ignore_files)]
+    # not in a git repository, so the .gitignore files above do not apply
+    return []
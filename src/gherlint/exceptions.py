@@ -44,3 +44,11 @@ class UnknownMessageError(GherlintException):
 
 class UnsupportedFiletype(GherlintException):
     """Raised if a file with unsupported extension should be processed."""
+
+
+class LintRequestError(GherlintException):
+    """Raised if a lint request to the daemon could not be processed."""
+
+
+class PluginError(GherlintException):
+    """Raised if the checkers of a plugin can not be found or loaded."""
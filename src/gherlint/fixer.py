@@ -1,8 +1,13 @@
 import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional, TextIO
 
-from gherlint.parser import GherkinParser
-from gherlint.utils import iter_feature_files
+from gherlint import utils
+from gherlint.discovery import iter_feature_files
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -12,19 +17,91 @@ logger.addHandler(handler)
 
 
 class LanguageFixer:
+    """Adds or fixes the language tags of feature files.
+
+    Only the header of a file, i.e. the part before the ``Feature:`` line, is read to decide
+    if a file has to be fixed, and only the header is rewritten. Files are processed in
+    ``jobs`` threads (0 means one per CPU), as most of the time is spent waiting for I/O.
+    """
+
     def __init__(self, path: Path) -> None:
         self.path = path
 
-    def run(self, modify: bool) -> None:
+    def run(self, modify: bool, jobs: int = 1) -> None:
         if not modify:
             logger.warning("Dry run enabled! No files will be modified.")
-        for file in iter_feature_files(self.path):
-            parse_result = GherkinParser().parse(file)
-            if parse_result.added_language_tag or parse_result.fixed_language_tag:
-                logger.info(
-                    "Patching %s, reason: %s language tag",
-                    file,
-                    "no" if parse_result.added_language_tag else "wrong",
-                )
-                if modify:
-                    file.write_text(parse_result.content, "utf8")
+        jobs = jobs or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = executor.map(
+                lambda file: (file, fix_file(file, modify)),
+                iter_feature_files(self.path),
+            )
+            for file, reason in results:
+                if reason:
+                    logger.info("Patching %s, reason: %s language tag", file, reason)
+
+
+def fix_file(filepath: Path, modify: bool) -> Optional[str]:
+    """Fix the language tag of a file if necessary.
+
+    Returns the reason (``no`` or ``wrong`` language tag) if the file had to be fixed.
+    """
+    # a symlink is kept, and the file it points to is fixed instead
+    filepath = filepath.resolve()
+    # keep line endings as they are
+    with filepath.open(encoding="utf8", newline="") as file:
+        header = "".join(_read_header(file))
+        language = utils.detect_language(header)
+        if language in ("en", "unknown"):
+            return None
+        declared_language = utils.find_language_tag(header)
+        if declared_language == language:
+            return None
+        if modify:
+            fixed_header = fix_language_tag(header, language, declared_language)
+            fixed_file = _write_fixed_copy(filepath, fixed_header, file)
+    if modify:
+        # the fixed file replaces the original one at once, so it is never left half written
+        os.replace(fixed_file, filepath)
+    return "no" if declared_language is None else "wrong"
+
+
+def fix_language_tag(
+    content: str, language: str, declared_language: Optional[str]
+) -> str:
+    """Get the content with the language tag added (if there is no ``declared_language``)
+    or replaced by the tag for ``language``."""
+    if declared_language is None:
+        # the added line ends like the first line of the content
+        first_line = content.splitlines(keepends=True)[0] if content else ""
+        newline = first_line[len(first_line.rstrip("\r\n")) :] or "\n"
+        return f"# language: {language}{newline}" + content
+    return content.replace(
+        f"# language: {declared_language}", f"# language: {language}"
+    )
+
+
+def _read_header(file: TextIO) -> List[str]:
+    """Read the lines of the header, including the first line after it."""
+    header = []
+    for line in file:
+        header.append(line)
+        if not utils.is_header_line(line):
+            break
+    return header
+
+
+def _write_fixed_copy(filepath: Path, header: str, rest: TextIO) -> str:
+    """Write the new header and the rest of the original file to a temporary file next to it."""
+    descriptor, fixed_file = tempfile.mkstemp(
+        dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp"
+    )
+    try:
+        with open(descriptor, "w", encoding="utf8", newline="") as file:
+            file.write(header)
+            shutil.copyfileobj(rest, file)
+        shutil.copymode(filepath, fixed_file)
+    except BaseException:
+        os.unlink(fixed_file)
+        raise
+    return fixed_file
@@ -1,15 +1,72 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import parse
 
+from gherlint.cache import LintCache, ProjectIndex, get_context
 from gherlint.checkers.base_checker import BaseChecker
+from gherlint.config import Config
+from gherlint.discovery import iter_feature_files
+from gherlint.exceptions import InternalError
+from gherlint.objectmodel.nodes import Document, Scenario
 from gherlint.parser import GherkinParser, ParseResult
 from gherlint.registry import CheckerRegistry
-from gherlint.reporting import Message, TextReporter
+from gherlint.reporting import (
+    CollectingReporter,
+    Message,
+    MessageStore,
+    ReportedMessage,
+    Reporter,
+    TextReporter,
+)
+from gherlint.vcs import LineRanges, get_changed_files
 from gherlint.walker import ASTWalker
 
 
+class FileResult(NamedTuple):
+    """Outcome of linting a single file on its own."""
+
+    messages: List[ReportedMessage]
+    # one entry for each checker, in the order of ``GherkinLinter.checkers``
+    map_data: List[Any]
+
+
+class FileTask(NamedTuple):
+    """What to do with a file in ``GherkinLinter.run``."""
+
+    filepath: Path
+    report: bool  # False if the file is only needed for cross-file checks
+    map_data: Optional[List[Any]]  # from the project index, if the file is not linted
+    cache_key: str
+    cached: bool
+    # only the scenarios touching these lines are checked, if given
+    line_ranges: Optional[LineRanges] = None
+
+    @property
+    def needs_linting(self) -> bool:
+        return self.map_data is None and not self.cached
+
+    @property
+    def is_partial(self) -> bool:
+        """True if the result does not cover the whole file, and so must not be stored."""
+        return self.line_ranges is not None
+
+
 class GherkinLinter(BaseChecker):
     """Main linter class which orchestrates the linting process."""
 
@@ -30,26 +87,264 @@ class GherkinLinter(BaseChecker):
         ),
     ]
 
-    def __init__(self, path: Path) -> None:
-        super().__init__(reporter=TextReporter())
+    def __init__(self, path: Path, reporter: Optional[Reporter] = None) -> None:
+        # Checkers report into the collector, which holds the messages of a single file.
+        # Once a file is done its messages are passed on to the output reporter.
+        self.collector = CollectingReporter()
+        super().__init__(reporter=self.collector)
+        self.output_reporter = reporter or TextReporter()
         self.path = path
         self.checker_registry = CheckerRegistry()
-        self.checker_registry.discover()
+        # checkers whose messages are all disabled would only waste time
+        self.checker_registry.discover(self.reporter, reserved=self.MESSAGES)
         self.checkers: List[BaseChecker] = [
-            checker(self.reporter) for checker in self.checker_registry
+            checker(self.reporter)
+            for checker in self.checker_registry
+            if checker.has_enabled_messages(self.reporter)
         ]
         self.walker = ASTWalker(self.checkers)
 
-    def run(self) -> None:
-        """Lint all feature files"""
-        if self.path.is_file():
-            self.lint_file(self.path)
-        else:
-            for filepath in self.path.rglob("*.feature"):
-                self.lint_file(filepath)
+    def run(
+        self,
+        jobs: int = 1,
+        use_cache: bool = False,
+        changed_since: Optional[str] = None,
+        changed_lines: Optional[Dict[str, Optional[LineRanges]]] = None,
+        paths: Optional[Sequence[Path]] = None,
+    ) -> None:
+        """Lint all feature files
+
+        With ``jobs`` other than 1 the files are distributed over that many worker processes
+        (0 means one per CPU). The output is the same as for a serial run.
+        With ``use_cache``, files which did not change since a previous run are not linted
+        again, but the cached messages are reported instead.
+        With ``changed_since``, only the messages for the files changed since that git revision
+        are reported. The other files are only needed for cross-file checks, for which the data
+        in the project index is used instead of linting them, if it is up to date.
+        ``changed_lines`` works the same, but maps the real paths of the changed files to the
+        changed lines (or None if the whole file changed). Scenarios which do not touch any of
+        them are not checked, while the checks of the feature itself still are.
+        ``paths`` are linted instead of ``self.path``, in a single run, so that the checks
+        across files cover the files of all of them."""
+        # the linter may be run several times, e.g. by the daemon
+        for checker in self.checkers:
+            checker.reset_map_data()
+        context = get_context(self.checkers) if use_cache else ""
+        cache = LintCache(context) if use_cache else None
+        index = ProjectIndex(context) if use_cache else None
+        paths = paths or [self.path]
+        if changed_since:
+            changed_lines = {
+                realpath: None
+                for path in paths
+                for realpath in get_changed_files(changed_since, path)
+            }
+        tasks = self._plan(paths, changed_lines, cache, index)
+        misses = [task for task in tasks if task.needs_linting]
+        try:
+            with self._lint_in_processes(misses, jobs) as fresh_results:
+                for task in tasks:
+                    result = self._get_result(task, fresh_results, cache)
+                    if index and task.map_data is None and not task.is_partial:
+                        index.put(task.filepath, result.map_data)
+                    self._merge_result(result, task.report)
+        finally:
+            # don't lose the output for the files done so far if something goes wrong
+            self.output_reporter.finish()
+        if cache:
+            cache.prune()
+        if index:
+            index.save()
+
+    def lint_content(self, filepath: Path, content: str) -> None:
+        """Lint ``content`` as if it was the only file and located at ``filepath``."""
+        for checker in self.checkers:
+            checker.reset_map_data()
+        try:
+            self._merge_result(self._lint_in_isolation(filepath, content=content))
+        finally:
+            self.output_reporter.finish()
+
+    def watch(self, changes: Iterable[Set[Path]], jobs: int = 1) -> None:
+        """Lint all feature files, then lint the files again whenever they change.
+
+        ``changes`` provides the paths of the files which were modified, created or deleted,
+        see ``gherlint.watcher``. Only these files are linted again, in this process, and the
+        cross-file checks are completed with the results of the other files kept in memory.
+        After the first one, each report covers the changed files and the other files whose
+        messages changed because of them."""
+        filepaths = list(iter_feature_files(self.path))
+        tasks = [FileTask(filepath, True, None, "", False) for filepath in filepaths]
+        with self._lint_in_processes(tasks, jobs) as fresh_results:
+            results = dict(zip(filepaths, fresh_results))
+        reported = self._report_changes(results, {}, set(filepaths))
+        for changed in changes:
+            added = False
+            for path in changed:
+                added |= path not in results
+                try:
+                    results[path] = self._lint_in_isolation(path)
+                except OSError:
+                    # deleted, either the file itself or a directory above it
+                    for filepath in [f for f in results if path in (f, *f.parents)]:
+                        del results[filepath]
+                except Exception as exc:  # pylint: disable=broad-except
+                    # e.g. a file saved while it is still being written; one file must not
+                    # end the session, and the file is linted again once it changes
+                    self._discard_partial_result()
+                    results.pop(path, None)
+                    sys.stderr.write(
+                        f"Could not lint {path}: {type(exc).__name__}: {exc}\n"
+                    )
+            if added:
+                results = dict(
+                    sorted(results.items(), key=lambda item: _get_order(item[0]))
+                )
+            # a fresh reporter for each report, as if gherlint was run again
+            self.output_reporter = type(self.output_reporter)(
+                self.output_reporter.output
+            )
+            reported = self._report_changes(results, reported, changed)
+
+    def _report_changes(
+        self,
+        results: Dict[Path, FileResult],
+        reported: Dict[Path, List[ReportedMessage]],
+        changed: Set[Path],
+    ) -> Dict[Path, List[ReportedMessage]]:
+        """Report the messages of the changed files and of the files whose messages differ
+        from the ones ``reported`` before. Returns the messages of all files."""
+        for checker in self.checkers:
+            checker.reset_map_data()
+        current = {}
+        try:
+            for filepath, result in results.items():
+                messages = self._reduce(result)
+                current[filepath] = messages
+                if filepath in changed or messages != reported.get(filepath):
+                    for message in messages:
+                        self.output_reporter.handle_message(message)
+                    self.output_reporter.end_file()
+        finally:
+            self.output_reporter.finish()
+        return current
+
+    def _plan(
+        self,
+        paths: Sequence[Path],
+        changed_lines: Optional[Dict[str, Optional[LineRanges]]],
+        cache: Optional[LintCache],
+        index: Optional[ProjectIndex],
+    ) -> List[FileTask]:
+        tasks = []
+        for filepath in _iter_feature_files(paths):
+            line_ranges = None
+            report = changed_lines is None
+            if changed_lines is not None:
+                realpath = os.path.realpath(filepath)
+                report = realpath in changed_lines
+                line_ranges = changed_lines.get(realpath)
+            map_data = index.get(filepath) if index and not report else None
+            key = (
+                cache.key(filepath)
+                if cache and map_data is None and line_ranges is None
+                else ""
+            )
+            tasks.append(
+                FileTask(
+                    filepath,
+                    report,
+                    map_data,
+                    key,
+                    bool(cache and key and key in cache),
+                    line_ranges,
+                )
+            )
+        return tasks
+
+    def _get_result(
+        self,
+        task: FileTask,
+        fresh_results: Iterator[FileResult],
+        cache: Optional[LintCache],
+    ) -> FileResult:
+        if task.map_data is not None:
+            return FileResult(messages=[], map_data=task.map_data)
+        result = cache.get(task.cache_key) if cache and task.cached else None
+        if result is None:
+            # a cache entry which can not be read is linted again right here
+            result = (
+                self._lint_in_isolation(task.filepath)
+                if task.cached
+                else next(fresh_results)
+            )
+            if cache and not task.is_partial:
+                cache.put(task.cache_key, result)
+        return result
+
+    @contextmanager
+    def _lint_in_processes(
+        self, tasks: List[FileTask], jobs: int
+    ) -> Iterator[Iterator[FileResult]]:
+        """Lint the files in isolation and provide the results in the same order."""
+        filepaths = [task.filepath for task in tasks]
+        line_ranges = [task.line_ranges for task in tasks]
+        if jobs == 1 or len(tasks) < 2:
+            yield map(self._lint_in_isolation, filepaths, line_ranges)
+            return
+        jobs = jobs or os.cpu_count() or 1
+        # Small chunks keep the workers busy evenly, but each chunk costs a round trip.
+        chunksize = max(1, len(filepaths) // (jobs * 4))
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(Config.get_config(),),
+        ) as executor:
+            yield executor.map(
+                _lint_file_in_worker, filepaths, line_ranges, chunksize=chunksize
+            )
+
+    def _lint_in_isolation(
+        self,
+        filepath: Path,
+        line_ranges: Optional[LineRanges] = None,
+        content: Optional[str] = None,
+    ) -> FileResult:
+        """Lint a single file as if it was the only one, see ``BaseChecker.get_map_data``."""
+        self.lint_file(filepath, line_ranges, content)
+        return FileResult(
+            messages=self.collector.take_messages(),
+            map_data=[checker.get_map_data() for checker in self.checkers],
+        )
+
+    def _discard_partial_result(self) -> None:
+        """Forget what was collected for a file whose linting failed halfway."""
+        self.collector.take_messages()
+        for checker in self.checkers:
+            checker.get_map_data()
+
+    def _reduce(self, result: FileResult) -> List[ReportedMessage]:
+        """Complete the cross-file checks with the result of the next file."""
+        messages = list(result.messages)
+        for checker, data in zip(self.checkers, result.map_data):
+            checker.reduce_map_data(data, messages)
+        return messages
+
+    def _merge_result(self, result: FileResult, report: bool = True) -> None:
+        messages = self._reduce(result)
+        if not report:
+            return
+        for message in messages:
+            self.output_reporter.handle_message(message)
+        self.output_reporter.end_file()
 
-    def lint_file(self, filepath: Path) -> None:
-        result = GherkinParser().parse(filepath)
+    def lint_file(
+        self,
+        filepath: Path,
+        line_ranges: Optional[LineRanges] = None,
+        content: Optional[str] = None,
+    ) -> None:
+        result = GherkinParser().parse(filepath, content)
         if result.exception:
             self._handle_parser_error(result)
             return
@@ -63,7 +358,12 @@ class GherkinLinter(BaseChecker):
                 "wrong-language-tag",
                 result.document,
             )
-        self.walker.walk(result.document)
+        skip = (
+            _get_untouched_scenarios(result.document, line_ranges)
+            if line_ranges is not None
+            else ()
+        )
+        self.walker.walk(result.document, skip=skip)
 
     def _handle_parser_error(self, result: ParseResult) -> None:
         offending_lines = str(result.exception).splitlines()[1:]
@@ -76,3 +376,65 @@ class GherkinLinter(BaseChecker):
                 result.document,
                 error_msg=error_msg,
             )
+
+
+# Linter of a worker process when linting in parallel, set up by ``_init_worker``.
+_worker_linter: Optional[GherkinLinter] = None  # pylint: disable=invalid-name
+
+
+def _init_worker(config: Config) -> None:
+    global _worker_linter  # pylint: disable=global-statement
+    # Depending on the start method, the worker either inherits the state of the main process
+    # or starts from scratch. Make sure both cases end up with the same state.
+    Config._config = config  # pylint: disable=protected-access
+    MessageStore.clear()
+    _worker_linter = GherkinLinter(Path())
+
+
+def _lint_file_in_worker(
+    filepath: Path, line_ranges: Optional[LineRanges]
+) -> FileResult:
+    if _worker_linter is None:
+        raise InternalError(None, "Worker process was not initialized")
+    # pylint: disable-next=protected-access
+    return _worker_linter._lint_in_isolation(filepath, line_ranges)
+
+
+def _iter_feature_files(paths: Sequence[Path]) -> Iterator[Path]:
+    """Find the feature files below each of the paths, each file only once."""
+    if len(paths) == 1:
+        yield from iter_feature_files(paths[0])
+        return
+    seen: Set[str] = set()
+    for path in paths:
+        for filepath in iter_feature_files(path):
+            realpath = os.path.realpath(filepath)
+            if realpath not in seen:
+                seen.add(realpath)
+                yield filepath
+
+
+def _get_order(filepath: Path) -> Tuple[Tuple[str, ...], str]:
+    """Sort key for the order in which ``iter_feature_files`` finds the files."""
+    return filepath.parent.parts, filepath.name
+
+
+def _get_untouched_scenarios(
+    document: Document, line_ranges: LineRanges
+) -> List[Scenario]:
+    """Get the scenarios (and scenario outlines) which do not overlap any of the line ranges.
+
+    A scenario spans from its first tag to the line before the next scenario."""
+    if document.feature is None:
+        return []
+    scenarios = document.feature.scenarios
+    starts = [
+        min((tag.line for tag in scenario.tags), default=scenario.line)
+        for scenario in scenarios
+    ]
+    ends = [start - 1 for start in starts[1:]] + [float("inf")]
+    return [
+        scenario
+        for scenario, start, end in zip(scenarios, starts, ends)
+        if not any(first <= end and last >= start for first, last in line_ranges)
+    ]
@@ -5,7 +5,17 @@ Nodes representing different elements of a Gherkin feature file.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Protocol, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    Union,
+)
 
 import parse
 
@@ -26,30 +36,64 @@ class Node(ABC):
     Base class for all concrete node types.
     """
 
+    __slots__ = (
+        "parent",
+        "line",
+        "column",
+        "_root",
+        "_parents",
+        "_inherited_tags",
+        "_children",
+    )
+
     def __init__(self, parent: Optional[Node], line: int, column: int):
         self.parent = parent
         self.line = line
         self.column = column
-        root = self.get_root()
-        if isinstance(root, Document) and root is not self:
-            # shift the line number if the ``Document`` root node has an offset
-            self.line -= root.offset
+        self._root: Optional[Node] = None
+        self._parents: Optional[Tuple[Node, ...]] = None
+        self._inherited_tags: Optional[FrozenSet[str]] = None
+        # Nodes which have children provide them through a ``children`` property, which
+        # builds the tuple on first access. The tree must not be modified afterwards.
+        self._children: Optional[Tuple[Node, ...]] = None
 
     def __repr__(self):
         return f"{self.__class__.__name__}(line={self.line}, column={self.column})"
 
     @property
-    def parents(self) -> List[Node]:
-        if self.parent:
-            return [self.parent] + self.parent.parents
-        return []
+    def parents(self) -> Tuple[Node, ...]:
+        """All parents, starting with the direct parent and ending with the root."""
+        if self._parents is None:
+            if self.parent:
+                self._parents = (self.parent,) + self.parent.parents
+            else:
+                self._parents = ()
+        return self._parents
+
+    @property
+    def inherited_tags(self) -> FrozenSet[str]:
+        """The names of the tags of all parents.
+
+        Computed on first access, so this must not be used before the tree is complete.
+        """
+        if self._inherited_tags is None:
+            if self.parent:
+                parent_tags = getattr(self.parent, "tags", ())
+                self._inherited_tags = self.parent.inherited_tags.union(
+                    tag.name for tag in parent_tags
+                )
+            else:
+                self._inherited_tags = frozenset()
+        return self._inherited_tags
 
     def get_root(self) -> Node:
-        """Get the root node, i.e. the topmost parent in the hierarchy."""
-        current = self
-        while current.parent is not None:
-            current = current.parent
-        return current
+        """Get the root node, i.e. the topmost parent in the hierarchy.
+
+        Computed on first access, so this must not be used before the tree is complete.
+        """
+        if self._root is None:
+            self._root = self if self.parent is None else self.parent.get_root()
+        return self._root
 
     @classmethod
     @abstractmethod
@@ -60,6 +104,8 @@ class Node(ABC):
 class Document(Node):
     """Represents the file itself"""
 
+    __slots__ = ("filename", "feature", "comments")
+
     def __init__(
         self,
         line: int,
@@ -68,18 +114,17 @@ class Document(Node):
         feature: Optional[Feature],
         comments: List[str],
         parent=None,
-        offset: int = 0,
     ):
         super().__init__(parent, line, column)
         self.filename = filename
         self.feature = feature
         self.comments = comments
-        # if we added a language tag we must shift all messages to refer to the correct line numbers
-        self.offset = offset
 
     @property
-    def children(self):
-        return [self.feature]
+    def children(self) -> Tuple[Feature, ...]:
+        if self._children is None:
+            self._children = (self.feature,) if self.feature else ()
+        return self._children  # type: ignore
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any], parent: Optional[Node] = None) -> Document:
@@ -90,7 +135,6 @@ class Document(Node):
             filename=data["filename"],
             feature=None,
             comments=data["comments"],
-            offset=data.get("offset", 0),
         )
         if feature_data:
             instance.feature = Feature.from_dict(feature_data, parent=instance)
@@ -100,6 +144,15 @@ class Document(Node):
 class Feature(Node):
     """Represents a Feature in a file."""
 
+    __slots__ = (
+        "tags",
+        "language",
+        "name",
+        "description",
+        "background",
+        "scenarios",
+    )
+
     def __init__(
         self,
         line: int,
@@ -121,13 +174,11 @@ class Feature(Node):
         self.scenarios = scenarios
 
     @property
-    def children(self) -> List[Union[Tag, Background, Scenario, ScenarioOutline]]:
-        children: List[Union[Tag, Background, Scenario, ScenarioOutline]] = []
-        children.extend(self.tags)
-        if self.background:
-            children.append(self.background)
-        children.extend(self.scenarios)
-        return children
+    def children(self) -> Tuple[Union[Tag, Background, Scenario, ScenarioOutline], ...]:
+        if self._children is None:
+            background = (self.background,) if self.background else ()
+            self._children = (*self.tags, *background, *self.scenarios)
+        return self._children  # type: ignore
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any], parent: Optional[Node]) -> Feature:
@@ -160,14 +211,16 @@ class Feature(Node):
 
 
 def _is_scenario(keyword: str, data: Dict[str, Any]) -> bool:
-    return keyword == "scenario" and data["keyword"] in utils.get_keyword_candidates(
-        "scenario"
+    return (
+        keyword == "scenario"
+        and utils.SCENARIO_KEYWORD_TO_TYPE.get(data["keyword"]) == "scenario"
     )
 
 
 def _is_outline(keyword: str, data: Dict[str, Any]) -> bool:
-    return keyword == "scenario" and data["keyword"] in utils.get_keyword_candidates(
-        "scenarioOutline"
+    return (
+        keyword == "scenario"
+        and utils.SCENARIO_KEYWORD_TO_TYPE.get(data["keyword"]) == "scenarioOutline"
     )
 
 
@@ -178,6 +231,8 @@ def _is_background(keyword: str, _: Dict[str, Any]) -> bool:
 class Background(Node):
     """Represents a background of a feature."""
 
+    __slots__ = ("name", "description", "steps")
+
     def __init__(
         self,
         line: int,
@@ -193,8 +248,10 @@ class Background(Node):
         self.steps = steps
 
     @property
-    def children(self):
-        return self.steps
+    def children(self) -> Tuple[Step, ...]:
+        if self._children is None:
+            self._children = tuple(self.steps)
+        return self._children  # type: ignore
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any], parent: Optional[Node]) -> Background:
@@ -207,12 +264,15 @@ class Background(Node):
             steps=[],
         )
         instance.steps = [Step.from_dict(s, parent=instance) for s in data["steps"]]
+        Step.infer_types(instance.steps)
         return instance
 
 
 class Scenario(Node):
     """Represents a scenario of a feature."""
 
+    __slots__ = ("tags", "name", "description", "examples", "steps", "parameters")
+
     def __init__(
         self,
         line: int,
@@ -233,8 +293,10 @@ class Scenario(Node):
         self.parameters = extract_parameters(name)
 
     @property
-    def children(self):
-        return self.tags + self.steps + self.examples
+    def children(self) -> Tuple[Union[Tag, Step, Examples], ...]:
+        if self._children is None:
+            self._children = (*self.tags, *self.steps, *self.examples)
+        return self._children  # type: ignore
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any], parent: Optional[Node]) -> Scenario:
@@ -253,14 +315,19 @@ class Scenario(Node):
             Examples.from_dict(d, parent=instance) for d in data["examples"]
         ]
         instance.steps = [Step.from_dict(s, parent=instance) for s in data["steps"]]
+        Step.infer_types(instance.steps)
         return instance
 
 
 class ScenarioOutline(Scenario):
     """Represents a scenario outline of a feature"""
 
+    __slots__ = ()
+
 
 class Step(Node):
+    __slots__ = ("type", "text", "parameters", "_inferred_type")
+
     def __init__(
         self, parent: Optional[Node], line: int, column: int, keyword: str, text: str
     ):
@@ -268,35 +335,46 @@ class Step(Node):
         self.type = self._get_english_keyword(keyword)
         self.text = text
         self.parameters = extract_parameters(text)
+        self._inferred_type: Optional[str] = None
 
     @property
     def inferred_type(self) -> str:
-        if not self.type in ("and", "but"):
-            return self.type
-        if not isinstance(self.parent, (Background, Scenario, ScenarioOutline)):
-            raise InternalError(
-                node=self, message="Unexpected type for parent of 'Step'"
-            )
-        current_step_index = self.parent.steps.index(self)
-        while current_step_index > 0:
-            current_step_index -= 1
-            previous_step = self.parent.steps[current_step_index]
-            if previous_step.type not in ("and", "but"):
-                return previous_step.type
-        return "unknown"
+        """The type of the step, with ``And`` and ``But`` resolved to the type of the step they continue."""
+        if self._inferred_type is None:
+            if self.type not in ("and", "but"):
+                return self.type
+            if not isinstance(self.parent, (Background, Scenario, ScenarioOutline)):
+                raise InternalError(
+                    node=self, message="Unexpected type for parent of 'Step'"
+                )
+            # the steps were not created through ``from_dict`` of the parent
+            self.infer_types(self.parent.steps)
+            if self._inferred_type is None:
+                raise InternalError(
+                    node=self, message="Step is not one of the steps of its parent"
+                )
+        return self._inferred_type
+
+    @staticmethod
+    def infer_types(steps: List[Step]) -> None:
+        """Resolve the inferred types of consecutive steps in a single pass."""
+        current_type = "unknown"
+        for step in steps:
+            if step.type not in ("and", "but"):
+                current_type = step.type
+            step._inferred_type = current_type  # pylint: disable=protected-access
 
     @staticmethod
     def _get_english_keyword(keyword: str) -> str:
         """Get the corresponding english step keyword in lowercase from input in any (supported) language."""
         if keyword.strip() == "*":
             return "*"
-        english_keywords = ("given", "when", "then", "and", "but")
-        for english_keyword in english_keywords:
-            if keyword.lower() in [
-                kw.lower() for kw in utils.get_keyword_candidates(english_keyword)
-            ]:
-                return english_keyword
-        raise ValueError(f"Unable to look up english step keyword for {keyword}")
+        try:
+            return utils.STEP_KEYWORD_TO_TYPE[keyword.lower()]
+        except KeyError as exc:
+            raise ValueError(
+                f"Unable to look up english step keyword for {keyword}"
+            ) from exc
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any], parent: Optional[Node]) -> Step:
@@ -310,6 +388,15 @@ class Step(Node):
 
 
 class Examples(Node):
+    __slots__ = (
+        "tags",
+        "name",
+        "description",
+        "parameters",
+        "values",
+        "number_of_entries",
+    )
+
     def __init__(
         self,
         parent: Optional[Node],
@@ -327,15 +414,19 @@ class Examples(Node):
         self.description = description
         self.parameters = parameters
         self.values = values
-        self.number_of_entries = len(values[parameters[0]])
+        # an Examples section without a table has no parameters
+        self.number_of_entries = len(values[parameters[0]]) if parameters else 0
 
     @property
-    def children(self) -> List[Tag]:
-        return self.tags
+    def children(self) -> Tuple[Tag, ...]:
+        if self._children is None:
+            self._children = tuple(self.tags)
+        return self._children  # type: ignore
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any], parent: Optional[Node]) -> Examples:
-        parameters: List[str] = [cell["value"] for cell in data["tableHeader"]["cells"]]
+        table_header = data.get("tableHeader") or {"cells": []}
+        parameters: List[str] = [cell["value"] for cell in table_header["cells"]]
         values: Dict[str, List[str]] = {param: [] for param in parameters}
         for row in data["tableBody"]:
             for param, entry in zip(parameters, row["cells"]):
@@ -355,6 +446,8 @@ class Examples(Node):
 
 
 class Tag(Node):
+    __slots__ = ("name",)
+
     def __init__(self, parent: Optional[Node], line: int, column: int, name: str):
         super().__init__(parent, line, column)
         self.name = name
@@ -372,6 +465,19 @@ class Tag(Node):
         )
 
 
+# The classes of the nodes which can be children of a node of the given class.
+CHILD_CLASSES: Dict[Type[Node], Tuple[Type[Node], ...]] = {
+    Document: (Feature,),
+    Feature: (Tag, Background, Scenario, ScenarioOutline),
+    Background: (Step,),
+    Scenario: (Tag, Step, Examples),
+    ScenarioOutline: (Tag, Step, Examples),
+    Examples: (Tag,),
+    Step: (),
+    Tag: (),
+}
+
+
 def extract_parameters(text: str) -> Tuple[str]:
     """Extract parameters from a string (e. g. a step text).
     'Parameters' are placeholders defined in the Examples section of a
@@ -1,12 +1,24 @@
 """Parser for Gherkin feature files."""
 
 from pathlib import Path
-from typing import NamedTuple, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    cast,
+)
 
-import parse
-from gherkin.dialect import DIALECTS
+from gherkin.ast_builder import AstBuilder
+from gherkin.ast_node import AstNode
 from gherkin.parser import CompositeParserException, Parser
+from gherkin.token_matcher import TokenMatcher
 
+from gherlint import utils
 from gherlint.objectmodel import nodes
 
 
@@ -14,29 +26,228 @@ class ParseResult(NamedTuple):
     document: nodes.Document
     content: str
     exception: Optional[CompositeParserException]
+    language: str  # the language detected from the content
+    declared_language: Optional[str]  # the language of the language tag, if checked
     added_language_tag: bool
     fixed_language_tag: bool
 
 
+class NodeBuilder(AstBuilder):
+    """Builds the nodes of the object model directly while parsing.
+
+    The gherkin ``AstBuilder`` builds nested dictionaries which would have to be converted
+    to nodes in a second pass, see ``Node.from_dict``. The parser builds the tree bottom up,
+    so the parent of a node is assigned once the parent is built."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.filename = ""
+        self._builders: Dict[str, Callable[[AstNode], Any]] = {
+            "Step": self._build_step,
+            "Background": self._build_background,
+            "ScenarioDefinition": self._build_scenario,
+            "ExamplesDefinition": self._build_examples,
+            "Feature": self._build_feature,
+            "GherkinDocument": self._build_document,
+        }
+
+    def transform_node(self, node: AstNode) -> Any:
+        build = self._builders.get(node.rule_type)
+        if build is None:
+            return super().transform_node(node)
+        return build(node)
+
+    def _get_position(
+        self, token: Any, column: Optional[int] = None
+    ) -> Tuple[int, int]:
+        location = token.location
+        return location["line"], column or location["column"]
+
+    def _build_tags(self, node: AstNode) -> List[nodes.Tag]:
+        tags_node = cast(Optional[AstNode], node.get_single("Tags"))
+        if not tags_node:
+            return []
+        return [
+            nodes.Tag(
+                None, *self._get_position(token, item["column"]), name=item["text"]
+            )
+            for token in cast(List[Any], tags_node.get_tokens("TagLine"))
+            for item in token.matched_items
+        ]
+
+    def _build_step(self, node: AstNode) -> nodes.Step:
+        step_line = _get_token(node, "StepLine")
+        return nodes.Step(
+            None,
+            *self._get_position(step_line),
+            keyword=step_line.matched_keyword,
+            text=step_line.matched_text,
+        )
+
+    def _build_background(self, node: AstNode) -> nodes.Background:
+        background_line = _get_token(node, "BackgroundLine")
+        line, column = self._get_position(background_line)
+        steps = cast(List[nodes.Step], node.get_items("Step"))
+        background = nodes.Background(
+            line,
+            column,
+            None,
+            name=background_line.matched_text,
+            description=self.get_description(node),
+            steps=steps,
+        )
+        _adopt(background, steps)
+        nodes.Step.infer_types(steps)
+        return background
+
+    def _build_scenario(self, node: AstNode) -> Optional[nodes.Scenario]:
+        scenario_node = cast(AstNode, node.get_single("Scenario"))
+        scenario_line = _get_token(scenario_node, "ScenarioLine")
+        scenario_type = utils.SCENARIO_KEYWORD_TO_TYPE.get(
+            scenario_line.matched_keyword
+        )
+        if scenario_type == "scenario":
+            scenario_class = nodes.Scenario
+        elif scenario_type == "scenarioOutline":
+            scenario_class = nodes.ScenarioOutline
+        else:
+            return None
+        line, column = self._get_position(scenario_line)
+        tags = self._build_tags(node)
+        steps = cast(List[nodes.Step], scenario_node.get_items("Step"))
+        examples = cast(
+            List[nodes.Examples], scenario_node.get_items("ExamplesDefinition")
+        )
+        scenario = scenario_class(
+            line,
+            column,
+            None,
+            tags=tags,
+            name=scenario_line.matched_text,
+            description=self.get_description(scenario_node),
+            examples=examples,
+            steps=steps,
+        )
+        _adopt(scenario, tags, steps, examples)
+        nodes.Step.infer_types(steps)
+        return scenario
+
+    def _build_examples(self, node: AstNode) -> nodes.Examples:
+        examples_node = cast(AstNode, node.get_single("Examples"))
+        examples_line = _get_token(examples_node, "ExamplesLine")
+        rows = cast(List[Any], examples_node.get_single("ExamplesTable", []))
+        parameters = [cell["value"] for cell in rows[0]["cells"]] if rows else []
+        values = {parameter: [] for parameter in parameters}  # type: ignore
+        for row in rows[1:]:
+            for parameter, cell in zip(parameters, row["cells"]):
+                values[parameter].append(cell["value"])
+        tags = self._build_tags(node)
+        examples = nodes.Examples(
+            None,
+            *self._get_position(examples_line),
+            tags=tags,
+            name=examples_line.matched_text,
+            description=self.get_description(examples_node),
+            parameters=parameters,
+            values=values,
+        )
+        _adopt(examples, tags)
+        return examples
+
+    def _build_feature(self, node: AstNode) -> Optional[nodes.Feature]:
+        header = cast(Optional[AstNode], node.get_single("FeatureHeader"))
+        if not header:
+            return None
+        feature_line = _get_token(header, "FeatureLine")
+        if not feature_line:
+            return None
+        line, column = self._get_position(feature_line)
+        tags = self._build_tags(header)
+        background = cast(Optional[nodes.Background], node.get_single("Background"))
+        scenarios = [
+            scenario
+            for scenario in cast(
+                List[Optional[nodes.Scenario]], node.get_items("ScenarioDefinition")
+            )
+            if scenario is not None
+        ]
+        feature = nodes.Feature(
+            line,
+            column,
+            None,
+            tags=tags,
+            language=feature_line.matched_gherkin_dialect,
+            name=feature_line.matched_text,
+            description=self.get_description(header),
+            scenarios=scenarios,  # type: ignore
+            background=background,
+        )
+        _adopt(feature, tags, (background,) if background else (), scenarios)
+        return feature
+
+    def _build_document(self, node: AstNode) -> nodes.Document:
+        feature = cast(Optional[nodes.Feature], node.get_single("Feature"))
+        document = nodes.Document(
+            line=0,
+            column=0,
+            filename=self.filename,
+            feature=feature,
+            comments=self.comments,  # type: ignore
+        )
+        if feature:
+            feature.parent = document
+        return document
+
+
+def _get_token(node: AstNode, token_type: str) -> Any:
+    # the attributes of tokens are set dynamically while matching
+    return node.get_token(token_type)
+
+
+def _adopt(parent: nodes.Node, *children: Iterable[nodes.Node]) -> None:
+    for group in children:
+        for child in group:
+            child.parent = parent
+
+
+class DialectTokenMatcher(TokenMatcher):
+    """Token matcher which keeps its dialect even if the file declares another language."""
+
+    def match_Language(self, token: Any) -> bool:
+        match = self.LANGUAGE_RE.match(token.line.get_line_text())
+        if not match:
+            return False
+        self._set_token_matched(token, "Language", match.group(1))
+        return True
+
+
 class GherkinParser:
     def __init__(self) -> None:
-        self.parser = Parser()
+        self.builder = NodeBuilder()
+        self.parser = Parser(ast_builder=self.builder)
         self.language = "en"
+        self.declared_language: Optional[str] = None
         self.content = ""
-        self.offset = 0
         self.added_language_tag = False
         self.fixed_language_tag = False
 
-    def parse(self, filepath: Path) -> ParseResult:
-        self.content = filepath.read_text("utf8")
+    def parse(self, filepath: Path, content: Optional[str] = None) -> ParseResult:
+        """Parse the file, or the ``content`` given for it, e.g. an unsaved editor buffer."""
+        self.content = filepath.read_text("utf8") if content is None else content
         self._detect_language()
+        self.declared_language = None
+        self.added_language_tag = self.fixed_language_tag = False
+        token_matcher = None
         if self.language not in ("en", "unknown"):
-            self._check_and_fix_language()
+            self._check_language()
+            # A missing or wrong language tag is reported, but the file is parsed in the
+            # language it is written in anyway.
+            token_matcher = DialectTokenMatcher(self.language)
         try:
-            data = dict(self.parser.parse(self.content))
-            data["filename"] = str(filepath)
-            data["offset"] = self.offset
-            document = nodes.Document.from_dict(data)
+            self.builder.filename = str(filepath)
+            document = cast(
+                nodes.Document, self.parser.parse(self.content, token_matcher)
+            )
             exception = None
         except CompositeParserException as exc:
             document = nodes.Document(
@@ -47,28 +258,18 @@ class GherkinParser:
             document=document,
             content=self.content,
             exception=exception,
+            language=self.language,
+            declared_language=self.declared_language,
             added_language_tag=self.added_language_tag,
             fixed_language_tag=self.fixed_language_tag,
         )
 
     def _detect_language(self) -> None:
-        if "Feature:" in self.content:
-            self.language = "en"
-        for language, keywords in DIALECTS.items():
-            if any(keyword in self.content for keyword in keywords["feature"]):
-                self.language = language
-                break
-        else:
-            self.language = "unknown"
+        self.language = utils.detect_language(self.content)
 
-    def _check_and_fix_language(self) -> None:
-        match = parse.search("# language: {:l}\n", self.content)
-        if not match:
+    def _check_language(self) -> None:
+        self.declared_language = utils.find_language_tag(self.content)
+        if self.declared_language is None:
             self.added_language_tag = True
-            self.offset += 1
-            self.content = f"# language: {self.language}\n" + self.content
-        elif match[0] != self.language:
-            self.fixed_language_tag = True
-            self.content = self.content.replace(
-                f"# language: {match[0]}", f"# language: {self.language}"
-            )
+        else:
+            self.fixed_language_tag = self.declared_language != self.language
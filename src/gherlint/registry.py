@@ -1,28 +1,216 @@
 import importlib
+from collections import defaultdict
 from pathlib import Path
-from typing import Iterable, Iterator, List, Type
+from typing import (
+    TYPE_CHECKING,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
-from gherlint.checkers.base_checker import BaseChecker
+from gherlint.checkers import manifest
+from gherlint.exceptions import PluginError
+from gherlint.reporting import Message, Reporter
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+    from gherlint.checkers.base_checker import BaseChecker
 
 CHECKER_PACKAGE = "checkers"
 CHECKER_PATH = Path(__file__).parent / CHECKER_PACKAGE
 PREFIX = "gherlint"
+PLUGIN_GROUP = "gherlint.messages"
+
+# module, name of the checker class and the IDs and names of its messages
+ManifestEntry = Tuple[str, str, List[Tuple[str, str]]]
 
 
 class CheckerRegistry(Iterable):
     def __init__(self) -> None:
-        self._checkers: List[Type[BaseChecker]] = []
+        self._checkers: List[Type["BaseChecker"]] = []
+
+    def discover(
+        self,
+        reporter: Optional[Reporter] = None,
+        plugins: bool = True,
+        reserved: Sequence[Message] = (),
+    ) -> None:
+        """Register the checkers listed in ``gherlint.checkers.manifest`` and, if ``plugins``
+        is set, those of the installed plugins (see ``get_plugin_checkers`` for ``reserved``).
 
-    def discover(self) -> None:
-        for modname in CHECKER_PATH.glob("*.py"):
+        With a ``reporter``, checkers whose messages are all disabled are left out, and their
+        modules are not even imported."""
+        for module_name, class_name, messages in manifest.CHECKERS:
+            if reporter is not None and not _has_enabled_messages(reporter, messages):
+                continue
+            self.register(_import_checker(module_name, class_name))
+        if not plugins:
+            return
+        for module_name, class_name, messages in get_plugin_checkers(reserved):
+            if reporter is not None and not _has_enabled_messages(reporter, messages):
+                continue
+            checker = _import_checker(module_name, class_name)
+            # otherwise the checker could register messages which clash with others
+            actual = sorted((message.id, message.name) for message in checker.MESSAGES)
+            if actual != messages:
+                raise PluginError(
+                    f"The messages of {module_name}:{class_name} ({_format(actual)}) do not "
+                    f"match its entry points in group {PLUGIN_GROUP} ({_format(messages)})"
+                )
+            self.register(checker)
+
+    def scan(self) -> None:
+        """Import all modules of the checker package and register their checkers."""
+        for modname in sorted(CHECKER_PATH.glob("*.py")):
             module = importlib.import_module(
                 f"{PREFIX}.{CHECKER_PACKAGE}.{modname.stem}"
             )
             if hasattr(module, "register_checker"):
                 module.register_checker(self)  # type: ignore
 
-    def register(self, checker: Type[BaseChecker]) -> None:
+    def register(self, checker: Type["BaseChecker"]) -> None:
         self._checkers.append(checker)
 
-    def __iter__(self) -> Iterator[Type[BaseChecker]]:
+    def __iter__(self) -> Iterator[Type["BaseChecker"]]:
         yield from self._checkers
+
+
+def _has_enabled_messages(reporter: Reporter, messages: List[Tuple[str, str]]) -> bool:
+    # same as BaseChecker.has_enabled_messages, but without the class
+    return not messages or any(
+        reporter.is_enabled(Message(message_id, name, ""))
+        for message_id, name in messages
+    )
+
+
+def get_plugin_checkers(reserved: Sequence[Message] = ()) -> List[ManifestEntry]:
+    """Find the checkers of installed plugins, without importing them.
+
+    Their messages must not clash with those of the built-in checkers, nor with the
+    ``reserved`` ones, i.e. the messages of the linter itself.
+
+    A plugin declares each message of its checkers as an entry point in the group
+    ``gherlint.messages``. The name of the entry point is the ID and name of the message,
+    separated by a colon, and its value refers to the checker, e.g.
+    ``"W901:no-sleep-steps" = "gherlint_house_rules.checker:HouseRulesChecker"``."""
+    # imported here, as only linting needs it
+    from importlib import metadata  # pylint: disable=import-outside-toplevel
+
+    messages: DefaultDict[Tuple[str, str], List[Tuple[str, str]]] = defaultdict(list)
+    # the checker each message ID and name belongs to, to find clashes
+    owners: Dict[str, str] = {}
+    for message in reserved:
+        owners[message.id] = owners[message.name] = "gherlint"
+    for module_name, class_name, checker_messages in manifest.CHECKERS:
+        for message_id, name in checker_messages:
+            owners[message_id] = owners[name] = f"{module_name}:{class_name}"
+    entry_points = sorted(
+        metadata.entry_points(group=PLUGIN_GROUP), key=lambda ep: (ep.value, ep.name)
+    )
+    for entry_point in entry_points:
+        message_id, name, module_name, class_name = _parse_entry_point(entry_point)
+        for key in (message_id, name):
+            owner = owners.setdefault(key, f"{module_name}:{class_name}")
+            if owner != f"{module_name}:{class_name}":
+                raise PluginError(
+                    f"{_describe(entry_point)}: '{key}' is already used by {owner}"
+                )
+        messages[(module_name, class_name)].append((message_id, name))
+    # the order of the distributions on sys.path must not change the order of the checkers
+    return [
+        (module_name, class_name, sorted(checker_messages))
+        for (module_name, class_name), checker_messages in sorted(messages.items())
+    ]
+
+
+def _parse_entry_point(entry_point: "EntryPoint") -> Tuple[str, str, str, str]:
+    """Get the message ID and name and the module and class of the checker."""
+    message_id, _, name = (part.strip() for part in entry_point.name.partition(":"))
+    module_name, _, class_name = (
+        part.strip() for part in entry_point.value.partition(":")
+    )
+    if not (message_id and name and module_name and class_name):
+        raise PluginError(
+            f"{_describe(entry_point)}, expected "
+            "'<message id>:<message name> = <module>:<checker class>'"
+        )
+    if not Message.id_pattern.match(message_id):
+        raise PluginError(
+            f"{_describe(entry_point)}: message ID must conform to {Message.id_pattern.pattern}"
+        )
+    if not Message.name_pattern.match(name):
+        raise PluginError(
+            f"{_describe(entry_point)}: message name must conform to {Message.name_pattern.pattern}"
+        )
+    return message_id, name, module_name, class_name
+
+
+def _describe(entry_point: "EntryPoint") -> str:
+    return (
+        f"Invalid entry point '{entry_point.name} = {entry_point.value}'"
+        f" in group {PLUGIN_GROUP}"
+    )
+
+
+def _format(messages: List[Tuple[str, str]]) -> str:
+    return ", ".join(f"{message_id}:{name}" for message_id, name in messages)
+
+
+def _import_checker(module_name: str, class_name: str) -> Type["BaseChecker"]:
+    try:
+        module = importlib.import_module(module_name)
+        return getattr(module, class_name)
+    except (ImportError, AttributeError) as exc:
+        raise PluginError(
+            f"Can not load checker {module_name}:{class_name}: {exc}"
+        ) from exc
+
+
+def build_manifest() -> List[ManifestEntry]:
+    """Find the checkers of the checker package, to be written to the manifest."""
+    registry = CheckerRegistry()
+    registry.scan()
+    return [
+        (
+            checker.__module__,
+            checker.__qualname__,
+            [(message.id, message.name) for message in checker.MESSAGES],
+        )
+        for checker in registry
+    ]
+
+
+def write_manifest() -> None:
+    lines = [f'"""{MANIFEST_DOCSTRING}"""', "", "CHECKERS = ["]
+    for module_name, class_name, messages in build_manifest():
+        lines += [
+            "    (",
+            f'        "{module_name}",',
+            f'        "{class_name}",',
+            "        [",
+        ]
+        lines += [
+            f'            ("{message_id}", "{name}"),' for message_id, name in messages
+        ]
+        lines += ["        ],", "    ),"]
+    lines.append("]")
+    (CHECKER_PATH / "manifest.py").write_text("\n".join(lines) + "\n", encoding="utf8")
+
+
+MANIFEST_DOCSTRING = """The checkers of gherlint along with the IDs and names of their messages.
+
+The registry uses this to find the checkers without searching for and importing all modules.
+Generated by ``python -m gherlint.registry``, which has to be run after adding a checker or
+message. A unit test makes sure that it is up to date.
+"""
+
+
+if __name__ == "__main__":
+    write_manifest()
@@ -1,12 +1,30 @@
+from __future__ import annotations
+
+import json
 import re
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Type,
+)
 
+from gherlint import get_version
 from gherlint.exceptions import DuplicateMessageError, UnknownMessageError
-from gherlint.objectmodel.nodes import Document, Node
 from gherlint.options import Field, Options
 
+if TYPE_CHECKING:
+    # not imported at runtime, so that reporting messages does not require the parser
+    from gherlint.objectmodel.nodes import Node
+
 
 @dataclass(frozen=True)
 class Message:
@@ -26,6 +44,41 @@ class Message:
             )
 
 
+@dataclass(frozen=True)
+class ReportedMessage:
+    """A message emitted for a specific location in a file.
+
+    In contrast to the node it was emitted for, it does not hold a reference to the AST
+    and can therefore be passed between processes."""
+
+    id: str
+    name: str
+    text: str  # the message text with all format arguments filled in
+    file: str
+    line: int
+    column: int
+
+    @classmethod
+    def from_node(cls, message: Message, node: Node, **format_args) -> ReportedMessage:
+        # only a Document has a filename
+        filename = getattr(node.get_root(), "filename", None)
+        if filename is None:
+            raise RuntimeError(
+                "The node passed to add_message does not have a root parent of type Document."
+                "This should never happen if gherlint is used from the command line."
+            )
+        return cls.from_location(
+            message, filename, node.line, node.column, **format_args
+        )
+
+    @classmethod
+    def from_location(
+        cls, message: Message, file: str, line: int, column: int, **format_args
+    ) -> ReportedMessage:
+        text = message.text.format(**format_args) if format_args else message.text
+        return cls(message.id, message.name, text, file, line, column)
+
+
 class MessageStore:
     id_to_message: Dict[str, Message] = {}
     name_to_message: Dict[str, Message] = {}
@@ -70,65 +123,241 @@ class ReporterOptions(Options):
     )
 
 
+class MessageHandle(NamedTuple):
+    """A message resolved by a reporter, see ``Reporter.resolve``."""
+
+    message: Message
+    enabled: bool
+
+
 class Reporter(ABC):
     """Base class for reporters."""
 
     options: ReporterOptions
 
-    def __init__(self):
-        self.options = ReporterOptions.from_config()
+    def __init__(self, output: Optional[TextIO] = None):
+        self.options = ReporterOptions.from_config()  # type: ignore
+        self.output = output if output is not None else sys.stdout
+        self.message_count = 0
+        self._disabled: FrozenSet[str] = frozenset(self.options.disable)
+        self._handles: Dict[str, MessageHandle] = {}
+
+    def resolve(self, message: Message) -> MessageHandle:
+        """Resolve a message once, so that adding it later only costs a dict lookup.
+
+        Checkers resolve their messages when they are created."""
+        handle = MessageHandle(message, self.is_enabled(message))
+        self._handles[message.id] = handle
+        self._handles[message.name] = handle
+        return handle
 
     def add_message(self, id_or_name: str, node: Node, **format_args) -> None:
         """Add a message, identified by its id or name, that shall be emitted"""
-        if Message.id_pattern.match(id_or_name):
-            message = MessageStore.get_by_id(id_or_name)
-        elif Message.name_pattern.match(id_or_name):
-            message = MessageStore.get_by_name(id_or_name)
-        else:
-            raise ValueError(
-                f"{id_or_name} matches neither the pattern for a message ID nor a message name."
-            )
-        if message.id in self.options.disable or message.name in self.options.disable:
-            # Message is disabled
+        handle = self._handles.get(id_or_name)
+        if handle is None:
+            handle = self.resolve(self._lookup(id_or_name))
+        if not handle.enabled:
             return
-        self.emit(message, node, **format_args)
+        self.message_count += 1
+        self.emit(handle.message, node, **format_args)
+
+    @staticmethod
+    def _lookup(id_or_name: str) -> Message:
+        if Message.id_pattern.match(id_or_name):
+            return MessageStore.get_by_id(id_or_name)
+        if Message.name_pattern.match(id_or_name):
+            return MessageStore.get_by_name(id_or_name)
+        raise ValueError(
+            f"{id_or_name} matches neither the pattern for a message ID nor a message name."
+        )
+
+    def is_enabled(self, message: Message) -> bool:
+        """Check if the message is not disabled in the configuration"""
+        return message.id not in self._disabled and message.name not in self._disabled
 
-    @abstractmethod
     def emit(self, message: Message, node: Node, **format_args) -> None:
         """Emit the message as it is suitable for the desired report format"""
+        self.handle_message(ReportedMessage.from_node(message, node, **format_args))
+
+    @abstractmethod
+    def handle_message(self, message: ReportedMessage) -> None:
+        """Output a message which is already resolved to its location"""
+
+    def end_file(self) -> None:
+        """Called after all messages of a file have been handled."""
+
+    def finish(self) -> None:
+        """Called once after the last file, also if linting was aborted."""
+
+
+class StreamReporter(Reporter):  # pylint: disable=abstract-method
+    """Base class for reporters which write to stdout or the given output stream.
+
+    The output for the messages of a file is collected and written at once when the file
+    is done, instead of issuing a write for each message."""
+
+    def __init__(self, output: Optional[TextIO] = None):
+        super().__init__(output)
+        self._pending: List[str] = []
+
+    def write(self, text: str) -> None:
+        self._pending.append(text)
 
+    def end_file(self) -> None:
+        self.flush()
 
-class TextReporter(Reporter):
-    """Simple text based reporter that prints to stdout"""
+    def finish(self) -> None:
+        self.flush()
+
+    def flush(self) -> None:
+        """Write the pending output and flush the output stream."""
+        if self._pending:
+            self.output.write("".join(self._pending))
+            self._pending.clear()
+        self.output.flush()
+
+
+class TextReporter(StreamReporter):
+    """Simple text based reporter for humans"""
 
     # example: missing_feature_name.feature:1:0: Feature has no name (missing-feature-name)
     MSG_TEMPLATE = "{file}:{line}:{column}: {text} ({name})"
 
-    def __init__(self):
-        super().__init__()
-        self.current_file = None
+    def __init__(self, output: Optional[TextIO] = None):
+        super().__init__(output)
+        self.current_file: Optional[str] = None
 
-    def emit(self, message: Message, node: Node, **format_args) -> None:
-        root = node.get_root()
-        if not isinstance(root, Document):
-            raise RuntimeError(
-                "The node passed to add_message does not have a root parent of type Document."
-                "This should never happen if gherlint is used from the command line."
-            )
-        file = root.filename
-        if file != self.current_file:
-            self.current_file = file
+    def handle_message(self, message: ReportedMessage) -> None:
+        if message.file != self.current_file:
+            self.current_file = message.file
             self.new_section_for_file()
-        msg_text = message.text.format(**format_args) if format_args else message.text
-        print(
+        self.write(
             self.MSG_TEMPLATE.format(
-                file=file,
-                line=node.line,
-                column=node.column,
-                text=msg_text,
+                file=message.file,
+                line=message.line,
+                column=message.column,
+                text=message.text,
                 name=message.name,
             )
+            + "\n"
         )
 
     def new_section_for_file(self):
-        print(f"************* {self.current_file}")
+        self.write(f"************* {self.current_file}\n")
+
+
+class NDJSONReporter(StreamReporter):
+    """Writes one JSON object per line and message"""
+
+    def handle_message(self, message: ReportedMessage) -> None:
+        self.write(json.dumps(asdict(message)) + "\n")
+
+
+class JSONReporter(StreamReporter):
+    """Writes a JSON array with an object for each message
+
+    The array is written piece by piece, so that the messages do not have to be kept
+    in memory until linting is done."""
+
+    def __init__(self, output: Optional[TextIO] = None):
+        super().__init__(output)
+        self._separator = "[\n"
+
+    def handle_message(self, message: ReportedMessage) -> None:
+        self.write(f"{self._separator}  {json.dumps(asdict(message))}")
+        self._separator = ",\n"
+
+    def finish(self) -> None:
+        self.write("[]\n" if self._separator == "[\n" else "\n]\n")
+        super().finish()
+
+
+class SARIFReporter(StreamReporter):
+    """Writes a report in the Static Analysis Results Interchange Format (SARIF) 2.1.0
+
+    Like the ``JSONReporter``, the results are written piece by piece. The description of
+    the tool, which includes all messages, is written at the end."""
+
+    SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+    LEVELS = {"E": "error", "W": "warning", "C": "note", "R": "note"}
+
+    def __init__(self, output: Optional[TextIO] = None):
+        super().__init__(output)
+        self._separator = f'{{"$schema": "{self.SCHEMA}", "version": "2.1.0", "runs": [{{"results": [\n'
+
+    def handle_message(self, message: ReportedMessage) -> None:
+        # messages for a whole file are reported on line 0, but SARIF counts from 1
+        region = {"startLine": max(message.line, 1)}
+        if message.column:
+            region["startColumn"] = message.column
+        result = {
+            "ruleId": message.id,
+            "level": self.LEVELS[message.id[0]],
+            "message": {"text": message.text},
+            "locations": [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": _to_uri(message.file)},
+                        "region": region,
+                    }
+                }
+            ],
+        }
+        self.write(f"{self._separator}  {json.dumps(result)}")
+        self._separator = ",\n"
+
+    def finish(self) -> None:
+        self.write(self._separator if self._separator != ",\n" else "\n")
+        rules = [
+            {
+                "id": message.id,
+                "name": message.name,
+                "shortDescription": {"text": message.text},
+            }
+            for message in sorted(
+                MessageStore.id_to_message.values(), key=lambda m: m.id
+            )
+        ]
+        tool = {
+            "driver": {
+                "name": "gherlint",
+                "version": get_version(),
+                "informationUri": "https://github.com/DudeNr33/gherlint",
+                "rules": rules,
+            }
+        }
+        self.write(f'], "tool": {json.dumps(tool)}}}]}}\n')
+        super().finish()
+
+
+def _to_uri(file: str) -> str:
+    path = Path(file)
+    return path.as_uri() if path.is_absolute() else path.as_posix()
+
+
+REPORTERS: Dict[str, Type[StreamReporter]] = {
+    "text": TextReporter,
+    "json": JSONReporter,
+    "ndjson": NDJSONReporter,
+    "sarif": SARIFReporter,
+}
+
+
+class CollectingReporter(Reporter):
+    """Reporter that keeps the messages in memory instead of printing them.
+
+    Used by the worker processes when linting in parallel."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages: List[ReportedMessage] = []
+
+    def handle_message(self, message: ReportedMessage) -> None:
+        self.messages.append(message)
+
+    def take_messages(self) -> List[ReportedMessage]:
+        """Return the messages collected so far and start over with an empty list."""
+        messages = self.messages
+        self.messages = []
+        self.message_count = 0
+        return messages
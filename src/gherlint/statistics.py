@@ -2,8 +2,8 @@ from collections import Counter
 from pathlib import Path
 from typing import Tuple
 
-from gherlint import utils
 from gherlint.checkers.base_checker import BaseChecker
+from gherlint.discovery import iter_feature_files
 from gherlint.objectmodel import nodes
 from gherlint.parser import GherkinParser
 from gherlint.reporting import TextReporter
@@ -55,7 +55,7 @@ def compute_metrics(path: Path) -> None:
     parser = GherkinParser()
     statistics = Statistics(reporter=TextReporter())
     walker = ASTWalker(checkers=[statistics])
-    for file in utils.iter_feature_files(path):
+    for file in iter_feature_files(path):
         result = parser.parse(file)
         if result.exception:
             statistics.counter.update(["Unparseable Files"])
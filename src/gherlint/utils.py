@@ -1,22 +1,8 @@
-from pathlib import Path
-from typing import Iterator, List, Union
+import re
+from typing import Dict, List, Optional
 
 from gherkin.dialect import DIALECTS
 
-from gherlint.exceptions import UnsupportedFiletype
-
-
-def iter_feature_files(path: Union[str, Path]) -> Iterator[Path]:
-    if isinstance(path, str):
-        path = Path(path)
-    if path.is_file():
-        if path.suffix == ".feature":
-            yield path
-        else:
-            raise UnsupportedFiletype(f"{path} is not a .feature file.")
-    else:
-        yield from path.rglob("*.feature")
-
 
 def get_keyword_candidates(keyword: str) -> List[str]:
     """Get a list of the possible words of the keyword in all languages."""
@@ -24,3 +10,87 @@ def get_keyword_candidates(keyword: str) -> List[str]:
     for language in DIALECTS.values():
         candidates.extend(language[keyword])  # type: ignore
     return candidates
+
+
+def _build_keyword_index(
+    *keyword_types: str, lowercase: bool = False
+) -> Dict[str, str]:
+    """Map the keywords of all languages to the type of keyword they represent.
+
+    If a keyword belongs to several types, the type which is passed first wins."""
+    index: Dict[str, str] = {}
+    for keyword_type in keyword_types:
+        for keyword in get_keyword_candidates(keyword_type):
+            index.setdefault(keyword.lower() if lowercase else keyword, keyword_type)
+    return index
+
+
+# keys are lowercase and include the trailing space, like the keywords reported by the gherkin parser
+STEP_KEYWORD_TO_TYPE = _build_keyword_index(
+    "given", "when", "then", "and", "but", lowercase=True
+)
+SCENARIO_KEYWORD_TO_TYPE = _build_keyword_index("scenario", "scenarioOutline")
+
+
+def _build_feature_keyword_index() -> Dict[str, str]:
+    index: Dict[str, str] = {}
+    for language, dialect in DIALECTS.items():
+        for keyword in dialect["feature"]:
+            # some keywords are shared by several languages, the first one wins
+            index.setdefault(keyword, language)  # type: ignore
+    return index
+
+
+FEATURE_KEYWORD_TO_LANGUAGE = _build_feature_keyword_index()
+FEATURE_LINE_PATTERN = re.compile(
+    "("
+    + "|".join(
+        re.escape(keyword)
+        for keyword in sorted(FEATURE_KEYWORD_TO_LANGUAGE, key=len, reverse=True)
+    )
+    + "):"
+)
+
+
+def is_header_line(line: str) -> bool:
+    """Check if a line belongs to the header of a feature file, which consists of empty lines,
+    comments (including the language tag) and tags."""
+    line = line.strip().lstrip("\ufeff")
+    return not line or line.startswith(("#", "@"))
+
+
+def detect_language(content: str) -> str:
+    """Detect the language of a feature file by the keyword used in its ``Feature:`` line.
+
+    Only the header of the file is inspected, i.e. everything up to the first line which is
+    neither empty, a comment nor a tag. Returns ``unknown`` if this is not a ``Feature:`` line.
+    Some keywords are shared by several languages; if the language declared in the header is
+    one of them, it is the one returned.
+    """
+    start = 0
+    while start < len(content):
+        end = content.find("\n", start)
+        if end == -1:
+            end = len(content)
+        line = content[start:end]
+        if not is_header_line(line):
+            match = FEATURE_LINE_PATTERN.match(line.strip().lstrip("\ufeff"))
+            if not match:
+                return "unknown"
+            declared_language = find_language_tag(content[:start])
+            if declared_language in DIALECTS and match[1] in (
+                DIALECTS[declared_language]["feature"]  # type: ignore
+            ):
+                return declared_language  # type: ignore
+            return FEATURE_KEYWORD_TO_LANGUAGE[match[1]]
+        start = end + 1
+    return "unknown"
+
+
+LANGUAGE_TAG_PATTERN = re.compile(r"# language: ([a-zA-Z]+)\r?\n")
+
+
+def find_language_tag(content: str) -> Optional[str]:
+    """Get the language declared with a ``# language: <lang>`` tag, if there is one."""
+    match = LANGUAGE_TAG_PATTERN.search(content)
+    return match[1] if match else None
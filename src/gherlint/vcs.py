@@ -0,0 +1,197 @@
+"""Access to the version control system, i.e. git."""
+
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from gherlint.exceptions import GherlintException
+
+
+class VCSError(GherlintException):
+    """Raised if the information could not be retrieved from git."""
+
+
+# first and last line (1-based, inclusive) of each changed part of a file
+LineRanges = List[Tuple[int, int]]
+
+HUNK_HEADER_PATTERN = re.compile(r"@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def get_toplevel(path: Path) -> Optional[str]:
+    """Get the root directory of the git repository ``path`` belongs to, or None if it does
+    not belong to one or git is not installed."""
+    directory = path if path.is_dir() else path.parent
+    try:
+        return _git(["rev-parse", "--show-toplevel"], directory).strip()
+    except VCSError:
+        return None
+
+
+def get_changed_files(revision: str, path: Path) -> Set[str]:
+    """Get the feature files below ``path`` which were added, modified or renamed since
+    ``revision``, including uncommitted changes and untracked files.
+
+    If the current branch diverged from ``revision``, the changes are taken relative to the
+    merge base, so that changes on the other branch are not included.
+    The files are returned as real, i.e. absolute and resolved, paths."""
+    directory = path if path.is_dir() else path.parent
+    toplevel = _git(["rev-parse", "--show-toplevel"], directory).strip()
+    merge_base = _git(["merge-base", revision, "HEAD"], directory).strip()
+    pathspec = os.path.realpath(path)
+    changed = _git(
+        ["diff", "--name-only", "-z", "--diff-filter=ACMR", merge_base, "--", pathspec],
+        toplevel,
+    )
+    untracked = _git(
+        ["ls-files", "--others", "--exclude-standard", "-z", "--", pathspec],
+        toplevel,
+    )
+    return {
+        os.path.realpath(os.path.join(toplevel, name))
+        for name in (changed + untracked).split("\0")
+        if name.endswith(".feature")
+    }
+
+
+def get_changed_lines(path: Path) -> Dict[str, Optional[LineRanges]]:
+    """Get the lines of the feature files below ``path`` which were changed compared to
+    ``HEAD``, i.e. the uncommitted changes as shown by ``git diff HEAD``.
+
+    Untracked files are changed as a whole, which is expressed by None instead of the ranges.
+    The files are returned as real, i.e. absolute and resolved, paths."""
+    directory = path if path.is_dir() else path.parent
+    toplevel = _git(["rev-parse", "--show-toplevel"], directory).strip()
+    pathspec = os.path.realpath(path)
+    # the prefixes are given explicitly, as they can be changed in the git configuration
+    diff = _git(
+        [
+            "diff",
+            "--no-color",
+            "--no-ext-diff",
+            "--src-prefix=a/",
+            "--dst-prefix=b/",
+            "-U0",
+            "HEAD",
+            "--",
+            pathspec,
+        ],
+        toplevel,
+    )
+    untracked = _git(
+        ["ls-files", "--others", "--exclude-standard", "-z", "--", pathspec],
+        toplevel,
+    )
+    changed: Dict[str, Optional[LineRanges]] = {}
+    changed.update(parse_diff(diff, toplevel))
+    for name in untracked.split("\0"):
+        if name.endswith(".feature"):
+            changed[os.path.realpath(os.path.join(toplevel, name))] = None
+    return changed
+
+
+def parse_diff(diff: str, base: Union[str, Path]) -> Dict[str, LineRanges]:
+    """Map the feature files changed by a unified diff to the changed lines of their new version.
+
+    The paths in the diff are relative to ``base``, with or without the ``b/`` prefix used by
+    git. Deleted files are left out. Context lines do not count as changed, so the result
+    does not depend on the number of context lines. Lines which were only removed are
+    represented by the lines right before and after the removal. The files are returned as
+    real paths."""
+    changed: Dict[str, LineRanges] = {}
+    ranges: Optional[LineRanges] = None
+    hunk: Optional[_Hunk] = None
+    for line in diff.splitlines():
+        if hunk is not None and not hunk.done:
+            hunk.feed(line)
+            if hunk.done and ranges is not None:
+                ranges.extend(hunk.ranges)
+            continue
+        if line.startswith("+++ "):
+            filepath = _get_new_filepath(line, base)
+            ranges = changed.setdefault(filepath, []) if filepath else None
+            continue
+        match = HUNK_HEADER_PATTERN.match(line)
+        if match is not None:
+            hunk = _Hunk(int(match[1] or 1), int(match[2]), int(match[3] or 1))
+    return changed
+
+
+class _Hunk:
+    """Collects the changed lines of a hunk, which is fed line by line."""
+
+    def __init__(self, old_count: int, new_start: int, new_count: int) -> None:
+        # number of lines of the old and new version still to come
+        self.remaining_old = old_count
+        self.remaining_new = new_count
+        # number of the next line of the new version; if the hunk has no lines in the new
+        # version, ``new_start`` is the line before it
+        self.new_line = new_start if new_count else new_start + 1
+        self.ranges: LineRanges = []
+        # line of the new version where the current run of removed and added lines starts
+        self._change_start: Optional[int] = None
+        self._added = False
+
+    @property
+    def done(self) -> bool:
+        return self.remaining_old <= 0 and self.remaining_new <= 0
+
+    def feed(self, line: str) -> None:
+        if line.startswith("\\"):  # "\ No newline at end of file"
+            return
+        if line.startswith("-"):
+            self.remaining_old -= 1
+            self._start_change()
+        elif line.startswith("+"):
+            self.remaining_new -= 1
+            self._start_change()
+            self._added = True
+            self.new_line += 1
+        else:
+            self.remaining_old -= 1
+            self.remaining_new -= 1
+            self._end_change()
+            self.new_line += 1
+        if self.done:
+            self._end_change()
+
+    def _start_change(self) -> None:
+        if self._change_start is None:
+            self._change_start = self.new_line
+            self._added = False
+
+    def _end_change(self) -> None:
+        if self._change_start is None:
+            return
+        if self._added:
+            self.ranges.append((self._change_start, self.new_line - 1))
+        else:
+            self.ranges.append((max(self._change_start - 1, 1), self._change_start))
+        self._change_start = None
+
+
+def _get_new_filepath(line: str, base: Union[str, Path]) -> Optional[str]:
+    """Get the real path of the feature file in a ``+++`` line, None for other files."""
+    name = line[4:].split("\t")[0]
+    if name == "/dev/null" or not name.endswith(".feature"):
+        return None
+    if name.startswith("b/"):
+        name = name[2:]
+    return os.path.realpath(os.path.join(base, name))
+
+
+def _git(args: List[str], cwd: Union[str, Path]) -> str:
+    try:
+        process = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            check=True,
+            encoding="utf8",
+        )
+    except FileNotFoundError as exc:
+        raise VCSError("git is not installed") from exc
+    except subprocess.CalledProcessError as exc:
+        raise VCSError(exc.stderr.strip() or f"git {args[0]} failed") from exc
+    return process.stdout
@@ -1,31 +1,141 @@
-from typing import List
+from typing import (
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Sequence,
+    Tuple,
+    Type,
+)
 
 from gherlint.checkers.base_checker import BaseChecker
-from gherlint.objectmodel.nodes import Node
+from gherlint.objectmodel.nodes import CHILD_CLASSES, Node
+
+Callback = Callable[[Node], None]
+
+
+class Dispatch(NamedTuple):
+    """What to do when walking a node of a specific class."""
+
+    visit_callbacks: List[Callback]
+    leave_callbacks: List[Callback]
+    descend: bool  # False if no node below can have any callbacks
 
 
 class ASTWalker:
     """
     A class which walks through the inidvidual notes of an abstract syntax tree
     representing a Gherkin feature file and calls the callbacks.
+
+    The callbacks of all checkers are looked up once per node class. With ``fuse_callbacks``,
+    the callbacks for a node class are additionally combined into a single generated function,
+    so that visiting a node costs one call regardless of the number of checkers.
+    Subtrees which can not contain any node a checker has callbacks for are skipped, and so
+    are the subtrees of the nodes passed as ``skip`` to ``walk``.
     """
 
-    def __init__(self, checkers: List[BaseChecker]) -> None:
+    def __init__(
+        self, checkers: List[BaseChecker], fuse_callbacks: bool = False
+    ) -> None:
         self.checkers = checkers
+        self.fuse_callbacks = fuse_callbacks
+        self._dispatch: Dict[Type[Node], Dispatch] = {}
+        for node_class in _get_node_classes():
+            self._get_dispatch(node_class)
 
-    def walk(self, node: Node) -> None:
-        for checker in self.checkers:
-            callback = getattr(
-                checker, f"visit_{node.__class__.__name__.lower()}", None
-            )
-            if callback:
-                callback(node)
-        children = getattr(node, "children", ())
-        for child_node in children:
-            self.walk(child_node)
-        for checker in self.checkers:
-            callback = getattr(
-                checker, f"leave_{node.__class__.__name__.lower()}", None
+    def walk(self, node: Node, skip: Collection[Node] = ()) -> None:
+        # nodes are compared by identity, as some of them are not hashable
+        skipped_ids = {id(skipped) for skipped in skip}
+        dispatch_table = self._dispatch
+        dispatch = dispatch_table.get(node.__class__) or self._get_dispatch(
+            node.__class__
+        )
+        for callback in dispatch.visit_callbacks:
+            callback(node)
+        # Explicit stack instead of recursion, with an entry for each node whose children are
+        # being walked. Nodes without children to walk, i.e. most of them, are never put on it.
+        stack: List[Tuple[Node, Dispatch, Iterator[Node]]] = [
+            (node, dispatch, iter(self._get_children(node, dispatch)))
+        ]
+        while stack:
+            parent, parent_dispatch, remaining_children = stack[-1]
+            for child in remaining_children:
+                if skipped_ids and id(child) in skipped_ids:
+                    continue
+                dispatch = dispatch_table.get(child.__class__) or self._get_dispatch(
+                    child.__class__
+                )
+                for callback in dispatch.visit_callbacks:
+                    callback(child)
+                grandchildren = (
+                    getattr(child, "children", ()) if dispatch.descend else ()
+                )
+                if grandchildren:
+                    stack.append((child, dispatch, iter(grandchildren)))
+                    break
+                for callback in dispatch.leave_callbacks:
+                    callback(child)
+            else:
+                stack.pop()
+                for callback in parent_dispatch.leave_callbacks:
+                    callback(parent)
+
+    @staticmethod
+    def _get_children(node: Node, dispatch: Dispatch) -> Sequence[Node]:
+        return getattr(node, "children", ()) if dispatch.descend else ()
+
+    def _get_dispatch(self, node_class: Type[Node]) -> Dispatch:
+        dispatch = self._dispatch.get(node_class)
+        if dispatch is None:
+            name = node_class.__name__.lower()
+            dispatch = Dispatch(
+                self._get_callbacks(f"visit_{name}"),
+                self._get_callbacks(f"leave_{name}"),
+                self._has_callbacks_below(node_class),
             )
-            if callback:
-                callback(node)
+            self._dispatch[node_class] = dispatch
+        return dispatch
+
+    def _has_callbacks_below(self, node_class: Type[Node]) -> bool:
+        child_classes = CHILD_CLASSES.get(node_class)
+        if child_classes is None:
+            # we don't know what can be below, so we have to look
+            return True
+        for child_class in child_classes:
+            dispatch = self._get_dispatch(child_class)
+            if dispatch.visit_callbacks or dispatch.leave_callbacks or dispatch.descend:
+                return True
+        return False
+
+    def _get_callbacks(self, method_name: str) -> List[Callback]:
+        callbacks = [
+            getattr(checker, method_name)
+            for checker in self.checkers
+            if hasattr(checker, method_name)
+        ]
+        if self.fuse_callbacks and len(callbacks) > 1:
+            return [_fuse(callbacks)]
+        return callbacks
+
+
+def _get_node_classes() -> List[Type[Node]]:
+    """Get all direct and indirect subclasses of ``Node``."""
+    node_classes: List[Type[Node]] = []
+    pending = Node.__subclasses__()
+    while pending:
+        node_class = pending.pop()
+        node_classes.append(node_class)
+        pending.extend(node_class.__subclasses__())
+    return node_classes
+
+
+def _fuse(callbacks: List[Callback]) -> Callback:
+    """Generate a function which calls all callbacks one after another."""
+    namespace = {
+        f"callback_{index}": callback for index, callback in enumerate(callbacks)
+    }
+    body = "".join(f"    {name}(node)\n" for name in namespace)
+    exec(f"def fused(node):\n{body}", namespace)  # pylint: disable=exec-used
+    return namespace["fused"]
@@ -0,0 +1,241 @@
+"""Notifications about changed feature files, for ``gherlint lint --watch``."""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from gherlint.discovery import IgnoreRules, is_ignored, iter_feature_files, walk
+
+# see inotify(7)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+)
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class Watcher(ABC):
+    """Base class for watching a file or directory for changes of feature files.
+
+    Iterating over a watcher blocks until something changed and then yields the paths of
+    the feature files which were modified, created or deleted. A deleted directory is
+    reported by its own path. Paths below the directory are given in the same form as by
+    ``iter_feature_files``. Changes to .gitignore files are not taken into account."""
+
+    # time to wait for further changes after the first one, as saving a file often
+    # consists of several operations
+    settle_time = 0.05
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._root = str(path)
+        self._absolute_root = os.path.abspath(path)
+
+    def __enter__(self) -> Watcher:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Set[Path]]:
+        while True:
+            changed = self.poll()
+            if changed:
+                yield changed
+
+    @abstractmethod
+    def poll(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Wait up to ``timeout`` seconds (forever if None) for changes."""
+
+    def close(self) -> None:
+        """Release the resources of the watcher."""
+
+    def _to_path(self, absolute_path: str) -> Path:
+        return Path(self._root + absolute_path[len(self._absolute_root) :])
+
+
+class PollingWatcher(Watcher):
+    """Finds changes by scanning for feature files and comparing their size and modification
+    time with the previous scan."""
+
+    def __init__(self, path: Path, interval: float = 0.5) -> None:
+        super().__init__(path)
+        self.interval = interval
+        self._signatures = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        signatures = {}
+        for filepath in iter_feature_files(self.path):
+            try:
+                stat = filepath.stat()
+            except OSError:
+                continue
+            signatures[filepath] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    def poll(self, timeout: Optional[float] = None) -> Set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            signatures = self._scan()
+            changed = {
+                filepath
+                for filepath in signatures.keys() | self._signatures.keys()
+                if signatures.get(filepath) != self._signatures.get(filepath)
+            }
+            self._signatures = signatures
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval)
+
+
+class InotifyWatcher(Watcher):
+    """Gets notified about changes by the kernel, only available on Linux.
+
+    Each directory searched for feature files is watched on its own, so directories which are
+    excluded are not watched at all. Raises ``OSError`` if inotify is not available."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # the directories being watched with the rules which apply to their entries
+        self._directories: Dict[int, Tuple[str, List[IgnoreRules]]] = {}
+        # the feature files below the directories, to know what might be gone if events are lost
+        self._known: Set[str] = set()
+        try:
+            if path.is_file():
+                # only changes to the file itself are of interest
+                self._only: Optional[str] = self._absolute_root
+                self._add_watch(os.path.dirname(self._absolute_root), [])
+            else:
+                self._only = None
+                for directory, rules, filepaths in walk(path):
+                    self._add_watch(directory, rules)
+                    self._known.update(filepaths)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, directory: str, rules: List[IgnoreRules]) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"Can not watch {directory}: {os.strerror(errno)}")
+        self._directories[wd] = (directory, rules)
+
+    def poll(self, timeout: Optional[float] = None) -> Set[Path]:
+        changed: Set[str] = set()
+        while select.select([self._fd], [], [], timeout)[0]:
+            self._read_events(os.read(self._fd, 64 * 1024), changed)
+            timeout = self.settle_time
+        return {self._to_path(path) for path in changed}
+
+    def _read_events(self, data: bytes, changed: Set[str]) -> None:
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                self._rescan(changed)
+            elif mask & IN_IGNORED:
+                self._directories.pop(wd, None)
+            elif wd in self._directories:
+                self._handle_event(wd, mask, name, changed)
+
+    def _handle_event(self, wd: int, mask: int, name: str, changed: Set[str]) -> None:
+        directory, rules = self._directories[wd]
+        path = os.path.join(directory, name)
+        if self._only is not None:
+            if path == self._only:
+                changed.add(path)
+            return
+        if not mask & IN_ISDIR:
+            if name.endswith(".feature") and not is_ignored(path, False, rules):
+                changed.add(path)
+                self._update_known(path, mask)
+        elif mask & (IN_DELETE | IN_MOVED_FROM):
+            changed.add(path)
+            self._remove_watches(path)
+        elif not is_ignored(path, True, rules):
+            # a new directory, which may already contain feature files if it was moved here
+            for subdirectory, subdirectory_rules, filepaths in walk(Path(path), rules):
+                try:
+                    self._add_watch(subdirectory, subdirectory_rules)
+                except OSError:
+                    continue
+                changed.update(filepaths)
+                self._known.update(filepaths)
+
+    def _rescan(self, changed: Set[str]) -> None:
+        """Start over after events were lost, as everything might have changed: watch the
+        directories again and report the feature files which exist now or existed before.
+        """
+        if self._only is not None:
+            changed.add(self._only)
+            return
+        for wd in self._directories:
+            self._libc.inotify_rm_watch(self._fd, wd)
+        self._directories.clear()
+        known: Set[str] = set()
+        for directory, rules, filepaths in walk(Path(self._absolute_root)):
+            try:
+                self._add_watch(directory, rules)
+            except OSError:
+                continue
+            known.update(filepaths)
+        changed.update(self._known | known)
+        self._known = known
+
+    def _update_known(self, filepath: str, mask: int) -> None:
+        if mask & (IN_DELETE | IN_MOVED_FROM):
+            self._known.discard(filepath)
+        else:
+            self._known.add(filepath)
+
+    def _remove_watches(self, directory: str) -> None:
+        """Stop watching the directory and everything below, which may have been moved away."""
+        prefix = os.path.join(directory, "")
+        self._known = {
+            filepath for filepath in self._known if not filepath.startswith(prefix)
+        }
+        for wd, (watched, _) in list(self._directories.items()):
+            if watched == directory or watched.startswith(prefix):
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._directories[wd]
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(path: Path) -> Watcher:
+    """Create an ``InotifyWatcher`` if possible, a ``PollingWatcher`` otherwise."""
+    try:
+        return InotifyWatcher(path)
+    except (OSError, AttributeError, TypeError):
+        return PollingWatcher(path)
@@ -1,5 +1,6 @@
 import pytest
 
+from gherlint.config import Config
 from gherlint.reporting import MessageStore
 
 
@@ -8,3 +9,12 @@ def clear_messagestore():
     """Clearing the message store is necessary because checker classes will be instantiated multiple times during
     testing in the same python process."""
     MessageStore().clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    """The configuration is read once and then cached, but it depends on the working directory,
+    which many tests change."""
+    Config._config = None  # pylint: disable=protected-access
+    yield
+    Config._config = None  # pylint: disable=protected-access
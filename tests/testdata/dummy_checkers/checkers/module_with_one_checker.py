@@ -1,4 +1,3 @@
-# pylint: disable=too-few-public-methods
 from gherlint.checkers.base_checker import BaseChecker
 from gherlint.registry import CheckerRegistry
 
@@ -0,0 +1,15 @@
+"""Checker of a third-party plugin, registered through fake entry points in the tests."""
+
+from gherlint.checkers.base_checker import BaseChecker
+from gherlint.objectmodel import nodes
+from gherlint.reporting import Message
+
+
+class PluginChecker(BaseChecker):
+    MESSAGES = [
+        Message("W901", "plugin-message", "Reported for each feature by the plugin"),
+        Message("W902", "other-plugin-message", "Never reported"),
+    ]
+
+    def visit_feature(self, node: nodes.Feature) -> None:
+        self.reporter.add_message("plugin-message", node)
@@ -1,8 +1,15 @@
+from unittest.mock import Mock
+
 from gherlint.checkers.base_checker import BaseChecker
-from gherlint.reporting import Message, MessageStore
+from gherlint.reporting import (
+    CollectingReporter,
+    Message,
+    MessageHandle,
+    MessageStore,
+)
 
 
-class MyChecker(BaseChecker):  # pylint: disable=too-few-public-methods
+class MyChecker(BaseChecker):
     MESSAGES = [
         Message("C001", "first-message", ""),
         Message("C002", "second-message", ""),
@@ -13,7 +20,27 @@ class MyChecker(BaseChecker):  # pylint: disable=too-few-public-methods
 class TestBaseChecker:
     @staticmethod
     def test_base_class_registers_messages():
-        checker = MyChecker(reporter=None)
+        checker = MyChecker(reporter=CollectingReporter())
         assert all(
             msg in MessageStore().id_to_message.values() for msg in checker.MESSAGES
         )
+
+    @staticmethod
+    def test_disabled_messages():
+        reporter = Mock()
+        reporter.is_enabled.side_effect = lambda msg: msg.id != "C002"
+        reporter.resolve.side_effect = lambda msg: MessageHandle(
+            msg, reporter.is_enabled(msg)
+        )
+        checker = MyChecker(reporter=reporter)
+        assert checker.is_message_enabled("C001")
+        assert checker.is_message_enabled("first-message")
+        assert not checker.is_message_enabled("C002")
+        assert not checker.is_message_enabled("second-message")
+        assert MyChecker.has_enabled_messages(reporter)
+
+    @staticmethod
+    def test_all_messages_disabled():
+        reporter = Mock()
+        reporter.is_enabled.return_value = False
+        assert not MyChecker.has_enabled_messages(reporter)
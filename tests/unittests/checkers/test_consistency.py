@@ -1,11 +1,13 @@
 """Unit tests for ConsistencyChecker"""
 
+from typing import List
 from unittest.mock import Mock
 
 import pytest
 
 from gherlint.checkers.consistency import ConsistencyChecker
 from gherlint.objectmodel import nodes
+from gherlint.reporting import ReportedMessage
 
 
 class TestConsistencyChecker:
@@ -50,9 +52,13 @@ class TestConsistencyChecker:
             tags=[],
             scenarios=[],
         )
-        self.checker.visit_feature(unique_feature)
-        self.checker.visit_feature(duplicated_feature_1)
-        self.checker.visit_feature(duplicated_feature_2)
-        self.reporter_mock.add_message.assert_called_once_with(
-            "duplicated-feature-name", duplicated_feature_2
-        )
+        self.reporter_mock.message_count = 0
+        messages: List[ReportedMessage] = []
+        for feature in (unique_feature, duplicated_feature_1, duplicated_feature_2):
+            # the linter hands over the map data after each file
+            self.checker.visit_feature(feature)
+            self.checker.reduce_map_data(self.checker.get_map_data(), messages)
+        assert [(message.name, message.line) for message in messages] == [
+            ("duplicated-feature-name", 1)
+        ]
+        self.reporter_mock.add_message.assert_not_called()
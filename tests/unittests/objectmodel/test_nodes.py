@@ -66,8 +66,7 @@ class TestFeature:
     def test_empty_feature(feature_data):
         feature = Feature.from_dict(feature_data, parent=None)
         assert isinstance(feature, Feature)
-        # pylint: disable-next=use-implicit-booleaness-not-comparison
-        assert feature.children == []
+        assert feature.children == ()
 
     @staticmethod
     def test_tagged_feature(feature_data):
@@ -122,6 +121,38 @@ class TestFeature:
         assert isinstance(feature.children[0], Scenario)
         assert isinstance(feature.children[1], ScenarioOutline)
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        "keyword, node_class",
+        [
+            ("Szenario", Scenario),
+            ("Beispiel", Scenario),
+            ("Szenariogrundriss", ScenarioOutline),
+            ("Scenario Template", ScenarioOutline),
+        ],
+    )
+    def test_scenario_type_is_recognized_independent_of_language(
+        feature_data, keyword, node_class
+    ):
+        feature_data["children"] = [
+            {
+                "scenario": {
+                    "description": "",
+                    "examples": [],
+                    "keyword": keyword,
+                    "location": {"column": 5, "line": 5},
+                    "name": "Test scenario",
+                    "steps": [],
+                    "tags": [],
+                }
+            }
+        ]
+        feature = Feature.from_dict(feature_data, parent=None)
+        scenario = feature.scenarios[0]
+        assert isinstance(scenario, node_class)
+        if node_class is Scenario:
+            assert not isinstance(scenario, ScenarioOutline)
+
 
 class TestBackground:
     @staticmethod
@@ -206,6 +237,25 @@ class TestScenario:
         assert len(scenario.children) == 3
         assert all(isinstance(child, Step) for child in scenario.children)
 
+    @staticmethod
+    def test_step_types_are_inferred_on_creation(scenario_data):
+        keywords = ["And ", "Given ", "And ", "When ", "But ", "* ", "And "]
+        scenario_data["steps"] = [
+            {"keyword": keyword, "location": {"column": 9, "line": 7}, "text": ""}
+            for keyword in keywords
+        ]
+        scenario = Scenario.from_dict(scenario_data, parent=None)
+        # pylint: disable-next=protected-access
+        assert [step._inferred_type for step in scenario.steps] == [
+            "unknown",
+            "given",
+            "given",
+            "when",
+            "when",
+            "*",
+            "*",
+        ]
+
     @staticmethod
     def test_parameter_extraction(scenario_data):
         scenario_data["name"] = "Scenario with <one> parameter"
@@ -301,6 +351,12 @@ class TestStep:
         step = Step.from_dict(example_step, parent=None)
         assert step.type == expected_type
 
+    @staticmethod
+    def test_unknown_keyword_raises_value_error(example_step):
+        example_step["keyword"] = "Foo "
+        with pytest.raises(ValueError, match="Unable to look up english step keyword"):
+            Step.from_dict(example_step, parent=None)
+
     @staticmethod
     @pytest.mark.parametrize(
         "step_text, parameters",
@@ -426,7 +482,7 @@ class TestMisc:
     @staticmethod
     def test_get_parents(example_data):
         def check_parents(node: Node, parents: List[Node]) -> None:
-            assert node.parents == parents
+            assert node.parents == tuple(parents)
             if hasattr(node, "children"):
                 parents = parents[:]
                 parents[0:0] = [node]
@@ -436,6 +492,36 @@ class TestMisc:
         current_node = Document.from_dict(example_data)
         check_parents(current_node, parents=[])
 
+    @staticmethod
+    def test_inherited_tags():
+        feature = Feature(1, 1, None, [], "en", "test", "", [])
+        feature.tags = [Tag(feature, 1, 1, "@feature")]
+        scenario = Scenario(2, 1, feature, [], "test", "", [], [])
+        scenario.tags = [Tag(scenario, 2, 1, "@scenario"), Tag(scenario, 2, 1, "@x")]
+        step = Step(scenario, 3, 1, "Given ", "test")
+        assert feature.inherited_tags == frozenset()
+        assert scenario.inherited_tags == {"@feature"}
+        assert step.inherited_tags == {"@feature", "@scenario", "@x"}
+
+    @staticmethod
+    def test_children_are_built_once(example_data):
+        document = Document.from_dict(example_data)
+        scenario = document.feature.scenarios[0]
+        first, second = scenario.children, scenario.children
+        assert isinstance(first, tuple)
+        assert first is second
+        first, second = document.feature.children, document.feature.children
+        assert first is second
+
+    @staticmethod
+    def test_nodes_have_no_instance_dict(example_data):
+        def check_node(node: Node) -> None:
+            assert not hasattr(node, "__dict__")
+            for child in getattr(node, "children", ()):
+                check_node(child)
+
+        check_node(Document.from_dict(example_data))
+
 
 class TestTags:
     @staticmethod
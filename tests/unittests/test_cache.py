@@ -0,0 +1,145 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from gherlint.cache import LintCache, ProjectIndex
+from gherlint.linter import GherkinLinter
+from gherlint.reporting import MessageStore
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path: Path, monkeypatch):
+    """The cache is created relative to the working directory."""
+    monkeypatch.chdir(tmp_path)
+
+
+class TestLintCache:
+    @staticmethod
+    def test_key_depends_on_content_path_and_context(tmp_path: Path):
+        first, second = tmp_path / "first.feature", tmp_path / "second.feature"
+        first.write_text("Feature: Foo\n", encoding="utf8")
+        second.write_text("Feature: Foo\n", encoding="utf8")
+        cache = LintCache("context")
+        key = cache.key(first)
+        assert cache.key(second) != key
+        assert LintCache("other context").key(first) != key
+        first.write_text("Feature: Bar\n", encoding="utf8")
+        assert cache.key(first) != key
+
+    @staticmethod
+    def test_roundtrip():
+        cache = LintCache("context")
+        assert "key" not in cache
+        assert cache.get("key") is None
+        cache.put("key", ["some", "result"])
+        assert "key" in cache
+        assert cache.get("key") == ["some", "result"]
+
+    @staticmethod
+    def test_unreadable_entry_is_a_miss():
+        cache = LintCache("context")
+        (cache.directory / "key").write_bytes(b"garbage")
+        assert cache.get("key") is None
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "entry",
+        [
+            b"cgherlint.cache\nNoSuchClass\n.",  # AttributeError
+            b"cno_such_module\nNoSuchClass\n.",  # ImportError
+            b"\x80\x05\x95",  # EOFError
+        ],
+    )
+    def test_stale_entry_is_a_miss(entry: bytes):
+        cache = LintCache("context")
+        (cache.directory / "key").write_bytes(entry)
+        assert cache.get("key") is None
+
+    @staticmethod
+    def test_directory_is_ignored_by_git():
+        cache = LintCache("context")
+        assert (cache.directory / ".gitignore").read_text(encoding="utf8") == "*\n"
+        cache.options.max_entries = 0
+        cache.prune()
+        assert (cache.directory / ".gitignore").exists()
+
+    @staticmethod
+    def test_prune_evicts_least_recently_used():
+        cache = LintCache("context")
+        cache.options.max_entries = 2
+        for age, key in enumerate(["new", "old", "oldest"]):
+            cache.put(key, key)
+            os.utime(cache.directory / key, (1000 - age, 1000 - age))
+        cache.get("oldest")  # marks the entry as recently used
+        cache.prune()
+        assert "oldest" in cache
+        assert "new" in cache
+        assert "old" not in cache
+
+
+class TestCachedLinting:
+    @staticmethod
+    def _lint(path: Path, capsys) -> str:
+        MessageStore.clear()
+        GherkinLinter(path).run(use_cache=True)
+        return capsys.readouterr().out
+
+    def test_unchanged_files_are_not_parsed_again(self, tmp_path: Path, capsys):
+        features = tmp_path / "features"
+        features.mkdir()
+        for index in range(3):
+            (features / f"file_{index}.feature").write_text(
+                "Feature: Duplicated\n    Scenario: Empty\n", encoding="utf8"
+            )
+        first_output = self._lint(features, capsys)
+        with patch("gherlint.linter.GherkinParser") as parser_mock:
+            second_output = self._lint(features, capsys)
+        parser_mock.assert_not_called()
+        assert "duplicated-feature-name" in first_output
+        assert second_output == first_output
+
+    def test_changed_files_are_linted(self, tmp_path: Path, capsys):
+        feature_file = tmp_path / "test.feature"
+        feature_file.write_text("Feature: Foo\n", encoding="utf8")
+        first_output = self._lint(feature_file, capsys)
+        feature_file.write_text("Feature:\n", encoding="utf8")
+        second_output = self._lint(feature_file, capsys)
+        assert "missing-feature-name" not in first_output
+        assert "missing-feature-name" in second_output
+
+
+class TestProjectIndex:
+    @staticmethod
+    def test_entries_of_other_files_are_kept(tmp_path: Path):
+        first, second = tmp_path / "first.feature", tmp_path / "second.feature"
+        first.write_text("Feature: First\n", encoding="utf8")
+        second.write_text("Feature: Second\n", encoding="utf8")
+        index = ProjectIndex("context")
+        index.put(first, ["first"])
+        index.put(second, ["second"])
+        index.save()
+        # a run on a part of the project, which refers to the file by a relative path
+        index = ProjectIndex("context")
+        index.put(Path("first.feature"), ["changed"])
+        index.save()
+        index = ProjectIndex("context")
+        assert index.get(first) == ["changed"]
+        assert index.get(second) == ["second"]
+
+    @staticmethod
+    def test_entries_of_deleted_files_are_dropped(tmp_path: Path):
+        feature_file = tmp_path / "test.feature"
+        feature_file.write_text("Feature: Foo\n", encoding="utf8")
+        index = ProjectIndex("context")
+        index.put(feature_file, ["data"])
+        feature_file.unlink()
+        index.save()
+        assert not ProjectIndex("context")._entries  # pylint: disable=protected-access
+
+    @staticmethod
+    def test_stale_index_is_empty():
+        index = ProjectIndex("context")
+        index.path.write_bytes(b"cgherlint.cache\nNoSuchClass\n.")
+        assert not ProjectIndex("context")._entries  # pylint: disable=protected-access
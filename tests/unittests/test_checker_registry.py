@@ -1,9 +1,14 @@
 import sys
+from importlib import metadata
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
 from gherlint import registry
+from gherlint.checkers import manifest
+from gherlint.exceptions import PluginError
+from gherlint.linter import GherkinLinter
 from gherlint.registry import CheckerRegistry
 
 TESTDATA = Path(__file__).parent.parent / "testdata"
@@ -14,14 +19,157 @@ class TestCheckerRegistry:
     @pytest.fixture(autouse=True, scope="class")
     def set_import_paths():
         """Make the registry load the checkers from the test directory instead."""
+        original_prefix, original_path = registry.PREFIX, registry.CHECKER_PATH
         sys.path.append(str(TESTDATA))
         registry.PREFIX = "dummy_checkers"
         registry.CHECKER_PATH = TESTDATA / "dummy_checkers" / "checkers"
         yield
         sys.path.pop()
+        registry.PREFIX, registry.CHECKER_PATH = original_prefix, original_path
 
     @staticmethod
     def test_register_checkers():
         checker_registry = CheckerRegistry()
-        checker_registry.discover()
+        checker_registry.scan()
         assert len(checker_registry._checkers) == 3  # pylint: disable=protected-access
+
+
+def test_manifest_is_up_to_date():
+    assert (
+        registry.build_manifest() == manifest.CHECKERS
+    ), "Run 'python -m gherlint.registry' to update the manifest"
+
+
+def test_discover_from_manifest():
+    checker_registry = CheckerRegistry()
+    checker_registry.discover()
+    assert [
+        (checker.__module__, checker.__qualname__) for checker in checker_registry
+    ] == [(module, name) for module, name, _ in manifest.CHECKERS]
+
+
+def test_modules_of_disabled_checkers_are_not_imported(monkeypatch):
+    imported = []
+    monkeypatch.setattr(
+        registry.importlib,
+        "import_module",
+        lambda name: imported.append(name) or sys.modules[name],
+    )
+    reporter = MagicMock()
+    reporter.is_enabled.side_effect = lambda message: message.id.startswith("R2")
+    CheckerRegistry().discover(reporter)
+    assert imported == ["gherlint.checkers.complexity"]
+
+
+class TestPlugins:
+    ENTRY_POINTS = [
+        ("W902:other-plugin-message", "dummy_checkers.plugin:PluginChecker"),
+        ("W901:plugin-message", "dummy_checkers.plugin:PluginChecker"),
+    ]
+
+    @staticmethod
+    @pytest.fixture(autouse=True)
+    def set_import_path():
+        sys.path.append(str(TESTDATA))
+        yield
+        sys.path.remove(str(TESTDATA))
+        sys.modules.pop("dummy_checkers.plugin", None)
+
+    @staticmethod
+    def install(monkeypatch, entry_points):
+        def fake_entry_points(group):
+            assert group == registry.PLUGIN_GROUP
+            return [
+                metadata.EntryPoint(name, value, group) for name, value in entry_points
+            ]
+
+        monkeypatch.setattr(metadata, "entry_points", fake_entry_points)
+
+    def test_get_plugin_checkers(self, monkeypatch):
+        self.install(monkeypatch, self.ENTRY_POINTS)
+        assert registry.get_plugin_checkers() == [
+            (
+                "dummy_checkers.plugin",
+                "PluginChecker",
+                [("W901", "plugin-message"), ("W902", "other-plugin-message")],
+            )
+        ]
+        assert "dummy_checkers.plugin" not in sys.modules
+
+    def test_discover_plugins(self, monkeypatch):
+        self.install(monkeypatch, self.ENTRY_POINTS)
+        checker_registry = CheckerRegistry()
+        checker_registry.discover()
+        checkers = list(checker_registry)
+        assert checkers[-1].__qualname__ == "PluginChecker"
+        assert checkers[:-1] == [
+            getattr(sys.modules[module], name) for module, name, _ in manifest.CHECKERS
+        ]
+
+    def test_without_plugins(self, monkeypatch):
+        self.install(monkeypatch, self.ENTRY_POINTS)
+        checker_registry = CheckerRegistry()
+        checker_registry.discover(plugins=False)
+        assert len(list(checker_registry)) == len(manifest.CHECKERS)
+
+    def test_plugin_with_disabled_messages_is_not_imported(self, monkeypatch):
+        self.install(monkeypatch, self.ENTRY_POINTS)
+        reporter = MagicMock()
+        reporter.is_enabled.side_effect = lambda message: message.id[1] != "9"
+        checker_registry = CheckerRegistry()
+        checker_registry.discover(reporter)
+        assert len(list(checker_registry)) == len(manifest.CHECKERS)
+        assert "dummy_checkers.plugin" not in sys.modules
+
+    @pytest.mark.parametrize(
+        "name, value",
+        [
+            ("W901", "dummy_checkers.plugin:PluginChecker"),
+            ("W901:plugin-message", "dummy_checkers.plugin"),
+        ],
+    )
+    def test_invalid_entry_point(self, monkeypatch, name, value):
+        self.install(monkeypatch, [(name, value)])
+        with pytest.raises(PluginError, match="Invalid entry point"):
+            registry.get_plugin_checkers()
+
+    @pytest.mark.parametrize(
+        "entry_points, error",
+        [
+            ([("X901:plugin-message", "plugin:Checker")], "message ID must conform"),
+            ([("W901:plugin_message", "plugin:Checker")], "message name must conform"),
+            ([("W301:plugin-message", "plugin:Checker")], "'W301' is already used"),
+            (
+                [("W901:duplicated-tag", "plugin:Checker")],
+                "'duplicated-tag' is already used",
+            ),
+            (
+                [("E001:unparseable-file", "plugin:Checker")],
+                "'E001' is already used by gherlint",
+            ),
+            (
+                [
+                    ("W901:plugin-message", "plugin:Checker"),
+                    ("W901:other-plugin-message", "other_plugin:Checker"),
+                ],
+                "'W901' is already used by other_plugin:Checker",
+            ),
+        ],
+    )
+    def test_invalid_message(self, monkeypatch, entry_points, error):
+        self.install(monkeypatch, entry_points)
+        with pytest.raises(PluginError, match=error):
+            registry.get_plugin_checkers(GherkinLinter.MESSAGES)
+
+    def test_messages_must_match_the_checker(self, monkeypatch):
+        self.install(monkeypatch, self.ENTRY_POINTS[1:])
+        with pytest.raises(PluginError, match="do not match its entry points"):
+            CheckerRegistry().discover()
+
+    @pytest.mark.parametrize(
+        "value", ["dummy_checkers.missing:Checker", "dummy_checkers.plugin:Missing"]
+    )
+    def test_checker_can_not_be_loaded(self, monkeypatch, value):
+        self.install(monkeypatch, [("W901:plugin-message", value)])
+        with pytest.raises(PluginError, match="Can not load checker"):
+            CheckerRegistry().discover()
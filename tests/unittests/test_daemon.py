@@ -0,0 +1,107 @@
+import socket
+import sys
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from gherlint import client
+from gherlint.daemon import LintServer
+from gherlint.exceptions import LintRequestError
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX") or sys.platform == "win32",
+    reason="requires Unix domain sockets",
+)
+
+
+@pytest.fixture(name="project")
+def fixture_project(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "features").mkdir()
+    (tmp_path / "features" / "a.feature").write_text("Feature: A\n", encoding="utf8")
+    (tmp_path / "features" / "b.feature").write_text("Feature: A\n", encoding="utf8")
+    return tmp_path
+
+
+@pytest.fixture(name="server")
+def fixture_server(project: Path) -> Iterator[LintServer]:
+    server = LintServer(project / "daemon.sock")
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+def _lint(socket_path: Path, *paths: str, content=None):
+    return [
+        (message.file, message.name)
+        for message in client.lint(paths, content=content, socket_path=socket_path)
+    ]
+
+
+EXPECTED = [
+    ("features/a.feature", "empty-feature"),
+    ("features/b.feature", "empty-feature"),
+    ("features/b.feature", "duplicated-feature-name"),
+]
+
+
+def test_lint_with_daemon(server: LintServer, monkeypatch):
+    monkeypatch.setattr(
+        "gherlint.daemon.lint_in_process",
+        lambda _: pytest.fail("should be answered by the daemon"),
+    )
+    for _ in range(2):  # the second time, the state of the first request is not reused
+        assert _lint(server.socket_path, "features") == EXPECTED
+    assert _lint(server.socket_path, "features/x.feature", content="Feature:\n") == [
+        ("features/x.feature", "missing-feature-name"),
+        ("features/x.feature", "empty-feature"),
+    ]
+
+
+def test_several_paths(server: LintServer):
+    paths = ["features/a.feature", "features/b.feature", "features"]
+    # the files are checked against each other, and each file only once
+    assert _lint(server.socket_path, *paths) == EXPECTED
+
+
+def test_lint_without_daemon(project: Path):
+    assert _lint(project / "daemon.sock", "features") == EXPECTED
+
+
+def test_error(server: LintServer, project: Path):
+    (project / "readme.md").write_text("", encoding="utf8")
+    with pytest.raises(LintRequestError, match="not a .feature file"):
+        client.lint(["readme.md"], socket_path=server.socket_path)
+
+
+def test_unexpected_error(server: LintServer, monkeypatch):
+    original_run = server.linter.run
+
+    def run(**_):
+        monkeypatch.setattr(server.linter, "run", original_run)
+        raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(server.linter, "run", run)
+    with pytest.raises(LintRequestError, match="unexpected"):
+        client.lint(["features"], socket_path=server.socket_path)
+    # the daemon is still serving
+    assert _lint(server.socket_path, "features") == EXPECTED
+
+
+def test_only_one_daemon(server: LintServer):
+    with pytest.raises(LintRequestError, match="already listening"):
+        LintServer(server.socket_path)
+
+
+def test_stale_socket_is_replaced(project: Path):
+    socket_path = project / "daemon.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(str(socket_path))
+    with LintServer(socket_path):
+        assert socket_path.exists()
+    assert not socket_path.exists()
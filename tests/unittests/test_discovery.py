@@ -0,0 +1,120 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from gherlint.config import Config
+from gherlint.discovery import compile_pattern, iter_feature_files
+from gherlint.exceptions import UnsupportedFiletype
+
+
+def make_tree(root: Path, *paths: str) -> None:
+    for path in paths:
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text("Feature: Test\n", encoding="utf8")
+
+
+def discover(root: Path) -> List[str]:
+    return [path.relative_to(root).as_posix() for path in iter_feature_files(root)]
+
+
+@pytest.mark.parametrize(
+    "pattern, path, matches",
+    [
+        ("*.feature", "a/b.feature", True),
+        ("/build", "build", True),
+        ("/build", "a/build", False),
+        ("a/build", "x/a/build", False),
+        ("docs/**/x", "docs/a/b/x", True),
+        ("docs/**/x", "docs/x", True),
+        ("**/foo", "a/foo", True),
+        ("a/**", "a/b/c", True),
+        ("a?c", "abc", True),
+        ("a?c", "a/c", False),
+        ("[!a]b", "cb", True),
+        ("[!a]b", "ab", False),
+        ("\\#file", "#file", True),
+    ],
+)
+def test_compile_pattern(pattern: str, path: str, matches: bool):
+    compiled = compile_pattern(pattern)
+    assert compiled is not None
+    assert bool(compiled.regex.match(path)) is matches
+
+
+@pytest.mark.parametrize("pattern", ["", "   ", "# comment", "/"])
+def test_compile_pattern_without_pattern(pattern: str):
+    assert compile_pattern(pattern) is None
+
+
+def test_files_are_found_in_order(tmp_path: Path):
+    make_tree(tmp_path, "b.feature", "a/z.feature", "a.feature", "a/b/c.feature")
+    (tmp_path / "readme.md").write_text("", encoding="utf8")
+    assert discover(tmp_path) == [
+        "a.feature",
+        "b.feature",
+        "a/z.feature",
+        "a/b/c.feature",
+    ]
+
+
+def test_default_excludes(tmp_path: Path):
+    make_tree(
+        tmp_path,
+        "ok.feature",
+        "node_modules/pkg/a.feature",
+        ".venv/lib/b.feature",
+        "sub/.git/c.feature",
+    )
+    assert discover(tmp_path) == ["ok.feature"]
+
+
+def test_configured_excludes(tmp_path: Path):
+    make_tree(
+        tmp_path, "ok.feature", "build/a.feature", "x/build/b.feature", "c.feature"
+    )
+    Config._config = {  # type: ignore # pylint: disable=protected-access
+        "discovery": {"extend_exclude": ["/build/", "c.feature"]}
+    }
+    assert discover(tmp_path) == ["ok.feature", "x/build/b.feature"]
+
+
+def test_gitignore(tmp_path: Path):
+    make_tree(
+        tmp_path,
+        "ok.feature",
+        "generated/a.feature",
+        "sub/tmp_1.feature",
+        "sub/tmp_keep.feature",
+        "sub/deeper/tmp_2.feature",
+    )
+    (tmp_path / ".gitignore").write_text("generated/\n", encoding="utf8")
+    (tmp_path / "sub" / ".gitignore").write_text(
+        "tmp_*\n!tmp_keep.feature\n", encoding="utf8"
+    )
+    assert discover(tmp_path) == ["ok.feature", "sub/tmp_keep.feature"]
+    Config._config = {  # type: ignore # pylint: disable=protected-access
+        "discovery": {"use_gitignore": False}
+    }
+    assert len(discover(tmp_path)) == 5
+
+
+def test_gitignore_of_parent_directories(tmp_path: Path):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".gitignore").write_text("features/generated/\n", encoding="utf8")
+    make_tree(tmp_path, "features/ok.feature", "features/generated/a.feature")
+    features = tmp_path / "features"
+    assert discover(features) == ["ok.feature"]
+
+
+def test_explicit_file_is_never_excluded(tmp_path: Path):
+    make_tree(tmp_path, "node_modules/a.feature")
+    path = tmp_path / "node_modules" / "a.feature"
+    assert list(iter_feature_files(path)) == [path]
+
+
+def test_explicit_file_must_be_feature_file(tmp_path: Path):
+    path = tmp_path / "readme.md"
+    path.write_text("", encoding="utf8")
+    with pytest.raises(UnsupportedFiletype):
+        list(iter_feature_files(path))
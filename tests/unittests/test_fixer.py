@@ -53,3 +53,41 @@ Funktionalität: Test
         original_content = target.read_bytes()
         LanguageFixer(target).run(modify=False)
         assert target.read_bytes() == original_content
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"])
+    def test_only_header_is_changed(self, tmp_path: Path, newline: str):
+        body = "".join(f"    Szenario: {index}{newline}" for index in range(1000))
+        target = tmp_path / "large.feature"
+        target.write_bytes(
+            f"# language: es{newline}@tag{newline}Funktionalität: Test{newline}{body}".encode()
+        )
+        LanguageFixer(target).run(modify=True)
+        assert target.read_bytes() == (
+            f"# language: de{newline}@tag{newline}Funktionalität: Test{newline}{body}".encode()
+        )
+        assert [path.name for path in tmp_path.iterdir()] == ["large.feature"]
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"])
+    def test_added_tag_keeps_line_endings(self, tmp_path: Path, newline: str):
+        target = tmp_path / "crlf.feature"
+        target.write_bytes(
+            f"Funktionalität: Test{newline}  Szenario: A{newline}".encode()
+        )
+        LanguageFixer(target).run(modify=True)
+        assert target.read_bytes() == (
+            f"# language: de{newline}Funktionalität: Test{newline}  Szenario: A{newline}".encode()
+        )
+
+    def test_symlink_target_is_fixed(self, testfiles):
+        target = Path(testfiles / self.MISSING_TAG)
+        link = Path(testfiles / "link.feature")
+        link.symlink_to(target)
+        LanguageFixer(link).run(modify=True)
+        assert link.is_symlink()
+        assert target.read_bytes() == Path(testfiles / self.GOOD_FILE).read_bytes()
+
+    def test_parallel(self, testfiles):
+        LanguageFixer(Path(testfiles)).run(modify=True, jobs=3)
+        good_file = Path(testfiles / self.GOOD_FILE).read_bytes()
+        for name in (self.MISSING_TAG, self.WRONG_TAG):
+            assert Path(testfiles / name).read_bytes() == good_file
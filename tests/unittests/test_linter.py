@@ -0,0 +1,199 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from gherlint.checkers.consistency import ConsistencyChecker
+from gherlint.config import Config
+from gherlint.linter import GherkinLinter
+from gherlint.reporting import MessageStore
+
+
+class TestParallelLinting:
+    @staticmethod
+    @pytest.fixture()
+    def testfiles(tmp_path: Path) -> Path:
+        """Several files with findings, two of them sharing the same feature name."""
+        for index in range(6):
+            name = "Duplicated" if index in (1, 4) else f"Feature {index}"
+            (tmp_path / f"file_{index}.feature").write_text(
+                f"""Feature: {name}
+    Scenario:
+        Given a step
+        And another step
+""",
+                encoding="utf8",
+            )
+        (tmp_path / "unparseable.feature").write_text("Foo: Bar\n", encoding="utf8")
+        return tmp_path
+
+    @staticmethod
+    def _lint(path: Path, jobs: int, capsys) -> str:
+        MessageStore.clear()
+        GherkinLinter(path).run(jobs=jobs)
+        return capsys.readouterr().out
+
+    def test_output_matches_serial_run(self, testfiles: Path, capsys) -> None:
+        serial_output = self._lint(testfiles, 1, capsys)
+        parallel_output = self._lint(testfiles, 3, capsys)
+        assert "duplicated-feature-name" in serial_output
+        assert parallel_output == serial_output
+
+
+class TestDisabledMessages:
+    @staticmethod
+    @pytest.fixture()
+    def config(tmp_path: Path):
+        messages = ", ".join(f'"{msg.id}"' for msg in ConsistencyChecker.MESSAGES)
+        config_file = tmp_path / "gherlint.toml"
+        config_file.write_text(f"[reporting]\ndisable = [{messages}]\n", "utf8")
+        Config.get_config(config_file)
+
+    @staticmethod
+    @pytest.mark.usefixtures("config")
+    def test_checker_with_all_messages_disabled_is_skipped(tmp_path: Path):
+        linter = GherkinLinter(tmp_path)
+        assert linter.checkers
+        assert not any(isinstance(c, ConsistencyChecker) for c in linter.checkers)
+
+
+class TestChangedLines:
+    @staticmethod
+    @pytest.fixture()
+    def testfile(tmp_path: Path) -> Path:
+        testfile = tmp_path / "test.feature"
+        testfile.write_text(
+            """Feature:
+
+    Scenario:
+        Given a step
+
+    @tag
+    Scenario:
+        Given a step
+
+    Scenario: Named
+        Given another step
+        When something happens
+        Then it is fine
+""",
+            encoding="utf8",
+        )
+        (tmp_path / "other.feature").write_text("Feature:\n", encoding="utf8")
+        return testfile
+
+    @staticmethod
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_only_touched_scenarios_are_checked(testfile: Path, jobs: int, capsys):
+        GherkinLinter(testfile.parent).run(
+            jobs=jobs, changed_lines={os.path.realpath(testfile): [(6, 6)]}
+        )
+        output = capsys.readouterr().out
+        lines = [line.split(": ", 1)[0] for line in output.splitlines()[1:]]
+        # the feature itself is still checked, but only the scenario starting with the tag
+        assert set(lines) == {f"{testfile}:1:1", f"{testfile}:7:5"}
+        assert "consider-using-background" not in output
+        assert "other.feature" not in output
+
+    @staticmethod
+    def test_consider_using_background_only_in_touched_scenarios(
+        tmp_path: Path, capsys
+    ):
+        testfile = tmp_path / "test.feature"
+        testfile.write_text(
+            """Feature:
+
+    Scenario: First
+        Given a step
+        Then it is fine
+
+    Scenario: Second
+        Given a step
+        Then it is fine
+
+    Scenario: Third
+        Given a step
+        Then it is fine
+""",
+            encoding="utf8",
+        )
+        GherkinLinter(tmp_path).run(
+            changed_lines={os.path.realpath(testfile): [(13, 14)]}
+        )
+        output = capsys.readouterr().out
+        lines = [
+            line.split(": ", 1)[0]
+            for line in output.splitlines()
+            if "consider-using-background" in line
+        ]
+        assert lines == [f"{testfile}:12:9"]
+
+    @staticmethod
+    def test_whole_file_changed(testfile: Path, capsys):
+        GherkinLinter(testfile.parent).run(
+            changed_lines={os.path.realpath(testfile): None}
+        )
+        output = capsys.readouterr().out
+        assert f"{testfile}:3:5" in output
+        assert "other.feature" not in output
+
+
+class TestWatch:
+    @staticmethod
+    def test_only_changes_are_reported(tmp_path: Path, capsys):
+        first = tmp_path / "a.feature"
+        second = tmp_path / "b.feature"
+        first.write_text("Feature: A\n", encoding="utf8")
+        second.write_text("Feature: B\n", encoding="utf8")
+        linter = GherkinLinter(tmp_path)
+
+        def changes():
+            capsys.readouterr()
+            second.write_text("Feature: A\n", encoding="utf8")
+            yield {second}
+            assert (
+                "b.feature:1:1: Feature name is already used" in capsys.readouterr().out
+            )
+            # the duplicate is gone, which changes the messages of the other file
+            first.write_text("Feature: C\n", encoding="utf8")
+            yield {first}
+            output = capsys.readouterr().out
+            assert "a.feature" in output
+            assert "b.feature:1:1: Feature name is already used" not in output
+            assert "b.feature" in output
+            second.unlink()
+            yield {second}
+            assert capsys.readouterr().out == ""
+
+        linter.watch(changes())
+
+    @staticmethod
+    def test_errors_do_not_end_the_session(tmp_path: Path, capsys, monkeypatch):
+        first = tmp_path / "a.feature"
+        second = tmp_path / "b.feature"
+        first.write_text("Feature: A\n", encoding="utf8")
+        second.write_text("Feature: B\n", encoding="utf8")
+        linter = GherkinLinter(tmp_path)
+        original_lint_file = linter.lint_file
+
+        def lint_file(filepath: Path, *args) -> None:
+            if "broken" in filepath.read_text(encoding="utf8"):
+                raise IndexError("list index out of range")
+            original_lint_file(filepath, *args)
+
+        monkeypatch.setattr(linter, "lint_file", lint_file)
+
+        def changes():
+            capsys.readouterr()
+            second.write_text("Feature: A\nbroken\n", encoding="utf8")
+            yield {second}
+            captured = capsys.readouterr()
+            assert f"Could not lint {second}: IndexError" in captured.err
+            assert "b.feature" not in captured.out
+            second.write_text("Feature: A\n", encoding="utf8")
+            yield {second}
+            assert (
+                "b.feature:1:1: Feature name is already used" in capsys.readouterr().out
+            )
+
+        linter.watch(changes())
@@ -7,13 +7,17 @@ Out of scope:
 End-to-end tests which actually execute any code outside ``__main__.py``
 """
 
+import os
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
 
 from gherlint.__main__ import cli
+from gherlint.exceptions import PluginError
+from gherlint.reporting import JSONReporter, SARIFReporter, TextReporter
+from gherlint.vcs import VCSError
 
 
 class TestGlobalOptions:
@@ -31,6 +35,8 @@ Options:
   -h, --help  Show this message and exit.
 
 Commands:
+  client             Lint feature files with the running daemon
+  daemon             Keep a linter running to answer gherlint client
   fix-language-tags  Add or fix language tags in feature files
   lint               Perform linting of feature files
   stats              Compute metrics over your feature files
@@ -44,22 +50,176 @@ class TestLintCommand:
     @pytest.fixture(autouse=True)
     def setup_gherkin_linter_mock(self):
         self.linter_mock = MagicMock()  # reset the mock before each test
-        with patch("gherlint.__main__.GherkinLinter") as self.linter_class_mock:
+        with patch("gherlint.linter.GherkinLinter") as self.linter_class_mock:
             self.linter_class_mock.return_value = self.linter_mock
             yield
 
     def test_lint_without_options(self):
         CliRunner().invoke(cli, ["lint", "/my/path"])
-        self.linter_class_mock.assert_called_once_with(Path("/my/path"))
+        self.linter_class_mock.assert_called_once_with(Path("/my/path"), reporter=ANY)
         self.linter_mock.run.assert_called_once()
 
+    @pytest.mark.parametrize("option", ["-j", "--jobs"])
+    def test_jobs(self, option: str):
+        CliRunner().invoke(cli, ["lint", option, "4", "/my/path"])
+        self.linter_mock.run.assert_called_once_with(
+            jobs=4, use_cache=True, changed_since=None, changed_lines=None
+        )
+
+    def test_no_cache(self):
+        CliRunner().invoke(cli, ["lint", "--no-cache", "/my/path"])
+        self.linter_mock.run.assert_called_once_with(
+            jobs=1, use_cache=False, changed_since=None, changed_lines=None
+        )
+
+    def test_changed_since(self):
+        CliRunner().invoke(cli, ["lint", "--changed-since", "origin/main", "/my/path"])
+        self.linter_mock.run.assert_called_once_with(
+            jobs=1,
+            use_cache=True,
+            changed_since="origin/main",
+            changed_lines=None,
+        )
+
+    def test_changed_since_git_error(self):
+        self.linter_mock.run.side_effect = VCSError("not a git repository")
+        result = CliRunner().invoke(
+            cli, ["lint", "--changed-since", "HEAD", "/my/path"]
+        )
+        assert result.exit_code == 1
+        assert "not a git repository" in result.output
+
+    def test_plugin_error(self):
+        self.linter_class_mock.side_effect = PluginError("Can not load checker")
+        result = CliRunner().invoke(cli, ["lint", "/my/path"])
+        assert result.exit_code == 1
+        assert "Can not load checker" in result.output
+
+    def test_diff_from_stdin(self):
+        diff = (
+            "--- a/features/a.feature\n"
+            "+++ b/features/a.feature\n"
+            "@@ -3,0 +4,2 @@\n"
+            "+  Scenario: New\n"
+            "+    Given a step\n"
+        )
+        CliRunner().invoke(cli, ["lint", "--diff", "-", "/my/path"], input=diff)
+        changed_lines = self.linter_mock.run.call_args.kwargs["changed_lines"]
+        assert list(changed_lines.values()) == [[(4, 5)]]
+        assert list(changed_lines)[0].endswith("a.feature")
+
+    def test_diff_paths_are_relative_to_repository(self, tmp_path: Path, monkeypatch):
+        diff = "+++ b/features/a.feature\n@@ -0,0 +1 @@\n+Feature: A\n"
+        (tmp_path / "features").mkdir()
+        monkeypatch.chdir(tmp_path / "features")
+        with patch("gherlint.vcs.get_toplevel", return_value=str(tmp_path)):
+            result = CliRunner().invoke(cli, ["lint", "--diff", "-", "."], input=diff)
+        changed_lines = self.linter_mock.run.call_args.kwargs["changed_lines"]
+        assert changed_lines == {
+            os.path.realpath(tmp_path / "features" / "a.feature"): [(1, 1)]
+        }
+        assert "Warning" not in result.output
+
+    def test_diff_without_linted_files(self):
+        diff = "+++ b/features/a.feature\n@@ -0,0 +1 @@\n+Feature: A\n"
+        result = CliRunner().invoke(
+            cli, ["lint", "--diff", "-", "/my/path"], input=diff
+        )
+        assert "Warning: none of the feature files in the diff is in /my/path" in (
+            result.output
+        )
+
+    def test_diff_from_git(self):
+        with patch("gherlint.vcs.get_changed_lines") as get_changed_lines_mock:
+            get_changed_lines_mock.return_value = {"/my/path/a.feature": None}
+            CliRunner().invoke(cli, ["lint", "--diff", "git", "/my/path"])
+        get_changed_lines_mock.assert_called_once_with(Path("/my/path"))
+        self.linter_mock.run.assert_called_once_with(
+            jobs=1,
+            use_cache=True,
+            changed_since=None,
+            changed_lines={"/my/path/a.feature": None},
+        )
+
+    def test_diff_and_changed_since_are_exclusive(self):
+        result = CliRunner().invoke(
+            cli, ["lint", "--diff", "git", "--changed-since", "HEAD", "/my/path"]
+        )
+        assert result.exit_code == 2
+        self.linter_mock.run.assert_not_called()
+
+    def test_watch(self):
+        with patch("gherlint.watcher.create_watcher") as create_watcher_mock:
+            CliRunner().invoke(cli, ["lint", "--watch", "-j", "2", "/my/path"])
+        create_watcher_mock.assert_called_once_with(Path("/my/path"))
+        self.linter_mock.watch.assert_called_once_with(
+            create_watcher_mock.return_value.__enter__.return_value, jobs=2
+        )
+        self.linter_mock.run.assert_not_called()
+
+    def test_watch_and_diff_are_exclusive(self):
+        result = CliRunner().invoke(cli, ["lint", "--watch", "--diff", "-", "/my/path"])
+        assert result.exit_code == 2
+        self.linter_mock.watch.assert_not_called()
+
+    @pytest.mark.parametrize("option", ["-o", "--output"])
+    def test_output(self, option: str, tmp_path: Path):
+        output = tmp_path / "report.txt"
+        CliRunner().invoke(cli, ["lint", option, str(output), "/my/path"])
+        reporter = self.linter_class_mock.call_args.kwargs["reporter"]
+        assert reporter.output.name == str(output)
+
+    @pytest.mark.parametrize("option", ["-f", "--format"])
+    @pytest.mark.parametrize(
+        "output_format, reporter_class",
+        [("text", TextReporter), ("json", JSONReporter), ("sarif", SARIFReporter)],
+    )
+    def test_format(self, option: str, output_format: str, reporter_class):
+        CliRunner().invoke(cli, ["lint", option, output_format, "/my/path"])
+        reporter = self.linter_class_mock.call_args.kwargs["reporter"]
+        assert isinstance(reporter, reporter_class)
+
+
+class TestClientCommand:
+    lint_mock: MagicMock
+
+    @pytest.fixture(autouse=True)
+    def setup_mock(self):
+        with patch("gherlint.client.lint") as self.lint_mock:
+            self.lint_mock.return_value = []
+            yield
+
+    def test_paths(self):
+        CliRunner().invoke(cli, ["client", "a.feature", "features"])
+        self.lint_mock.assert_called_once_with(
+            ("a.feature", "features"), content=None, use_cache=True, socket_path=None
+        )
+
+    def test_stdin(self):
+        CliRunner().invoke(
+            cli,
+            ["client", "--stdin-filename", "a.feature", "--socket", "/tmp/x.sock"],
+            input="Feature: A\n",
+        )
+        self.lint_mock.assert_called_once_with(
+            ("a.feature",),
+            content="Feature: A\n",
+            use_cache=True,
+            socket_path=Path("/tmp/x.sock"),
+        )
+
+    def test_nothing_to_lint(self):
+        result = CliRunner().invoke(cli, ["client"])
+        assert result.exit_code == 2
+        self.lint_mock.assert_not_called()
+
 
 class TestStatsCommand:
     compute_metrics_mock: MagicMock
 
     @pytest.fixture(autouse=True)
     def setup_mock(self):
-        with patch("gherlint.__main__.compute_metrics") as self.compute_metrics_mock:
+        with patch("gherlint.statistics.compute_metrics") as self.compute_metrics_mock:
             yield
 
     def test_stats_without_options(self):
@@ -74,15 +234,20 @@ class TestFixLanguageTagsCommand:
     @pytest.fixture(autouse=True)
     def setup_mock(self):
         self.language_fixer_mock = MagicMock()
-        with patch("gherlint.__main__.LanguageFixer") as self.language_fixer_class_mock:
+        with patch("gherlint.fixer.LanguageFixer") as self.language_fixer_class_mock:
             self.language_fixer_class_mock.return_value = self.language_fixer_mock
             yield
 
     def test_fix_without_options(self):
         CliRunner().invoke(cli, ["fix-language-tags", "/my/path"])
         self.language_fixer_class_mock.assert_called_once_with(Path("/my/path"))
-        self.language_fixer_mock.run.assert_called_once_with(modify=True)
+        self.language_fixer_mock.run.assert_called_once_with(modify=True, jobs=0)
 
     def test_dry_run(self):
         CliRunner().invoke(cli, ["fix-language-tags", "--dry-run", "/my/path"])
-        self.language_fixer_mock.run.assert_called_once_with(modify=False)
+        self.language_fixer_mock.run.assert_called_once_with(modify=False, jobs=0)
+
+    @pytest.mark.parametrize("option", ["-j", "--jobs"])
+    def test_jobs(self, option: str):
+        CliRunner().invoke(cli, ["fix-language-tags", option, "2", "/my/path"])
+        self.language_fixer_mock.run.assert_called_once_with(modify=True, jobs=2)
@@ -0,0 +1,111 @@
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import pytest
+from gherkin.parser import Parser
+
+from gherlint.fixer import fix_language_tag
+from gherlint.objectmodel.nodes import Document, Node
+from gherlint.parser import GherkinParser
+
+TESTS = Path(__file__).parent.parent
+FEATURE_FILES = sorted(TESTS.glob("functional/**/*.feature")) + sorted(
+    TESTS.glob("testdata/*.feature")
+)
+
+
+def describe(node: Node) -> List[Tuple[Any, ...]]:
+    """Describe a tree by the properties of each node, in the order it is walked."""
+    description = [
+        (
+            type(node).__name__,
+            node.line,
+            node.column,
+            node.parent and type(node.parent).__name__,
+            getattr(node, "name", None),
+            getattr(node, "text", None),
+            getattr(node, "inferred_type", None),
+            getattr(node, "values", None),
+        )
+    ]
+    for child in getattr(node, "children", ()):
+        assert child.parent is node
+        description.extend(describe(child))
+    return description
+
+
+@pytest.mark.parametrize("filepath", FEATURE_FILES, ids=lambda path: path.name)
+def test_nodes_are_the_same_as_from_dict(filepath: Path):
+    """The nodes must be the same as if the language tag was fixed and the fixed file was
+    parsed with the gherkin parser, apart from the line added for a missing tag."""
+    result = GherkinParser().parse(filepath)
+    if result.exception:
+        pytest.skip("file can not be parsed")
+    data = dict(
+        Parser().parse(
+            fix_language_tag(result.content, result.language, result.declared_language)
+            if result.added_language_tag or result.fixed_language_tag
+            else result.content
+        )
+    )
+    data["filename"] = str(filepath)
+    expected = describe(Document.from_dict(data))
+    if result.added_language_tag:
+        expected = [
+            (name, line - 1 if line else line, *rest) for name, line, *rest in expected
+        ]
+    assert describe(result.document) == expected
+
+
+def test_keyword_of_several_languages(tmp_path: Path):
+    filepath = tmp_path / "test.feature"
+    filepath.write_text(
+        "# language: es\nCaracterística: Test\n  Escenario: A\n    Dado un paso\n",
+        encoding="utf8",
+    )
+    result = GherkinParser().parse(filepath)
+    assert result.language == "es"
+    assert not result.fixed_language_tag
+    assert result.document.feature is not None
+    assert len(result.document.feature.scenarios) == 1
+
+
+def test_examples_without_table(tmp_path: Path):
+    filepath = tmp_path / "test.feature"
+    filepath.write_text(
+        "Feature: Test\n  Scenario Outline: A\n    Given <x>\n    Examples:\n",
+        encoding="utf8",
+    )
+    result = GherkinParser().parse(filepath)
+    assert result.exception is None
+    assert result.document.feature is not None
+    (examples,) = result.document.feature.scenarios[0].examples
+    assert examples.parameters == []
+    assert examples.number_of_entries == 0
+
+
+def test_nodes_have_document_as_root():
+    document = GherkinParser().parse(TESTS / "testdata" / "test.feature").document
+    assert document.feature is not None
+    assert all(child.get_root() is document for child in document.feature.children)
+
+
+@pytest.mark.parametrize(
+    "content, added, fixed",
+    [
+        ("Funktionalität: Test\n", True, False),
+        ("# language: fr\nFunktionalität: Test\n", False, True),
+    ],
+)
+def test_parse_with_detected_language(
+    tmp_path: Path, content: str, added: bool, fixed: bool
+):
+    filepath = tmp_path / "test.feature"
+    filepath.write_text(content, encoding="utf8")
+    result = GherkinParser().parse(filepath)
+    assert not result.exception
+    assert (result.added_language_tag, result.fixed_language_tag) == (added, fixed)
+    assert result.content == content
+    assert result.document.feature is not None
+    assert result.document.feature.language == "de"
+    assert result.document.feature.line == content.count("\n")
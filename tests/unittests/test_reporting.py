@@ -1,10 +1,23 @@
+import io
+import json
 import re
 import string
+from unittest.mock import Mock
 
 import pytest
 
+from gherlint.config import Config
 from gherlint.exceptions import DuplicateMessageError, UnknownMessageError
-from gherlint.reporting import Message, MessageStore
+from gherlint.reporting import (
+    CollectingReporter,
+    JSONReporter,
+    Message,
+    MessageStore,
+    NDJSONReporter,
+    ReportedMessage,
+    SARIFReporter,
+    TextReporter,
+)
 
 
 class TestMessage:
@@ -107,3 +120,119 @@ class TestMessageStore:
         msgstore1.register_message(msg)
         assert msgstore1.id_to_message == msgstore2.id_to_message
         assert msgstore1.name_to_message == msgstore2.name_to_message
+
+
+class TestReporter:  # pylint: disable=protected-access
+    @staticmethod
+    @pytest.fixture
+    def disabled_config():
+        Config._config = {"reporting": {"disable": ["test-disabled"]}}  # type: ignore
+        yield
+        Config._config = None
+
+    @staticmethod
+    @pytest.mark.usefixtures("disabled_config")
+    def test_resolve_stores_handle_under_id_and_name():
+        reporter = CollectingReporter()
+        enabled = Message("C001", "test-enabled", "")
+        disabled = Message("C002", "test-disabled", "")
+        assert reporter.resolve(enabled).enabled
+        assert not reporter.resolve(disabled).enabled
+        assert reporter._handles["C001"] is reporter._handles["test-enabled"]
+
+    @staticmethod
+    @pytest.mark.usefixtures("disabled_config")
+    def test_add_message_uses_resolved_handle(monkeypatch):
+        reporter = CollectingReporter()
+        disabled = Message("C002", "test-disabled", "")
+        MessageStore().register_message(disabled)
+        reporter.resolve(disabled)
+        lookup = Mock(side_effect=AssertionError("message looked up again"))
+        monkeypatch.setattr(reporter, "_lookup", lookup)
+        reporter.add_message("C002", node=Mock())
+        reporter.add_message("test-disabled", node=Mock())
+        assert reporter.message_count == 0
+        assert not reporter.messages
+
+    @staticmethod
+    def test_add_unresolved_message_is_looked_up_once():
+        reporter = CollectingReporter()
+        MessageStore().register_message(Message("C001", "test-enabled", ""))
+        reporter.emit = Mock()
+        reporter.add_message("test-enabled", node=Mock())
+        reporter.add_message("C001", node=Mock())
+        assert reporter.message_count == 2
+        assert "C001" in reporter._handles
+
+
+class TestTextReporter:
+    @staticmethod
+    def test_writes_lines_of_a_file_at_once():
+        output = Mock(spec=io.StringIO)
+        reporter = TextReporter(output)
+        message = Message("C001", "test-message", "Some text")
+        for line in (1, 2):
+            reporter.handle_message(
+                ReportedMessage.from_location(message, "my.feature", line, 0)
+            )
+        output.write.assert_not_called()
+        reporter.end_file()
+        output.write.assert_called_once_with(
+            "************* my.feature\n"
+            "my.feature:1:0: Some text (test-message)\n"
+            "my.feature:2:0: Some text (test-message)\n"
+        )
+        output.flush.assert_called_once()
+
+    @staticmethod
+    def test_finish_writes_pending_lines():
+        output = io.StringIO()
+        reporter = TextReporter(output)
+        message = Message("C001", "test-message", "Some text")
+        reporter.handle_message(
+            ReportedMessage.from_location(message, "my.feature", 1, 0)
+        )
+        reporter.finish()
+        assert output.getvalue().endswith("(test-message)\n")
+
+
+class TestMachineReadableReporters:
+    message = Message("W001", "test-message", "Some text")
+
+    def _report(self, reporter_class, number_of_files: int) -> str:
+        output = io.StringIO()
+        reporter = reporter_class(output)
+        for index in range(number_of_files):
+            reporter.handle_message(
+                ReportedMessage.from_location(self.message, f"{index}.feature", 1, 3)
+            )
+            reporter.end_file()
+            # nothing of a finished file is held back
+            assert output.getvalue().count("Some text") == index + 1
+        reporter.finish()
+        return output.getvalue()
+
+    @pytest.mark.parametrize("number_of_files", [0, 1, 2])
+    def test_json(self, number_of_files: int):
+        report = json.loads(self._report(JSONReporter, number_of_files))
+        assert [message["file"] for message in report] == [
+            f"{index}.feature" for index in range(number_of_files)
+        ]
+
+    def test_ndjson(self):
+        lines = self._report(NDJSONReporter, 2).splitlines()
+        assert [json.loads(line)["name"] for line in lines] == ["test-message"] * 2
+
+    @pytest.mark.parametrize("number_of_files", [0, 2])
+    def test_sarif(self, number_of_files: int):
+        MessageStore().register_message(self.message)
+        report = json.loads(self._report(SARIFReporter, number_of_files))
+        run = report["runs"][0]
+        assert len(run["results"]) == number_of_files
+        assert run["tool"]["driver"]["rules"][0]["id"] == "W001"
+        if number_of_files:
+            result = run["results"][0]
+            assert result["level"] == "warning"
+            location = result["locations"][0]["physicalLocation"]
+            assert location["artifactLocation"]["uri"] == "0.feature"
+            assert location["region"] == {"startLine": 1, "startColumn": 3}
@@ -0,0 +1,59 @@
+"""
+Make sure that the commands which don't lint do not import what is only needed for linting.
+The imports are recorded with ``python -X importtime`` in a new interpreter, see also
+``benchmarks/bench_startup.py``.
+"""
+
+import subprocess
+import sys
+from typing import Set
+
+import pytest
+
+from gherlint.__main__ import OUTPUT_FORMATS
+from gherlint.checkers import manifest
+from gherlint.reporting import REPORTERS
+
+LINTING_MODULES = {
+    "gherkin",
+    "parse",
+    "gherlint.linter",
+    "gherlint.parser",
+    "gherlint.objectmodel.nodes",
+    *(module for module, _, _ in manifest.CHECKERS),
+}
+
+
+def get_imported_modules(code: str) -> Set[str]:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        encoding="utf8",
+    )
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in process.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+def test_help():
+    imported = get_imported_modules(
+        "from gherlint.__main__ import cli; cli(['--help'], standalone_mode=False)"
+    )
+    assert "gherlint.__main__" in imported
+    assert not imported & (LINTING_MODULES | {"pydantic", "gherlint.reporting"})
+
+
+@pytest.mark.parametrize(
+    "module", ["gherlint.client", "gherlint.reporting", "gherlint.cache"]
+)
+def test_no_linting_modules(module: str):
+    imported = get_imported_modules(f"import {module}")
+    assert module in imported
+    assert not imported & LINTING_MODULES
+
+
+def test_output_formats():
+    assert OUTPUT_FORMATS == list(REPORTERS)
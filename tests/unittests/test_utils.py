@@ -0,0 +1,30 @@
+import pytest
+
+from gherlint.utils import detect_language
+
+
+class TestDetectLanguage:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "content, language",
+        [
+            ("Feature: Test\n", "en"),
+            ("Business Need: Test\n", "en"),
+            ("Funktionalität: Test\n", "de"),
+            ("# language: de\nFunktionalität: Test\n", "de"),
+            # shared by several languages, the declared one is used
+            ("Característica: Test\n", "ca"),
+            ("# language: es\nCaracterística: Test\n", "es"),
+            ("# language: pt\nCaracterística: Test\n", "pt"),
+            ("# language: de\nCaracterística: Test\n", "ca"),
+            ("\n  # comment\n@tag1 @tag2\n    Fonctionnalité: Test\n", "fr"),
+            ("﻿Feature: Test\n", "en"),
+            ("Feature: Test\n  Scenario: Funktion\n", "en"),
+            ("Feature Test\n", "unknown"),
+            ("Foo: Bar\nFeature: Test\n", "unknown"),
+            ("# only a comment", "unknown"),
+            ("", "unknown"),
+        ],
+    )
+    def test_detect_language(content: str, language: str) -> None:
+        assert detect_language(content) == language
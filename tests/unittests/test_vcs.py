@@ -0,0 +1,183 @@
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from gherlint.linter import GherkinLinter
+from gherlint.reporting import MessageStore
+from gherlint.vcs import (
+    VCSError,
+    get_changed_files,
+    get_changed_lines,
+    get_toplevel,
+    parse_diff,
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="requires git")
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@test", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture(name="repo")
+def fixture_repo(tmp_path: Path, monkeypatch) -> Path:
+    """A git repository with four committed feature files."""
+    monkeypatch.chdir(tmp_path)
+    git(tmp_path, "init", "-q")
+    features = tmp_path / "features"
+    features.mkdir()
+    for index in range(4):
+        (features / f"file_{index}.feature").write_text(
+            f"Feature: Feature {index}\n", encoding="utf8"
+        )
+    (tmp_path / "readme.md").write_text("", encoding="utf8")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+def test_get_changed_files(repo: Path):
+    features = repo / "features"
+    (features / "file_0.feature").write_text("Feature: Changed\n", encoding="utf8")
+    git(repo, "mv", "features/file_1.feature", "features/renamed.feature")
+    (features / "file_2.feature").unlink()
+    (features / "untracked.feature").write_text("Feature: New\n", encoding="utf8")
+    (repo / "readme.md").write_text("changed", encoding="utf8")
+    changed = get_changed_files("HEAD", repo)
+    assert changed == {
+        os.path.realpath(features / name)
+        for name in ("file_0.feature", "renamed.feature", "untracked.feature")
+    }
+
+
+def test_get_changed_files_since_merge_base(repo: Path):
+    git(repo, "checkout", "-q", "-b", "topic")
+    (repo / "features" / "file_0.feature").write_text("Feature: X\n", encoding="utf8")
+    git(repo, "commit", "-q", "-am", "topic")
+    git(repo, "checkout", "-q", "-")
+    (repo / "features" / "file_1.feature").write_text("Feature: Y\n", encoding="utf8")
+    git(repo, "commit", "-q", "-am", "main")
+    git(repo, "checkout", "-q", "topic")
+    assert get_changed_files("@{-1}", repo) == {
+        os.path.realpath(repo / "features" / "file_0.feature")
+    }
+
+
+def test_get_toplevel(repo: Path):
+    assert get_toplevel(repo / "features") == os.path.realpath(repo)
+
+
+def test_unknown_revision(repo: Path):
+    with pytest.raises(VCSError):
+        get_changed_files("does-not-exist", repo)
+
+
+def test_get_changed_lines(repo: Path):
+    features = repo / "features"
+    (features / "file_0.feature").write_text(
+        "Feature: Feature 0\n  Scenario: A\n", encoding="utf8"
+    )
+    (features / "untracked.feature").write_text("Feature: New\n", encoding="utf8")
+    assert get_changed_lines(repo) == {
+        os.path.realpath(features / "file_0.feature"): [(2, 2)],
+        os.path.realpath(features / "untracked.feature"): None,
+    }
+
+
+@pytest.mark.parametrize("option", ["diff.noprefix", "diff.mnemonicPrefix"])
+def test_get_changed_lines_ignores_prefix_configuration(repo: Path, option: str):
+    git(repo, "config", option, "true")
+    (repo / "b").mkdir()
+    (repo / "b" / "file.feature").write_text("Feature: B\n", encoding="utf8")
+    git(repo, "add", "b")
+    git(repo, "commit", "-q", "-m", "b")
+    (repo / "b" / "file.feature").write_text("Feature: Changed\n", encoding="utf8")
+    assert get_changed_lines(repo) == {
+        os.path.realpath(repo / "b" / "file.feature"): [(1, 1)]
+    }
+
+
+def test_lint_changed_files(repo: Path, capsys):
+    features = repo / "features"
+    MessageStore.clear()
+    GherkinLinter(features).run(use_cache=True)  # fills the project index
+    capsys.readouterr()
+    (features / "file_3.feature").write_text("Feature: Feature 0\n", encoding="utf8")
+    (features / "untracked.feature").write_text("Feature:\n", encoding="utf8")
+    MessageStore.clear()
+    linter = GherkinLinter(features)
+    parsed = []
+    original_lint_file = linter.lint_file
+
+    def lint_file(filepath: Path, *args) -> None:
+        parsed.append(filepath.name)
+        original_lint_file(filepath, *args)
+
+    linter.lint_file = lint_file  # type: ignore
+    linter.run(use_cache=True, changed_since="HEAD")
+    output = capsys.readouterr().out
+    assert sorted(parsed) == ["file_3.feature", "untracked.feature"]
+    # the name of the changed file is compared with the unchanged ones from the index
+    assert "file_3.feature:1:1: Feature name is already used" in output
+    assert "untracked.feature:1:1: Feature has no name" in output
+    assert "file_0.feature" not in output
+
+
+DIFF = """\
+diff --git a/features/a.feature b/features/a.feature
+--- a/features/a.feature
++++ b/features/a.feature
+@@ -2,2 +2,3 @@ Feature: A
+   Scenario: One
+-    Given a step
++    Given another step
++++ looks like a header, but is an added line
+@@ -10 +11,0 @@
+-    Then it is gone
+diff --git a/features/deleted.feature b/features/deleted.feature
+--- a/features/deleted.feature
++++ /dev/null
+@@ -1 +0,0 @@
+-Feature: Deleted
+diff --git a/readme.md b/readme.md
+--- a/readme.md
++++ b/readme.md
+@@ -1 +1 @@
+-old
++new
+"""
+
+
+def test_parse_diff(tmp_path: Path):
+    assert parse_diff(DIFF, tmp_path) == {
+        os.path.realpath(tmp_path / "features" / "a.feature"): [(3, 4), (11, 12)]
+    }
+
+
+def test_parse_diff_ignores_context_lines(repo: Path):
+    feature = repo / "features" / "file_0.feature"
+    lines = ["Feature: Feature 0"] + [f"  # comment {index}" for index in range(20)]
+    feature.write_text("\n".join(lines) + "\n", encoding="utf8")
+    git(repo, "commit", "-q", "-am", "comments")
+    lines[5] = "  # changed"
+    del lines[10]
+    lines.insert(15, "  # added")
+    feature.write_text("\n".join(lines) + "\n", encoding="utf8")
+    diff = subprocess.run(
+        ["git", "diff", "-U3", "HEAD"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        encoding="utf8",
+    ).stdout
+    expected = [(6, 6), (10, 11), (16, 16)]
+    assert parse_diff(diff, repo) == {os.path.realpath(feature): expected}
+    assert get_changed_lines(repo) == {os.path.realpath(feature): expected}
@@ -0,0 +1,87 @@
+from typing import List
+
+import pytest
+
+from gherlint.checkers.base_checker import BaseChecker
+from gherlint.objectmodel import nodes
+from gherlint.reporting import CollectingReporter
+from gherlint.walker import ASTWalker
+
+
+class RecordingChecker(BaseChecker):
+    def __init__(self, name: str, calls: List[str]) -> None:
+        super().__init__(reporter=CollectingReporter())
+        self.name = name
+        self.calls = calls
+
+    def visit_feature(self, _: nodes.Feature) -> None:
+        self.calls.append(f"{self.name}: visit_feature")
+
+    def leave_feature(self, _: nodes.Feature) -> None:
+        self.calls.append(f"{self.name}: leave_feature")
+
+    def visit_step(self, node: nodes.Step) -> None:
+        self.calls.append(f"{self.name}: visit_step {node.text}")
+
+
+@pytest.fixture(name="document")
+def fixture_document() -> nodes.Document:
+    document = nodes.Document(0, 0, "test.feature", None, [])
+    feature = nodes.Feature(1, 1, document, [], "en", "test", "", [])
+    scenario = nodes.Scenario(2, 1, feature, [], "test", "", [], [])
+    scenario.steps = [
+        nodes.Step(scenario, 3, 1, "Given ", "first"),
+        nodes.Step(scenario, 4, 1, "When ", "second"),
+    ]
+    feature.scenarios = [scenario]
+    document.feature = feature
+    return document
+
+
+@pytest.mark.parametrize("fuse_callbacks", [False, True])
+def test_callbacks_are_called_in_order(
+    document: nodes.Document, fuse_callbacks: bool
+) -> None:
+    calls: List[str] = []
+    checkers = [RecordingChecker("a", calls), RecordingChecker("b", calls)]
+    ASTWalker(checkers, fuse_callbacks=fuse_callbacks).walk(document)  # type: ignore
+    assert calls == [
+        "a: visit_feature",
+        "b: visit_feature",
+        "a: visit_step first",
+        "b: visit_step first",
+        "a: visit_step second",
+        "b: visit_step second",
+        "a: leave_feature",
+        "b: leave_feature",
+    ]
+
+
+class FeatureOnlyChecker(BaseChecker):
+    def __init__(self) -> None:
+        super().__init__(reporter=CollectingReporter())
+        self.visited: List[nodes.Feature] = []
+
+    def visit_feature(self, node: nodes.Feature) -> None:
+        self.visited.append(node)
+
+
+def test_subtrees_without_callbacks_are_skipped(
+    document: nodes.Document, monkeypatch
+) -> None:
+    monkeypatch.setattr(
+        nodes.Scenario,
+        "children",
+        property(lambda _: pytest.fail("Scenario should not be descended into")),
+    )
+    checker = FeatureOnlyChecker()
+    ASTWalker([checker]).walk(document)
+    assert checker.visited == [document.feature]
+
+
+def test_skipped_subtrees_are_not_walked(document: nodes.Document) -> None:
+    calls: List[str] = []
+    ASTWalker([RecordingChecker("a", calls)]).walk(  # type: ignore
+        document, skip=document.feature.scenarios  # type: ignore
+    )
+    assert calls == ["a: visit_feature", "a: leave_feature"]
@@ -0,0 +1,87 @@
+import os
+import select
+import sys
+from pathlib import Path
+from typing import Set
+
+import pytest
+
+from gherlint.watcher import (
+    EVENT_HEADER,
+    IN_Q_OVERFLOW,
+    InotifyWatcher,
+    PollingWatcher,
+    Watcher,
+    create_watcher,
+)
+
+
+@pytest.fixture(name="tree")
+def fixture_tree(tmp_path: Path) -> Path:
+    (tmp_path / "features").mkdir()
+    (tmp_path / "features" / "a.feature").write_text("Feature: A\n", encoding="utf8")
+    (tmp_path / "node_modules").mkdir()
+    return tmp_path
+
+
+WATCHERS = [
+    PollingWatcher,
+    pytest.param(
+        InotifyWatcher,
+        marks=pytest.mark.skipif(
+            not sys.platform.startswith("linux"), reason="requires inotify"
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize("watcher_class", WATCHERS)
+def test_changes_are_reported(tree: Path, watcher_class):
+    with watcher_class(tree) as watcher:
+        assert not watcher.poll(timeout=0)
+        (tree / "features" / "a.feature").write_text("Feature: Changed\n", "utf8")
+        (tree / "node_modules" / "ignored.feature").write_text("Feature:\n", "utf8")
+        assert watcher.poll(timeout=2) == {tree / "features" / "a.feature"}
+        (tree / "features" / "new").mkdir()
+        (tree / "features" / "new" / "b.feature").write_text("Feature: B\n", "utf8")
+        assert watcher.poll(timeout=2) == {tree / "features" / "new" / "b.feature"}
+        (tree / "features" / "a.feature").unlink()
+        assert watcher.poll(timeout=2) == {tree / "features" / "a.feature"}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="requires inotify")
+def test_new_directories_are_watched(tree: Path):
+    with InotifyWatcher(tree) as watcher:
+        (tree / "features" / "new").mkdir()
+        assert not watcher.poll(timeout=0.5)
+        (tree / "features" / "new" / "b.feature").write_text("Feature: B\n", "utf8")
+        assert watcher.poll(timeout=2) == {tree / "features" / "new" / "b.feature"}
+        (tree / "features" / "new" / "b.feature").unlink()
+        (tree / "features" / "new").rmdir()
+        assert tree / "features" / "new" in watcher.poll(timeout=2)
+
+
+def test_create_watcher(tree: Path):
+    with create_watcher(tree) as watcher:
+        assert isinstance(watcher, Watcher)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="requires inotify")
+def test_lost_events(tree: Path):
+    # pylint: disable=protected-access
+    with InotifyWatcher(tree) as watcher:
+        (tree / "features" / "a.feature").unlink()
+        (tree / "features" / "new").mkdir()
+        (tree / "features" / "new" / "b.feature").write_text("Feature: B\n", "utf8")
+        # drop the events, as if the queue overflowed
+        while select.select([watcher._fd], [], [], 0.1)[0]:
+            os.read(watcher._fd, 64 * 1024)
+        changed: Set[str] = set()
+        watcher._read_events(EVENT_HEADER.pack(-1, IN_Q_OVERFLOW, 0, 0), changed)
+        assert changed == {
+            str(tree / "features" / "a.feature"),
+            str(tree / "features" / "new" / "b.feature"),
+        }
+        # the new directory is watched as well
+        (tree / "features" / "new" / "c.feature").write_text("Feature: C\n", "utf8")
+        assert watcher.poll(timeout=2) == {tree / "features" / "new" / "c.feature"}